@@ -1,13 +1,77 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, File, HTTPException, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from pymongo import MongoClient
-from pydantic import BaseModel
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DeleteOne, ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, CollectionInvalid, DuplicateKeyError, OperationFailure, PyMongoError
+from pymongo.results import DeleteResult, UpdateResult
+from bson import ObjectId
+from bson.errors import InvalidId
+from pydantic import BaseModel, ValidationError
 from typing import Optional, List
 from datetime import datetime, date, timedelta
+import asyncio
+import base64
+import csv
+import functools
+import gzip
+import hashlib
+import io
+import itertools
+import json
 import os
+import re
+import time
 import uuid
+import zlib
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import numpy as np
+
+try:
+    import brotli
+except ImportError:  # optional: responses are gzip-compressed only
+    brotli = None
+
+try:
+    import orjson
+except ImportError:  # optional: fast_json_response falls back to the stdlib encoder
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Conditional GET: endpoints tagged with @conditional_get answer If-None-Match from
+# the write versions of their source collections, before the handler runs
+class ConditionalGetRoute(APIRoute):
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        sources = getattr(self.endpoint, "etag_sources", None)
+        if sources is None:
+            return handler
+        
+        async def conditional_handler(request):
+            if request.method != "GET":
+                return await handler(request)
+            try:
+                etag = await compute_etag(request, *sources)
+            except PyMongoError:
+                return await handler(request)
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+            response = await handler(request)
+            if response.status_code == 200:
+                response.headers["ETag"] = etag
+                response.headers["Cache-Control"] = "no-cache"
+            return response
+        return conditional_handler
 
 app = FastAPI()
+app.router.route_class = ConditionalGetRoute
 
 # CORS middleware
 app.add_middleware(
@@ -18,10 +82,106 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# MongoDB connection
+# Response compression
+COMPRESSION_MINIMUM_SIZE = int(os.environ.get('COMPRESSION_MINIMUM_SIZE', '1024'))
+
+def negotiate_encoding(accept_encoding):
+    """Preferred content coding the client accepts: br (when brotli is installed), then gzip"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ("br", "gzip"):
+        if accepted.get(encoding, 0) > 0 and (encoding != "br" or brotli is not None):
+            return encoding
+    return None
+
+class CompressionMiddleware:
+    """Compress complete response bodies of at least minimum_size bytes.
+    
+    Streamed responses (notification stream, exports) and bodies that already
+    carry a Content-Encoding pass through untouched. Every other response,
+    compressed or not (too small, 304, client without gzip/br), gets
+    Vary: Accept-Encoding so shared caches keep the representations apart. A
+    compressed response's ETag gets an encoding suffix so it differs from the
+    identity representation.
+    """
+    
+    def __init__(self, app, minimum_size):
+        self.app = app
+        self.minimum_size = minimum_size
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start = None
+        
+        async def send_compressed(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if start is None:
+                await send(message)
+                return
+            
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            if message.get("more_body") or "content-encoding" in headers:
+                await send(start)
+                start = None
+                await send(message)
+                return
+            
+            headers.add_vary_header("Accept-Encoding")
+            if not encoding or len(body) < self.minimum_size:
+                await send(start)
+                start = None
+                await send(message)
+                return
+            
+            if encoding == "br":
+                body = brotli.compress(body, quality=4)
+            else:
+                body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            if headers.get("etag", "").endswith('"'):
+                headers["ETag"] = f'{headers["etag"][:-1]}-{encoding}"'
+            await send(start)
+            start = None
+            await send({**message, "body": body})
+        
+        await self.app(scope, receive, send_compressed)
+
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MINIMUM_SIZE)
+
+# MongoDB connection (async Motor client, pool tunable via environment)
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/')
-client = MongoClient(MONGO_URL)
-db = client.parrot_breeding_db
+client = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '100')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '5')),
+    maxIdleTimeMS=int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', '60000')),
+    waitQueueTimeoutMS=int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '10000')),
+    serverSelectionTimeoutMS=int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000')),
+    connectTimeoutMS=int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', '10000')),
+    socketTimeoutMS=int(os.environ.get('MONGO_SOCKET_TIMEOUT_MS', '30000')),
+    readPreference=os.environ.get('MONGO_READ_PREFERENCE', 'primary'),
+)
+db = client[os.environ.get('MONGO_DB_NAME', 'parrot_breeding_db')]
+
+@app.on_event("shutdown")
+async def close_mongo_client():
+    client.close()
 
 # Collections
 birds_collection = db.birds
@@ -37,6 +197,186 @@ incubation_logs_collection = db.incubation_logs
 species_collection = db.species
 daily_monitoring_collection = db.daily_monitoring
 permits_collection = db.wildlife_permits
+dashboard_stats_collection = db.dashboard_stats
+counters_collection = db.counters
+collection_versions_collection = db.collection_versions
+response_cache_collection = db.response_cache
+monitoring_readings_collection = db.monitoring_readings
+telemetry_rollups_collection = db.telemetry_rollups
+financial_rollups_collection = db.financial_rollups
+exchange_rates_collection = db.exchange_rates
+profitability_collection = db.profitability_ledger
+rebuild_leases_collection = db.rebuild_leases
+
+async def create_timeseries_collections():
+    """Create monitoring_readings as a time-series collection where the server supports it.
+    
+    meta holds only the series identity (incubator_id, source) so readings of an
+    incubator share buckets; per-reading fields such as source_id stay top-level.
+    Replacing derived readings deletes by source_id, which time-series
+    collections only allow from MongoDB 7.0.
+    """
+    name = monitoring_readings_collection.name
+    try:
+        existing = await (await db.list_collections(filter={"name": name})).to_list(None)
+        supported = (await client.server_info()).get("versionArray", [0]) >= [7]
+        if existing:
+            if supported and existing[0].get("type") != "timeseries":
+                logger.warning(
+                    "%s exists without time-series options; readings are stored unbucketed until it is migrated", name
+                )
+            return
+        if not supported:
+            # Older servers: a regular collection is created on first insert and indexed the same way
+            return
+        await db.create_collection(
+            name,
+            # Probe telemetry arrives about once a minute
+            timeseries={"timeField": "timestamp", "metaField": "meta", "granularity": "minutes"}
+        )
+    except CollectionInvalid:
+        # Created by another worker starting at the same time
+        pass
+    except PyMongoError:
+        logger.warning("Could not create the %s time-series collection", name, exc_info=True)
+
+# Text search fields and relevance weights per /api/search result type (one text index per collection)
+SEARCH_WEIGHTS = {
+    "birds": {"ring_number": 10, "species": 5, "color_mutation": 5, "notes": 1},
+    "pairs": {"pair_name": 5, "notes": 1},
+    "clutches": {"status": 5, "notes": 1},
+}
+
+def text_index_keys(weights):
+    return [(field, "text") for field in weights]
+
+# Index definitions: collection -> [(keys, options)] covering the lookups and filters the endpoints use
+INDEX_SPECS = {
+    birds_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("status", 1)], {}),
+        ([("species", 1), ("gender", 1)], {}),
+        ([("license_expiry", 1)], {"sparse": True}),
+        ([("ring_number", 1)], {}),
+        (text_index_keys(SEARCH_WEIGHTS["birds"]), {"weights": SEARCH_WEIGHTS["birds"]}),
+    ],
+    breeding_pairs_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("status", 1)], {}),
+        ([("male_bird_id", 1)], {}),
+        ([("female_bird_id", 1)], {}),
+        ([("license_expiry", 1)], {"sparse": True}),
+        ([("pair_name", 1)], {}),
+        (text_index_keys(SEARCH_WEIGHTS["pairs"]), {"weights": SEARCH_WEIGHTS["pairs"]}),
+    ],
+    breeding_records_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("breeding_pair_id", 1)], {}),
+    ],
+    clutches_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("breeding_pair_id", 1)], {}),
+        ([("status", 1), ("expected_hatch_date", 1)], {}),
+        ([("created_at", -1)], {}),
+        (text_index_keys(SEARCH_WEIGHTS["clutches"]), {"weights": SEARCH_WEIGHTS["clutches"]}),
+    ],
+    chicks_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("clutch_id", 1)], {}),
+        ([("status", 1)], {}),
+    ],
+    transactions_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("transaction_type", 1), ("date", 1)], {}),
+        ([("date", 1)], {}),
+    ],
+    financial_rollups_collection: [
+        ([("month", 1)], {}),
+    ],
+    exchange_rates_collection: [
+        ([("id", 1)], {"unique": True}),
+    ],
+    profitability_collection: [
+        ([("entity_type", 1), ("net", -1)], {}),
+    ],
+    license_collection: [
+        ([("id", 1)], {"unique": True}),
+    ],
+    incubators_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("status", 1)], {}),
+    ],
+    artificial_incubation_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("clutch_id", 1)], {}),
+        ([("incubator_id", 1), ("status", 1)], {}),
+        ([("status", 1), ("expected_hatch_date", 1)], {}),
+    ],
+    incubation_logs_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("artificial_incubation_id", 1), ("log_date", 1)], {}),
+    ],
+    species_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("name", 1)], {}),
+    ],
+    daily_monitoring_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("incubator_id", 1), ("date", -1), ("_id", 1)], {}),
+        ([("date", -1), ("_id", 1)], {}),
+    ],
+    response_cache_collection: [
+        ([("expires_at", 1)], {"expireAfterSeconds": 0}),
+    ],
+    monitoring_readings_collection: [
+        ([("meta.incubator_id", 1), ("timestamp", 1)], {}),
+        ([("source_id", 1)], {}),
+    ],
+    permits_collection: [
+        ([("id", 1)], {"unique": True}),
+        ([("permit_number", -1), ("_id", 1)], {}),
+        ([("permit_number", 1)], {"unique": True, "partialFilterExpression": {"permit_number": {"$type": "string"}}}),
+        ([("status", 1), ("purchase_date", 1)], {}),
+        ([("purchase_date", 1)], {}),
+        ([("customer_name", 1)], {}),
+    ],
+}
+
+# Build status per "collection.index_name", reported by /api/admin/indexes
+index_status = {}
+
+async def ensure_indexes():
+    """Create every declared index; existing identical indexes are left untouched"""
+    for collection, specs in INDEX_SPECS.items():
+        for keys, options in specs:
+            index_name = "_".join(f"{field}_{direction}" for field, direction in keys)
+            status_key = f"{collection.name}.{index_name}"
+            index_status[status_key] = {"state": "building", "keys": dict(keys), **options}
+            try:
+                await collection.create_index(keys, name=index_name, **options)
+                index_status[status_key]["state"] = "ready"
+            except PyMongoError as e:
+                index_status[status_key].update({"state": "failed", "error": str(e)})
+
+# Fire-and-forget tasks are kept referenced until done; the event loop only holds weak references
+background_tasks = set()
+
+def run_in_background(coro):
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+@app.on_event("startup")
+async def create_timeseries_collections_on_startup():
+    # Awaited, and registered before every other startup handler: the first insert into
+    # monitoring_readings (backfill, telemetry flusher, requests) would create a regular collection
+    await create_timeseries_collections()
+
+@app.on_event("startup")
+async def create_indexes_on_startup():
+    # Build in the background so startup is not held up by large collections
+    run_in_background(ensure_indexes())
 
 # Pydantic models
 class Bird(BaseModel):
@@ -58,6 +398,8 @@ class Bird(BaseModel):
     purchase_currency: Optional[str] = "RM"
     purchase_source: Optional[str] = None
     purchase_notes: Optional[str] = None
+    # Registering a hatched chick: the bird takes the chick's id, which links it into the pedigree
+    chick_id: Optional[str] = None
     created_at: Optional[str] = None
 
 class BreedingPair(BaseModel):
@@ -209,6 +551,21 @@ class DailyMonitoring(BaseModel):
     notes: Optional[str] = None
     created_at: Optional[str] = None
 
+class ExchangeRate(BaseModel):
+    id: Optional[str] = None  # currency code
+    currency: Optional[str] = None
+    rate: float  # units of the base currency per unit of this currency
+    updated_at: Optional[str] = None
+
+class TelemetryReading(BaseModel):
+    timestamp: Optional[str] = None  # ISO 8601, defaults to the time of receipt
+    temperature: Optional[float] = None
+    humidity: Optional[float] = None
+
+class TelemetryBatch(BaseModel):
+    incubator_id: str
+    readings: List[TelemetryReading]
+
 class WildlifePermit(BaseModel):
     id: Optional[str] = None
     permit_number: Optional[str] = None  # Auto-generated serial number
@@ -234,6 +591,824 @@ class WildlifePermit(BaseModel):
     notes: Optional[str] = None
     created_at: Optional[str] = None
 
+# In-process reference data cache
+class ReferenceCache:
+    """Read-through TTL/LRU cache of rarely changing documents keyed by (collection, id).
+    
+    Each entry is tagged with the collection's write version read before the
+    document was fetched, and is only served while that is still the latest
+    version this worker knows of (see reference_version). A write by any worker
+    therefore retires every entry of the collection within
+    REFERENCE_CACHE_VERSION_TTL, and a read racing a write can only tag newer
+    data with an older version, never the reverse. The write helpers also drop
+    entries they touch in this worker; the TTL just bounds how long idle entries
+    are kept.
+    """
+    
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.stats = {}
+    
+    def get(self, collection_name, doc_id, version):
+        key = (collection_name, doc_id)
+        stats = self.stats.setdefault(collection_name, {"hits": 0, "misses": 0})
+        entry = self.entries.get(key)
+        if entry and entry[0] > time.monotonic() and entry[1] == version:
+            self.entries.move_to_end(key)
+            stats["hits"] += 1
+            return entry[2]
+        if entry:
+            del self.entries[key]
+        stats["misses"] += 1
+        return None
+    
+    def put(self, collection_name, doc, version):
+        key = (collection_name, doc["id"])
+        self.entries[key] = (time.monotonic() + self.ttl, version, doc)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+    
+    def invalidate(self, collection_name, doc_id):
+        self.entries.pop((collection_name, doc_id), None)
+    
+    def clear(self):
+        self.entries.clear()
+    
+    def metrics(self):
+        hits = sum(stats["hits"] for stats in self.stats.values())
+        misses = sum(stats["misses"] for stats in self.stats.values())
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "version_ttl_seconds": REFERENCE_CACHE_VERSION_TTL,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0,
+            "collections": self.stats
+        }
+
+CACHED_COLLECTIONS = {
+    species_collection.name,
+    incubators_collection.name,
+    license_collection.name,
+    breeding_pairs_collection.name,
+}
+reference_cache = ReferenceCache(
+    ttl=float(os.environ.get('REFERENCE_CACHE_TTL', '60')),
+    max_entries=int(os.environ.get('REFERENCE_CACHE_SIZE', '10000'))
+)
+
+# Latest write version this worker has seen per collection: name -> (version, monotonic time seen)
+known_versions = {}
+REFERENCE_CACHE_VERSION_TTL = float(os.environ.get('REFERENCE_CACHE_VERSION_TTL', '1'))
+
+def observe_versions(versions):
+    """Record collection versions read from Mongo; versions only grow, so a late older read is ignored"""
+    now = time.monotonic()
+    for name, version in versions.items():
+        known = known_versions.get(name)
+        known_versions[name] = (max(version, known[0]) if known else version, now)
+
+async def reference_version(collection):
+    """Version reference_cache entries of the collection are checked against.
+    
+    Served from known_versions and only re-read once older than
+    REFERENCE_CACHE_VERSION_TTL, so cache hits normally cost no round trip.
+    cached_response and compute_etag read the versions right before computing a
+    payload, which refreshes them here too: a payload is never built from
+    entries older than the version it is keyed or tagged with.
+    """
+    known = known_versions.get(collection.name)
+    if known is None or time.monotonic() - known[1] > REFERENCE_CACHE_VERSION_TTL:
+        await collection_versions_key([collection])
+        known = known_versions[collection.name]
+    return known[0]
+
+# Batched relationship loaders
+async def load_by_ids(collection, ids):
+    """Fetch documents by application id with a single $in query, keyed by id.
+    
+    Reference collections are served from reference_cache where possible; callers
+    get their own (shallow) copies, so enriching the result does not touch the cache.
+    """
+    unique_ids = list({doc_id for doc_id in ids if doc_id})
+    cached = collection.name in CACHED_COLLECTIONS and unique_ids
+    docs = {}
+    if cached:
+        version = await reference_version(collection)
+        for doc_id in unique_ids:
+            doc = reference_cache.get(collection.name, doc_id, version)
+            if doc is not None:
+                docs[doc_id] = dict(doc)
+        unique_ids = [doc_id for doc_id in unique_ids if doc_id not in docs]
+    
+    if unique_ids:
+        async for doc in collection.find({"id": {"$in": unique_ids}}, {"_id": 0}):
+            if cached:
+                reference_cache.put(collection.name, dict(doc), version)
+            docs[doc["id"]] = doc
+    return docs
+
+async def find_by_id(collection, doc_id):
+    return (await load_by_ids(collection, [doc_id])).get(doc_id)
+
+async def attach_pair_birds(pairs):
+    """Embed male_bird/female_bird into each breeding pair"""
+    birds = await load_by_ids(
+        birds_collection,
+        [pair["male_bird_id"] for pair in pairs] + [pair["female_bird_id"] for pair in pairs]
+    )
+    for pair in pairs:
+        pair["male_bird"] = birds.get(pair["male_bird_id"])
+        pair["female_bird"] = birds.get(pair["female_bird_id"])
+    return pairs
+
+async def attach_breeding_pairs(records):
+    """Embed the enriched breeding_pair into each record holding a breeding_pair_id"""
+    pairs = await load_by_ids(breeding_pairs_collection, [r["breeding_pair_id"] for r in records])
+    await attach_pair_birds(list(pairs.values()))
+    for record in records:
+        record["breeding_pair"] = pairs.get(record["breeding_pair_id"])
+    return records
+
+async def attach_clutches(records):
+    """Embed the enriched clutch into each record holding a clutch_id"""
+    clutches = await load_by_ids(clutches_collection, [r["clutch_id"] for r in records])
+    await attach_breeding_pairs(list(clutches.values()))
+    for record in records:
+        record["clutch"] = clutches.get(record["clutch_id"])
+    return records
+
+async def clutch_includes(records):
+    """Slim counterpart of attach_clutches: the clutches, breeding pairs and birds
+    referenced by records, each keyed by id, for an includes map"""
+    clutches = await load_by_ids(clutches_collection, [r.get("clutch_id") for r in records])
+    pairs = await load_by_ids(breeding_pairs_collection, [c.get("breeding_pair_id") for c in clutches.values()])
+    birds = await load_by_ids(
+        birds_collection,
+        [p.get("male_bird_id") for p in pairs.values()] + [p.get("female_bird_id") for p in pairs.values()]
+    )
+    return {"clutches": clutches, "breeding_pairs": pairs, "birds": birds}
+
+def fast_json_response(content):
+    """Serialize JSON-native content (documents without _id) directly, skipping the
+    jsonable_encoder pass FastAPI applies to returned dicts; orjson when installed"""
+    if orjson is not None:
+        return ORJSONResponse(content)
+    return JSONResponse(jsonable_encoder(content))
+
+def set_license_alert(doc):
+    """days_until_expiry and license_alert (none/critical/expired) of a bird or pair with a license_expiry"""
+    if doc.get("license_expiry"):
+        days_until_expiry = (datetime.strptime(doc["license_expiry"], "%Y-%m-%d") - datetime.now()).days
+        doc["days_until_expiry"] = days_until_expiry
+        doc["license_alert"] = "none"
+        if days_until_expiry < 0:
+            doc["license_alert"] = "expired"
+        elif days_until_expiry <= 30:
+            doc["license_alert"] = "critical"
+    return doc
+
+def set_chick_age(chick):
+    if chick.get("hatch_date"):
+        chick["age_days"] = (datetime.now() - datetime.strptime(chick["hatch_date"], "%Y-%m-%d")).days
+    return chick
+
+# Keyset pagination
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(doc, sort):
+    """Opaque cursor holding the sort key values of the last document on a page"""
+    values = [str(doc["_id"]) if field == "_id" else doc.get(field) for field, _ in sort]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+def decode_cursor(cursor, sort):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(sort):
+            raise ValueError("cursor does not match sort key")
+        return [ObjectId(value) if field == "_id" else value for (field, _), value in zip(sort, values)]
+    except (ValueError, TypeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def keyset_filter(sort, values):
+    """Match documents strictly after values in the given (field, direction) sort order"""
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        clause = {prev_field: value for (prev_field, _), value in zip(sort[:i], values[:i])}
+        clause[field] = {"$gt" if direction == 1 else "$lt": values[i]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+async def find_page(collection, query, sort, limit=None, after=None, fields=None):
+    """Run a list query with optional keyset pagination and field projection.
+    
+    sort must end with an _id tiebreaker so the order is stable. Returns the
+    documents (without _id) and the cursor for the next page, or None on the last page.
+    """
+    projection = None
+    requested = None
+    if fields:
+        requested = {field.strip() for field in fields.split(",") if field.strip()} | {"id"}
+        projection = {field: 1 for field in requested | {field for field, _ in sort}}
+    
+    if after:
+        query = {"$and": [query, keyset_filter(sort, decode_cursor(after, sort))]}
+    
+    cursor = collection.find(query, projection).sort(sort)
+    next_cursor = None
+    if limit:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        docs = await cursor.limit(limit + 1).to_list(None)
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = encode_cursor(docs[-1], sort)
+    else:
+        docs = await cursor.to_list(None)
+    
+    for doc in docs:
+        doc.pop("_id", None)
+        if requested:
+            for field in [field for field in doc if field not in requested]:
+                del doc[field]
+    return docs, next_cursor
+
+# Materialized dashboard stats, kept in step by the write helpers below
+# counter -> (collection, statuses counted)
+DASHBOARD_COUNTERS = {
+    "total_birds": (birds_collection, ["active"]),
+    "total_pairs": (breeding_pairs_collection, ["active"]),
+    "active_clutches": (clutches_collection, ["incubating", "hatching"]),
+    "total_chicks": (chicks_collection, ["alive"]),
+    "active_artificial_incubations": (artificial_incubation_collection, ["incubating", "hatching"]),
+    "total_incubators": (incubators_collection, ["active"]),
+}
+# counter -> transaction_type whose amounts are summed; kept per currency in their own
+# documents (currency codes are free text, so not usable as field names) and
+# converted into the base currency on read
+DASHBOARD_TOTALS = {
+    "total_revenue": "sale",
+    "total_expenses": "expense",
+}
+DASHBOARD_STATS_ID = "dashboard"
+# Bumped when the layout of the stats documents changes, so old ones are recounted
+DASHBOARD_STATS_FORMAT = 2
+
+def dashboard_total_id(counter, currency):
+    return f"{DASHBOARD_STATS_ID}:{counter}:{currency}"
+
+async def rebuild_dashboard_stats():
+    """Recount every dashboard counter from the source collections; writes to them wait until it is done"""
+    async with rebuild_gate.rebuild():
+        stats = {}
+        for counter, (collection, statuses) in DASHBOARD_COUNTERS.items():
+            stats[counter] = await collection.count_documents({"status": {"$in": statuses}})
+        
+        counters_by_type = {transaction_type: counter for counter, transaction_type in DASHBOARD_TOTALS.items()}
+        totals = await transactions_collection.aggregate([
+            {"$match": {"transaction_type": {"$in": list(counters_by_type)}}},
+            {"$group": {
+                "_id": {"transaction_type": "$transaction_type", "currency": {"$ifNull": ["$currency", BASE_CURRENCY]}},
+                "total": {"$sum": "$amount"}
+            }}
+        ]).to_list(None)
+        await dashboard_stats_collection.delete_many({"counter": {"$exists": True}})
+        if totals:
+            await dashboard_stats_collection.insert_many([
+                {
+                    "_id": dashboard_total_id(counters_by_type[group["_id"]["transaction_type"]], group["_id"]["currency"]),
+                    "counter": counters_by_type[group["_id"]["transaction_type"]],
+                    "currency": group["_id"]["currency"],
+                    "amount": group["total"],
+                }
+                for group in totals
+            ])
+        
+        stats["format"] = DASHBOARD_STATS_FORMAT
+        stats["rebuilt_at"] = datetime.now().isoformat()
+        await dashboard_stats_collection.replace_one({"_id": DASHBOARD_STATS_ID}, stats, upsert=True)
+        # The recount changes the dashboard without a source write; retire payloads cached before it
+        await bump_version(dashboard_stats_collection)
+    return stats
+
+async def dashboard_totals():
+    """The per-currency totals converted into the base currency; currencies without an
+    exchange rate are left out and listed as unconverted, as in the financial report"""
+    rates = await base_currency_rates()
+    totals = {counter: 0 for counter in DASHBOARD_TOTALS}
+    unconverted = set()
+    async for row in dashboard_stats_collection.find({"counter": {"$in": list(DASHBOARD_TOTALS)}}):
+        if row["currency"] in rates:
+            totals[row["counter"]] += row["amount"] * rates[row["currency"]]
+        elif round(row["amount"], 2):
+            unconverted.add(row["currency"])
+    return totals, sorted(unconverted)
+
+async def get_dashboard_stats():
+    stats = await dashboard_stats_collection.find_one({"_id": DASHBOARD_STATS_ID})
+    if (
+        not stats or stats.get("format") != DASHBOARD_STATS_FORMAT
+        or any(counter not in stats for counter in DASHBOARD_COUNTERS)
+    ):
+        stats = await rebuild_dashboard_stats()
+    totals, unconverted = await dashboard_totals()
+    return {**stats, **totals, "unconverted_currencies": unconverted}
+
+async def ensure_dashboard_stats():
+    try:
+        await get_dashboard_stats()
+    except PyMongoError:
+        # Rebuilt lazily on the first dashboard request once Mongo is reachable
+        pass
+
+@app.on_event("startup")
+async def ensure_dashboard_stats_on_startup():
+    # A recount holds up writes, not startup
+    run_in_background(ensure_dashboard_stats())
+
+REBUILD_LEASE_TTL = float(os.environ.get('REBUILD_LEASE_TTL', '30'))
+REBUILD_LEASE_POLL_INTERVAL = 0.5
+
+class RebuildGate:
+    """Keeps full rebuilds of derived data from interleaving with the writes they read.
+    
+    A write to one of the source collections holds the gate (shared) from the source
+    write until record_writes has applied its deltas; a rebuild holds it exclusively.
+    Otherwise a write could be counted by the rebuild's aggregation and then applied
+    again as a delta, or land its delta in data the rebuild is about to replace.
+    Writers queue behind a waiting rebuild so it cannot be starved.
+    
+    Workers and instances share the gate through a lease document in Mongo. A
+    process only admits writes while it holds a writer lease there, renewed in the
+    background every third of REBUILD_LEASE_TTL, so the write path itself costs
+    no round trip. A rebuild flags the document and waits until every other
+    process has seen the flag on renewal, drained its writes and released its
+    lease (or let it lapse, if it died); they resume once the flag is cleared or
+    lapses. Expiry times come from each host's clock, which must be kept in sync.
+    """
+    
+    def __init__(self, collections, lease_collection, lease_id):
+        self.names = {collection.name for collection in collections}
+        self.lease_collection = lease_collection
+        self.lease_id = lease_id
+        self.process_id = str(uuid.uuid4())
+        self.writers = 0
+        self.rebuilding = False  # a rebuild runs (or waits to run) in this process
+        self.paused = False  # another process has flagged a rebuild
+        self.lease_until = None  # monotonic deadline for admitting writes under the writer lease
+        self.condition = asyncio.Condition()
+        self.lease_lock = asyncio.Lock()
+        self.renewer = None
+    
+    def lease_expiry(self):
+        return datetime.utcnow() + timedelta(seconds=REBUILD_LEASE_TTL)
+    
+    def lease_held(self):
+        return self.lease_until is not None and time.monotonic() < self.lease_until
+    
+    async def renew_lease(self):
+        """Take or extend this process's writer lease; False while a rebuild is flagged"""
+        renewed_at = time.monotonic()
+        try:
+            await self.lease_collection.update_one(
+                {"_id": self.lease_id, "$or": [{"rebuild": None}, {"rebuild.expires_at": {"$lt": datetime.utcnow()}}]},
+                {"$set": {f"writers.{self.process_id}": self.lease_expiry()}},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # The document exists but did not match: a rebuild is flagged
+            return False
+        # Stop admitting writes well before the lease lapses in Mongo
+        self.lease_until = renewed_at + REBUILD_LEASE_TTL / 2
+        return True
+    
+    async def acquire_lease(self):
+        async with self.lease_lock:
+            if self.lease_held() or self.paused or self.rebuilding:
+                return
+            if not await self.renew_lease():
+                self.pause()
+            elif self.renewer is None or self.renewer.done():
+                self.renewer = run_in_background(self.keep_lease())
+    
+    async def keep_lease(self):
+        """Renew the writer lease until a rebuild is flagged, here or by another process"""
+        while True:
+            await asyncio.sleep(REBUILD_LEASE_TTL / 3)
+            async with self.lease_lock:
+                if self.rebuilding or self.paused or self.lease_until is None:
+                    return
+                try:
+                    renewed = await self.renew_lease()
+                except PyMongoError:
+                    # lease_until runs out on its own; writes re-acquire once Mongo is back
+                    continue
+                if not renewed:
+                    self.pause()
+                    return
+    
+    def pause(self):
+        if not self.paused:
+            self.paused = True
+            self.lease_until = None
+            run_in_background(self.wait_out_rebuild())
+    
+    async def wait_out_rebuild(self):
+        """Drain this process's writes, release its lease and hold new writes until the rebuild is over"""
+        async with self.condition:
+            await self.condition.wait_for(lambda: not self.writers)
+        released = False
+        while True:
+            try:
+                if not released:
+                    await self.lease_collection.update_one(
+                        {"_id": self.lease_id}, {"$unset": {f"writers.{self.process_id}": ""}}
+                    )
+                    released = True
+                if not await self.lease_collection.find_one(
+                    {"_id": self.lease_id, "rebuild.expires_at": {"$gte": datetime.utcnow()}}, {"_id": 1}
+                ):
+                    break
+            except PyMongoError:
+                pass
+            await asyncio.sleep(REBUILD_LEASE_POLL_INTERVAL)
+        async with self.condition:
+            self.paused = False
+            self.condition.notify_all()
+    
+    async def flag_rebuild(self):
+        """Flag the lease document for a rebuild by this process, waiting out one flagged elsewhere"""
+        async with self.lease_lock:
+            self.lease_until = None
+            while True:
+                try:
+                    await self.lease_collection.update_one(
+                        {"_id": self.lease_id, "$or": [{"rebuild": None}, {"rebuild.expires_at": {"$lt": datetime.utcnow()}}]},
+                        {
+                            "$set": {"rebuild": {"holder": self.process_id, "expires_at": self.lease_expiry()}},
+                            "$unset": {f"writers.{self.process_id}": ""}
+                        },
+                        upsert=True
+                    )
+                    return
+                except DuplicateKeyError:
+                    await asyncio.sleep(REBUILD_LEASE_POLL_INTERVAL)
+    
+    async def hold_rebuild_flag(self):
+        while True:
+            await asyncio.sleep(REBUILD_LEASE_TTL / 3)
+            try:
+                await self.lease_collection.update_one(
+                    {"_id": self.lease_id, "rebuild.holder": self.process_id},
+                    {"$set": {"rebuild.expires_at": self.lease_expiry()}}
+                )
+            except PyMongoError:
+                pass
+    
+    async def wait_for_other_writers(self):
+        while True:
+            lease = await self.lease_collection.find_one({"_id": self.lease_id}) or {}
+            now = datetime.utcnow()
+            if not any(expires_at > now for expires_at in (lease.get("writers") or {}).values()):
+                return
+            await asyncio.sleep(REBUILD_LEASE_POLL_INTERVAL)
+    
+    @asynccontextmanager
+    async def write(self, collection):
+        if collection.name not in self.names:
+            yield
+            return
+        while True:
+            async with self.condition:
+                await self.condition.wait_for(lambda: not self.rebuilding and not self.paused)
+                if self.lease_held():
+                    self.writers += 1
+                    break
+            await self.acquire_lease()
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.writers -= 1
+                self.condition.notify_all()
+    
+    @asynccontextmanager
+    async def rebuild(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: not self.rebuilding)
+            self.rebuilding = True
+            await self.condition.wait_for(lambda: not self.writers)
+        try:
+            await self.flag_rebuild()
+            holder = run_in_background(self.hold_rebuild_flag())
+            try:
+                await self.wait_for_other_writers()
+                yield
+            finally:
+                holder.cancel()
+                try:
+                    await self.lease_collection.update_one(
+                        {"_id": self.lease_id, "rebuild.holder": self.process_id}, {"$unset": {"rebuild": ""}}
+                    )
+                except PyMongoError:
+                    # The flag lapses after REBUILD_LEASE_TTL
+                    pass
+        finally:
+            async with self.condition:
+                self.rebuilding = False
+                self.condition.notify_all()
+
+# Sources of the dashboard stats, the financial rollups and the profitability ledger
+rebuild_gate = RebuildGate(
+    [collection for collection, _ in DASHBOARD_COUNTERS.values()] + [transactions_collection, birds_collection],
+    rebuild_leases_collection, "derived_data"
+)
+
+# Write helpers: every create/update/delete goes through these so derived data stays in step
+def add_dashboard_increments(increments, collection, doc, sign):
+    """Add the stats contribution of one document (sign -1 to remove it) to increments"""
+    for counter, (counted_collection, statuses) in DASHBOARD_COUNTERS.items():
+        if counted_collection.name == collection.name and doc.get("status") in statuses:
+            increments[counter] = increments.get(counter, 0) + sign
+    if collection.name == transactions_collection.name:
+        # Totals are keyed (counter, currency), see DASHBOARD_TOTALS
+        for counter, transaction_type in DASHBOARD_TOTALS.items():
+            if doc.get("transaction_type") == transaction_type:
+                key = (counter, doc.get("currency") or BASE_CURRENCY)
+                increments[key] = increments.get(key, 0) + sign * (doc.get("amount") or 0)
+
+async def bump_version(collection):
+    """Move the collection's write version on, retiring response cache entries and ETags keyed on it"""
+    versions = await collection_versions_collection.find_one_and_update(
+        {"_id": collection.name},
+        {"$inc": {"version": 1}, "$set": {"updated_at": datetime.now().isoformat()}},
+        upsert=True, return_document=ReturnDocument.AFTER
+    )
+    observe_versions({collection.name: versions["version"]})
+
+async def record_writes(collection, before=(), after=()):
+    """Apply the effect of a batch of document writes to derived data, then bump the collection version.
+    
+    The version moves last: a reader that sees the new version (and caches or
+    ETags a payload under it) is guaranteed to also see every derived update.
+    """
+    if collection.name in CACHED_COLLECTIONS:
+        for doc in [*before, *after]:
+            reference_cache.invalidate(collection.name, doc.get("id"))
+    
+    await pedigree_index.record_writes(collection, before, after)
+    await sync_monitoring_readings(collection, before, after)
+    await update_financial_rollups(collection, before, after)
+    await update_profitability_ledger(collection, before, after)
+    
+    increments = {}
+    for doc in before:
+        add_dashboard_increments(increments, collection, doc, -1)
+    for doc in after:
+        add_dashboard_increments(increments, collection, doc, 1)
+    
+    increments = {key: value for key, value in increments.items() if value}
+    counters = {key: value for key, value in increments.items() if key in DASHBOARD_COUNTERS}
+    totals = {key: value for key, value in increments.items() if key not in DASHBOARD_COUNTERS}
+    if counters:
+        await dashboard_stats_collection.update_one(
+            {"_id": DASHBOARD_STATS_ID}, {"$inc": counters}, upsert=True
+        )
+    if totals:
+        await dashboard_stats_collection.bulk_write([
+            UpdateOne(
+                {"_id": dashboard_total_id(counter, currency)},
+                {"$inc": {"amount": value}, "$set": {"counter": counter, "currency": currency}},
+                upsert=True
+            )
+            for (counter, currency), value in totals.items()
+        ], ordered=False)
+    
+    await bump_version(collection)
+
+async def collections_modified_since(collections, since):
+    """True if any of the collections was written through the helpers after since"""
+    return await collection_versions_collection.count_documents({
+        "_id": {"$in": [collection.name for collection in collections]},
+        "updated_at": {"$gt": since.isoformat()}
+    }) > 0
+
+async def record_write(collection, before=None, after=None):
+    await record_writes(collection, [before] if before else [], [after] if after else [])
+
+async def insert_document(collection, doc):
+    async with rebuild_gate.write(collection):
+        result = await collection.insert_one(doc)
+        await record_write(collection, after=doc)
+    return result
+
+async def insert_documents(collection, docs):
+    """Unordered insert_many; returns {position in docs: error message} for rejected documents"""
+    failed = {}
+    async with rebuild_gate.write(collection):
+        try:
+            await collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                failed[error["index"]] = error.get("errmsg", "Insert failed")
+        await record_writes(collection, after=[doc for i, doc in enumerate(docs) if i not in failed])
+    return failed
+
+async def update_document(collection, doc_id, changes):
+    """$set changes on the document with this id; result mirrors update_one"""
+    async with rebuild_gate.write(collection):
+        before = await collection.find_one_and_update(
+            {"id": doc_id}, {"$set": changes}, projection={"_id": 0},
+            return_document=ReturnDocument.BEFORE
+        )
+        if before is None:
+            return UpdateResult({"n": 0, "nModified": 0}, acknowledged=True)
+        
+        await record_write(collection, before, {**before, **changes})
+    modified = any(before.get(field) != value for field, value in changes.items())
+    return UpdateResult({"n": 1, "nModified": int(modified)}, acknowledged=True)
+
+async def delete_document(collection, doc_id):
+    """Delete the document with this id; result mirrors delete_one"""
+    async with rebuild_gate.write(collection):
+        before = await collection.find_one_and_delete({"id": doc_id}, projection={"_id": 0})
+        if before is None:
+            return DeleteResult({"n": 0}, acknowledged=True)
+        
+        await record_write(collection, before=before)
+    return DeleteResult({"n": 1}, acknowledged=True)
+
+# Shared response cache for expensive computed payloads
+class MemoryCacheBackend:
+    """Per-process backend; fine for a single uvicorn worker"""
+    
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+    
+    async def get(self, key):
+        entry = self.entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.entries.move_to_end(key)
+            return entry[1]
+        self.entries.pop(key, None)
+        return None
+    
+    async def set(self, key, value, ttl):
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+class RedisCacheBackend:
+    """Shared backend on any Redis-compatible server (redis package required)"""
+    
+    def __init__(self, url):
+        import redis.asyncio as redis
+        self.client = redis.from_url(url)
+    
+    async def ping(self):
+        await self.client.ping()
+    
+    async def get(self, key):
+        value = await self.client.get(key)
+        return value.decode() if value else None
+    
+    async def set(self, key, value, ttl):
+        await self.client.set(key, value, ex=ttl)
+
+class MongoCacheBackend:
+    """Shared backend on a Mongo collection whose TTL index drops expired entries"""
+    
+    def __init__(self, collection):
+        self.collection = collection
+    
+    async def get(self, key):
+        entry = await self.collection.find_one({"_id": key, "expires_at": {"$gt": datetime.utcnow()}})
+        return entry["value"] if entry else None
+    
+    async def set(self, key, value, ttl):
+        await self.collection.replace_one(
+            {"_id": key},
+            {"value": value, "expires_at": datetime.utcnow() + timedelta(seconds=ttl)},
+            upsert=True
+        )
+
+def create_response_cache_backend():
+    """RESPONSE_CACHE_BACKEND: memory (default), redis, or mongo"""
+    backend = os.environ.get('RESPONSE_CACHE_BACKEND', 'memory')
+    if backend == "redis":
+        try:
+            return RedisCacheBackend(os.environ.get('REDIS_URL', 'redis://localhost:6379/0'))
+        except ImportError:
+            backend = "mongo"
+    if backend == "mongo":
+        return MongoCacheBackend(response_cache_collection)
+    return MemoryCacheBackend()
+
+RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', '300'))
+response_cache_backend = create_response_cache_backend()
+response_cache_stats = {}
+
+@app.on_event("startup")
+async def check_response_cache_backend():
+    global response_cache_backend
+    if isinstance(response_cache_backend, RedisCacheBackend):
+        try:
+            await response_cache_backend.ping()
+        except Exception:
+            # No Redis-compatible server reachable: share through Mongo instead
+            response_cache_backend = MongoCacheBackend(response_cache_collection)
+
+async def collection_versions_key(collections):
+    """Current write versions of the collections, e.g. "12.4.0"; changes on any write"""
+    names = [collection.name for collection in collections]
+    versions = {
+        doc["_id"]: doc["version"]
+        async for doc in collection_versions_collection.find({"_id": {"$in": names}})
+    }
+    versions = {name: versions.get(name, 0) for name in names}
+    observe_versions(versions)
+    return ".".join(str(version) for version in versions.values())
+
+def cached_response(name, collections, daily=False):
+    """Cache a payload under the write versions of the collections it is computed from.
+    
+    Every write bumps the version after its derived data is updated (see
+    record_writes), so a payload computed under the current key reflects all
+    writes counted in it; entries under old keys are never read again and simply
+    expire. daily=True also keys on today's date for day-relative fields.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            stats = response_cache_stats.setdefault(name, {"hits": 0, "misses": 0, "errors": 0})
+            try:
+                key = f"response:{name}:{await collection_versions_key(collections)}"
+                if daily:
+                    key += f":{date.today().isoformat()}"
+                if args or kwargs:
+                    key += f":{json.dumps([args, kwargs], sort_keys=True, default=str)}"
+                cached = await response_cache_backend.get(key)
+            except Exception:
+                # The cache is an optimization; fall back to computing the payload
+                stats["errors"] += 1
+                return await func(*args, **kwargs)
+            
+            if cached is not None:
+                stats["hits"] += 1
+                return json.loads(cached)
+            
+            stats["misses"] += 1
+            payload = await func(*args, **kwargs)
+            try:
+                await response_cache_backend.set(key, json.dumps(payload, default=str), RESPONSE_CACHE_TTL)
+            except Exception:
+                stats["errors"] += 1
+            return payload
+        return wrapper
+    return decorator
+
+# ETags from collection write versions (see ConditionalGetRoute)
+def conditional_get(collections, daily=False):
+    """Tag a GET endpoint whose response only changes when one of the collections is written
+    (or, with daily=True, when the date changes)"""
+    def decorator(func):
+        func.etag_sources = (collections, daily)
+        return func
+    return decorator
+
+async def compute_etag(request, collections, daily):
+    key = f"{request.url.path}?{request.url.query}|{await collection_versions_key(collections)}"
+    if daily:
+        key += f"|{date.today().isoformat()}"
+    return f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        # Compressed representations carry an encoding suffix (see CompressionMiddleware)
+        for suffix in ('-br"', '-gzip"'):
+            if tag.endswith(suffix):
+                tag = tag[:-len(suffix)] + '"'
+        if tag == etag:
+            return True
+    return False
+
+# Source collections of endpoints that embed related documents
+PAIR_SOURCES = [breeding_pairs_collection, birds_collection]
+CLUTCH_SOURCES = [clutches_collection, *PAIR_SOURCES]
+
 # Incubator endpoints
 @app.post("/api/incubators")
 async def create_incubator(incubator: Incubator):
@@ -241,19 +1416,20 @@ async def create_incubator(incubator: Incubator):
     incubator_dict["id"] = str(uuid.uuid4())
     incubator_dict["created_at"] = datetime.now().isoformat()
     
-    result = incubators_collection.insert_one(incubator_dict)
+    result = await insert_document(incubators_collection, incubator_dict)
     if result.inserted_id:
         return {"message": "Incubator created successfully", "incubator_id": incubator_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create incubator")
 
 @app.get("/api/incubators")
+@conditional_get([incubators_collection])
 async def get_incubators():
-    incubators = list(incubators_collection.find({}, {"_id": 0}))
+    incubators = await incubators_collection.find({}, {"_id": 0}).to_list(None)
     return {"incubators": incubators}
 
 @app.get("/api/incubators/{incubator_id}")
 async def get_incubator(incubator_id: str):
-    incubator = incubators_collection.find_one({"id": incubator_id}, {"_id": 0})
+    incubator = await find_by_id(incubators_collection, incubator_id)
     if not incubator:
         raise HTTPException(status_code=404, detail="Incubator not found")
     return incubator
@@ -263,10 +1439,7 @@ async def update_incubator(incubator_id: str, incubator: Incubator):
     incubator_dict = incubator.dict()
     incubator_dict["id"] = incubator_id
     
-    result = incubators_collection.update_one(
-        {"id": incubator_id}, 
-        {"$set": incubator_dict}
-    )
+    result = await update_document(incubators_collection, incubator_id, incubator_dict)
     if result.modified_count:
         return {"message": "Incubator updated successfully"}
     raise HTTPException(status_code=404, detail="Incubator not found")
@@ -275,12 +1448,12 @@ async def update_incubator(incubator_id: str, incubator: Incubator):
 async def delete_incubator(incubator_id: str):
     """Delete an incubator (only if not in use for artificial incubation)"""
     # Check if incubator exists
-    incubator = incubators_collection.find_one({"id": incubator_id})
+    incubator = await incubators_collection.find_one({"id": incubator_id})
     if not incubator:
         raise HTTPException(status_code=404, detail="Incubator not found")
     
     # Check if incubator is currently in use for artificial incubation
-    active_incubations = artificial_incubation_collection.count_documents({
+    active_incubations = await artificial_incubation_collection.count_documents({
         "incubator_id": incubator_id,
         "status": {"$in": ["incubating", "hatching"]}
     })
@@ -292,9 +1465,9 @@ async def delete_incubator(incubator_id: str):
         )
     
     # Check if there are any daily monitoring records
-    monitoring_records = daily_monitoring_collection.count_documents({"incubator_id": incubator_id})
+    monitoring_records = await daily_monitoring_collection.count_documents({"incubator_id": incubator_id})
     
-    result = incubators_collection.delete_one({"id": incubator_id})
+    result = await delete_document(incubators_collection, incubator_id)
     if result.deleted_count:
         message = f"Incubator '{incubator['name']}' deleted successfully"
         if monitoring_records > 0:
@@ -306,8 +1479,8 @@ async def delete_incubator(incubator_id: str):
 @app.post("/api/artificial-incubation")
 async def create_artificial_incubation(incubation: ArtificialIncubation):
     # Check if clutch and incubator exist
-    clutch = clutches_collection.find_one({"id": incubation.clutch_id})
-    incubator = incubators_collection.find_one({"id": incubation.incubator_id})
+    clutch = await clutches_collection.find_one({"id": incubation.clutch_id})
+    incubator = await find_by_id(incubators_collection, incubation.incubator_id)
     
     if not clutch:
         raise HTTPException(status_code=404, detail="Clutch not found")
@@ -318,52 +1491,49 @@ async def create_artificial_incubation(incubation: ArtificialIncubation):
     incubation_dict["id"] = str(uuid.uuid4())
     incubation_dict["created_at"] = datetime.now().isoformat()
     
-    result = artificial_incubation_collection.insert_one(incubation_dict)
+    result = await insert_document(artificial_incubation_collection, incubation_dict)
     if result.inserted_id:
         return {"message": "Artificial incubation record created successfully", "incubation_id": incubation_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create artificial incubation record")
 
 @app.get("/api/artificial-incubation")
-async def get_artificial_incubations():
-    incubations = list(artificial_incubation_collection.find({}, {"_id": 0}))
+@conditional_get([artificial_incubation_collection, incubators_collection, *CLUTCH_SOURCES])
+async def get_artificial_incubations(slim: bool = False):
+    incubations = await artificial_incubation_collection.find({}, {"_id": 0}).to_list(None)
+    incubators = await load_by_ids(incubators_collection, [i["incubator_id"] for i in incubations])
+    
+    # slim: reference clutches, pairs, birds and incubators by id from a deduplicated includes map
+    if slim:
+        includes = await clutch_includes(incubations)
+        includes["incubators"] = incubators
+        return fast_json_response({"artificial_incubations": incubations, "includes": includes})
     
     # Enrich with clutch and incubator details
+    await attach_clutches(incubations)
     for incubation in incubations:
-        clutch = clutches_collection.find_one({"id": incubation["clutch_id"]}, {"_id": 0})
-        if clutch:
-            pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
-            if pair:
-                male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-                female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
-                pair["male_bird"] = male_bird
-                pair["female_bird"] = female_bird
-            clutch["breeding_pair"] = pair
-        incubation["clutch"] = clutch
-        
-        incubator = incubators_collection.find_one({"id": incubation["incubator_id"]}, {"_id": 0})
-        incubation["incubator"] = incubator
+        incubation["incubator"] = incubators.get(incubation["incubator_id"])
     
-    return {"artificial_incubations": incubations}
+    return fast_json_response({"artificial_incubations": incubations})
 
 @app.get("/api/artificial-incubation/{incubation_id}")
 async def get_artificial_incubation(incubation_id: str):
-    incubation = artificial_incubation_collection.find_one({"id": incubation_id}, {"_id": 0})
+    incubation = await artificial_incubation_collection.find_one({"id": incubation_id}, {"_id": 0})
     if not incubation:
         raise HTTPException(status_code=404, detail="Artificial incubation record not found")
     
     # Enrich with details
-    clutch = clutches_collection.find_one({"id": incubation["clutch_id"]}, {"_id": 0})
+    clutch = await clutches_collection.find_one({"id": incubation["clutch_id"]}, {"_id": 0})
     if clutch:
-        pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
+        pair = await find_by_id(breeding_pairs_collection, clutch["breeding_pair_id"])
         if pair:
-            male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-            female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
+            male_bird = await birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
+            female_bird = await birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
             pair["male_bird"] = male_bird
             pair["female_bird"] = female_bird
         clutch["breeding_pair"] = pair
     incubation["clutch"] = clutch
     
-    incubator = incubators_collection.find_one({"id": incubation["incubator_id"]}, {"_id": 0})
+    incubator = await find_by_id(incubators_collection, incubation["incubator_id"])
     incubation["incubator"] = incubator
     
     return incubation
@@ -377,10 +1547,7 @@ async def update_artificial_incubation(incubation_id: str, incubation: Artificia
     if incubation_dict.get("eggs_transferred") and incubation_dict.get("eggs_hatched") is not None:
         incubation_dict["success_rate"] = (incubation_dict["eggs_hatched"] / incubation_dict["eggs_transferred"]) * 100
     
-    result = artificial_incubation_collection.update_one(
-        {"id": incubation_id}, 
-        {"$set": incubation_dict}
-    )
+    result = await update_document(artificial_incubation_collection, incubation_id, incubation_dict)
     if result.modified_count:
         return {"message": "Artificial incubation record updated successfully"}
     raise HTTPException(status_code=404, detail="Artificial incubation record not found")
@@ -389,7 +1556,7 @@ async def update_artificial_incubation(incubation_id: str, incubation: Artificia
 @app.post("/api/incubation-logs")
 async def create_incubation_log(log: IncubationLog):
     # Check if artificial incubation record exists
-    incubation = artificial_incubation_collection.find_one({"id": log.artificial_incubation_id})
+    incubation = await artificial_incubation_collection.find_one({"id": log.artificial_incubation_id})
     if not incubation:
         raise HTTPException(status_code=404, detail="Artificial incubation record not found")
     
@@ -397,17 +1564,17 @@ async def create_incubation_log(log: IncubationLog):
     log_dict["id"] = str(uuid.uuid4())
     log_dict["created_at"] = datetime.now().isoformat()
     
-    result = incubation_logs_collection.insert_one(log_dict)
+    result = await insert_document(incubation_logs_collection, log_dict)
     if result.inserted_id:
         return {"message": "Incubation log created successfully", "log_id": log_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create incubation log")
 
 @app.get("/api/incubation-logs/{incubation_id}")
 async def get_incubation_logs(incubation_id: str):
-    logs = list(incubation_logs_collection.find(
+    logs = await incubation_logs_collection.find(
         {"artificial_incubation_id": incubation_id}, 
         {"_id": 0}
-    ).sort("log_date", 1))
+    ).sort("log_date", 1).to_list(None)
     return {"incubation_logs": logs}
 
 @app.put("/api/incubation-logs/{log_id}")
@@ -415,10 +1582,7 @@ async def update_incubation_log(log_id: str, log: IncubationLog):
     log_dict = log.dict()
     log_dict["id"] = log_id
     
-    result = incubation_logs_collection.update_one(
-        {"id": log_id}, 
-        {"$set": log_dict}
-    )
+    result = await update_document(incubation_logs_collection, log_id, log_dict)
     if result.modified_count:
         return {"message": "Incubation log updated successfully"}
     raise HTTPException(status_code=404, detail="Incubation log not found")
@@ -428,14 +1592,15 @@ async def create_license(license: License):
     license_dict["id"] = str(uuid.uuid4())
     license_dict["created_at"] = datetime.now().isoformat()
     
-    result = license_collection.insert_one(license_dict)
+    result = await insert_document(license_collection, license_dict)
     if result.inserted_id:
         return {"message": "License created successfully", "license_id": license_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create license")
 
 @app.get("/api/license")
+@conditional_get([license_collection], daily=True)
 async def get_license():
-    license_doc = license_collection.find_one({}, {"_id": 0})
+    license_doc = await license_collection.find_one({}, {"_id": 0})
     if license_doc:
         # Check expiry status
         expiry_date = datetime.strptime(license_doc["expiry_date"], "%Y-%m-%d")
@@ -458,10 +1623,7 @@ async def update_license(license_id: str, license: License):
     license_dict = license.dict()
     license_dict["id"] = license_id
     
-    result = license_collection.update_one(
-        {"id": license_id}, 
-        {"$set": license_dict}
-    )
+    result = await update_document(license_collection, license_id, license_dict)
     if result.modified_count:
         return {"message": "License updated successfully"}
     raise HTTPException(status_code=404, detail="License not found")
@@ -469,39 +1631,41 @@ async def update_license(license_id: str, license: License):
 # Bird endpoints
 @app.post("/api/birds")
 async def create_bird(bird: Bird):
+    """Register a bird; with chick_id, a hatched chick is registered under its chick id"""
     bird_dict = bird.dict()
     bird_dict["id"] = str(uuid.uuid4())
+    if bird.chick_id:
+        if not await chicks_collection.find_one({"id": bird.chick_id}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Chick not found")
+        if await birds_collection.find_one({"id": bird.chick_id}, {"_id": 1}):
+            raise HTTPException(status_code=400, detail="Chick is already registered as a bird")
+        bird_dict["id"] = bird.chick_id
     bird_dict["created_at"] = datetime.now().isoformat()
     
-    result = birds_collection.insert_one(bird_dict)
+    result = await insert_document(birds_collection, bird_dict)
     if result.inserted_id:
         return {"message": "Bird created successfully", "bird_id": bird_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create bird")
 
 @app.get("/api/birds")
-async def get_birds():
-    birds = list(birds_collection.find({}, {"_id": 0}))
+@conditional_get([birds_collection], daily=True)
+async def get_birds(limit: int = None, after: str = None, fields: str = None):
+    birds, next_cursor = await find_page(
+        birds_collection, {}, [("_id", 1)], limit=limit, after=after, fields=fields
+    )
     
     # Check license expiry for each bird
     for bird in birds:
-        if bird.get("license_expiry"):
-            expiry_date = datetime.strptime(bird["license_expiry"], "%Y-%m-%d")
-            today = datetime.now()
-            days_until_expiry = (expiry_date - today).days
-            
-            bird["days_until_expiry"] = days_until_expiry
-            bird["license_alert"] = "none"
-            
-            if days_until_expiry < 0:
-                bird["license_alert"] = "expired"
-            elif days_until_expiry <= 30:
-                bird["license_alert"] = "critical"
+        set_license_alert(bird)
     
-    return {"birds": birds}
+    response = {"birds": birds}
+    if limit:
+        response["next_cursor"] = next_cursor
+    return response
 
 @app.get("/api/birds/{bird_id}")
 async def get_bird(bird_id: str):
-    bird = birds_collection.find_one({"id": bird_id}, {"_id": 0})
+    bird = await birds_collection.find_one({"id": bird_id}, {"_id": 0})
     if not bird:
         raise HTTPException(status_code=404, detail="Bird not found")
     return bird
@@ -511,17 +1675,14 @@ async def update_bird(bird_id: str, bird: Bird):
     bird_dict = bird.dict()
     bird_dict["id"] = bird_id
     
-    result = birds_collection.update_one(
-        {"id": bird_id}, 
-        {"$set": bird_dict}
-    )
+    result = await update_document(birds_collection, bird_id, bird_dict)
     if result.modified_count:
         return {"message": "Bird updated successfully"}
     raise HTTPException(status_code=404, detail="Bird not found")
 
 @app.delete("/api/birds/{bird_id}")
 async def delete_bird(bird_id: str):
-    result = birds_collection.delete_one({"id": bird_id})
+    result = await delete_document(birds_collection, bird_id)
     if result.deleted_count:
         return {"message": "Bird deleted successfully"}
     raise HTTPException(status_code=404, detail="Bird not found")
@@ -530,8 +1691,8 @@ async def delete_bird(bird_id: str):
 @app.post("/api/breeding-pairs")
 async def create_breeding_pair(pair: BreedingPair):
     # Check if birds exist and are of correct gender
-    male_bird = birds_collection.find_one({"id": pair.male_bird_id})
-    female_bird = birds_collection.find_one({"id": pair.female_bird_id})
+    male_bird = await birds_collection.find_one({"id": pair.male_bird_id})
+    female_bird = await birds_collection.find_one({"id": pair.female_bird_id})
     
     if not male_bird or not female_bird:
         raise HTTPException(status_code=404, detail="One or both birds not found")
@@ -543,47 +1704,33 @@ async def create_breeding_pair(pair: BreedingPair):
     pair_dict["id"] = str(uuid.uuid4())
     pair_dict["created_at"] = datetime.now().isoformat()
     
-    result = breeding_pairs_collection.insert_one(pair_dict)
+    result = await insert_document(breeding_pairs_collection, pair_dict)
     if result.inserted_id:
         return {"message": "Breeding pair created successfully", "pair_id": pair_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create breeding pair")
 
 @app.get("/api/breeding-pairs")
+@conditional_get(PAIR_SOURCES, daily=True)
 async def get_breeding_pairs():
-    pairs = list(breeding_pairs_collection.find({}, {"_id": 0}))
+    pairs = await breeding_pairs_collection.find({}, {"_id": 0}).to_list(None)
     
     # Enrich with bird details and check license expiry
+    await attach_pair_birds(pairs)
     for pair in pairs:
-        male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-        female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
-        pair["male_bird"] = male_bird
-        pair["female_bird"] = female_bird
-        
-    # Check pair license expiry
-        if pair.get("license_expiry"):
-            expiry_date = datetime.strptime(pair["license_expiry"], "%Y-%m-%d")
-            today = datetime.now()
-            days_until_expiry = (expiry_date - today).days
-            
-            pair["days_until_expiry"] = days_until_expiry
-            pair["license_alert"] = "none"
-            
-            if days_until_expiry < 0:
-                pair["license_alert"] = "expired"
-            elif days_until_expiry <= 30:
-                pair["license_alert"] = "critical"
+        # Check pair license expiry
+        set_license_alert(pair)
     
     return {"breeding_pairs": pairs}
 
 @app.get("/api/breeding-pairs/{pair_id}")
 async def get_breeding_pair(pair_id: str):
-    pair = breeding_pairs_collection.find_one({"id": pair_id}, {"_id": 0})
+    pair = await find_by_id(breeding_pairs_collection, pair_id)
     if not pair:
         raise HTTPException(status_code=404, detail="Breeding pair not found")
     
     # Enrich with bird details
-    male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-    female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
+    male_bird = await birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
+    female_bird = await birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
     pair["male_bird"] = male_bird
     pair["female_bird"] = female_bird
     
@@ -594,19 +1741,37 @@ async def update_breeding_pair(pair_id: str, pair: BreedingPair):
     pair_dict = pair.dict()
     pair_dict["id"] = pair_id
     
-    result = breeding_pairs_collection.update_one(
-        {"id": pair_id}, 
-        {"$set": pair_dict}
-    )
+    result = await update_document(breeding_pairs_collection, pair_id, pair_dict)
     if result.modified_count:
         return {"message": "Breeding pair updated successfully"}
     raise HTTPException(status_code=404, detail="Breeding pair not found")
 
+@app.delete("/api/breeding-pairs/{pair_id}")
+async def delete_breeding_pair(pair_id: str):
+    """Delete a breeding pair (only if it has no clutches or breeding records)"""
+    pair = await breeding_pairs_collection.find_one({"id": pair_id}, {"_id": 1})
+    if not pair:
+        raise HTTPException(status_code=404, detail="Breeding pair not found")
+    
+    # Its clutches and records carry the pair's parents into the pedigree
+    clutch_count = await clutches_collection.count_documents({"breeding_pair_id": pair_id})
+    record_count = await breeding_records_collection.count_documents({"breeding_pair_id": pair_id})
+    if clutch_count or record_count:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot delete breeding pair. {clutch_count} clutches and {record_count} breeding records still belong to it."
+        )
+    
+    result = await delete_document(breeding_pairs_collection, pair_id)
+    if result.deleted_count:
+        return {"message": "Breeding pair deleted successfully"}
+    raise HTTPException(status_code=404, detail="Breeding pair not found")
+
 # Clutch endpoints
 @app.post("/api/clutches")
 async def create_clutch(clutch: Clutch):
     # Check if breeding pair exists
-    pair = breeding_pairs_collection.find_one({"id": clutch.breeding_pair_id})
+    pair = await find_by_id(breeding_pairs_collection, clutch.breeding_pair_id)
     if not pair:
         raise HTTPException(status_code=404, detail="Breeding pair not found")
     
@@ -614,38 +1779,32 @@ async def create_clutch(clutch: Clutch):
     clutch_dict["id"] = str(uuid.uuid4())
     clutch_dict["created_at"] = datetime.now().isoformat()
     
-    result = clutches_collection.insert_one(clutch_dict)
+    result = await insert_document(clutches_collection, clutch_dict)
     if result.inserted_id:
         return {"message": "Clutch created successfully", "clutch_id": clutch_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create clutch")
 
 @app.get("/api/clutches")
+@conditional_get(CLUTCH_SOURCES)
 async def get_clutches():
-    clutches = list(clutches_collection.find({}, {"_id": 0}))
+    clutches = await clutches_collection.find({}, {"_id": 0}).to_list(None)
     
     # Enrich with breeding pair details
-    for clutch in clutches:
-        pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
-        if pair:
-            male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-            female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
-            pair["male_bird"] = male_bird
-            pair["female_bird"] = female_bird
-        clutch["breeding_pair"] = pair
+    await attach_breeding_pairs(clutches)
     
     return {"clutches": clutches}
 
 @app.get("/api/clutches/{clutch_id}")
 async def get_clutch(clutch_id: str):
-    clutch = clutches_collection.find_one({"id": clutch_id}, {"_id": 0})
+    clutch = await clutches_collection.find_one({"id": clutch_id}, {"_id": 0})
     if not clutch:
         raise HTTPException(status_code=404, detail="Clutch not found")
     
     # Enrich with breeding pair details
-    pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
+    pair = await find_by_id(breeding_pairs_collection, clutch["breeding_pair_id"])
     if pair:
-        male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-        female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
+        male_bird = await birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
+        female_bird = await birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
         pair["male_bird"] = male_bird
         pair["female_bird"] = female_bird
     clutch["breeding_pair"] = pair
@@ -657,19 +1816,36 @@ async def update_clutch(clutch_id: str, clutch: Clutch):
     clutch_dict = clutch.dict()
     clutch_dict["id"] = clutch_id
     
-    result = clutches_collection.update_one(
-        {"id": clutch_id}, 
-        {"$set": clutch_dict}
-    )
+    result = await update_document(clutches_collection, clutch_id, clutch_dict)
     if result.modified_count:
         return {"message": "Clutch updated successfully"}
     raise HTTPException(status_code=404, detail="Clutch not found")
 
+@app.delete("/api/clutches/{clutch_id}")
+async def delete_clutch(clutch_id: str):
+    """Delete a clutch (only if it has no chicks or artificial incubations)"""
+    clutch = await clutches_collection.find_one({"id": clutch_id}, {"_id": 1})
+    if not clutch:
+        raise HTTPException(status_code=404, detail="Clutch not found")
+    
+    chick_count = await chicks_collection.count_documents({"clutch_id": clutch_id})
+    incubation_count = await artificial_incubation_collection.count_documents({"clutch_id": clutch_id})
+    if chick_count or incubation_count:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot delete clutch. {chick_count} chicks and {incubation_count} artificial incubations still belong to it."
+        )
+    
+    result = await delete_document(clutches_collection, clutch_id)
+    if result.deleted_count:
+        return {"message": "Clutch deleted successfully"}
+    raise HTTPException(status_code=404, detail="Clutch not found")
+
 # Chick endpoints
 @app.post("/api/chicks")
 async def create_chick(chick: Chick):
     # Check if clutch exists
-    clutch = clutches_collection.find_one({"id": chick.clutch_id})
+    clutch = await clutches_collection.find_one({"id": chick.clutch_id})
     if not clutch:
         raise HTTPException(status_code=404, detail="Clutch not found")
     
@@ -677,50 +1853,46 @@ async def create_chick(chick: Chick):
     chick_dict["id"] = str(uuid.uuid4())
     chick_dict["created_at"] = datetime.now().isoformat()
     
-    result = chicks_collection.insert_one(chick_dict)
+    result = await insert_document(chicks_collection, chick_dict)
     if result.inserted_id:
         return {"message": "Chick created successfully", "chick_id": chick_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create chick")
 
 @app.get("/api/chicks")
-async def get_chicks():
-    chicks = list(chicks_collection.find({}, {"_id": 0}))
+@conditional_get([chicks_collection, *CLUTCH_SOURCES], daily=True)
+async def get_chicks(limit: int = None, after: str = None, fields: str = None, slim: bool = False):
+    chicks, next_cursor = await find_page(
+        chicks_collection, {}, [("_id", 1)], limit=limit, after=after, fields=fields
+    )
     
-    # Enrich with clutch and breeding pair details
+    # Enrich with clutch and breeding pair details (slim: by id from a deduplicated includes map)
+    if slim:
+        includes = await clutch_includes(chicks)
+    else:
+        await attach_clutches([chick for chick in chicks if "clutch_id" in chick])
     for chick in chicks:
-        clutch = clutches_collection.find_one({"id": chick["clutch_id"]}, {"_id": 0})
-        if clutch:
-            pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
-            if pair:
-                male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-                female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
-                pair["male_bird"] = male_bird
-                pair["female_bird"] = female_bird
-            clutch["breeding_pair"] = pair
-        chick["clutch"] = clutch
-        
-        # Calculate age in days
-        if chick.get("hatch_date"):
-            hatch_date = datetime.strptime(chick["hatch_date"], "%Y-%m-%d")
-            today = datetime.now()
-            age_days = (today - hatch_date).days
-            chick["age_days"] = age_days
-    
-    return {"chicks": chicks}
+        set_chick_age(chick)
+    
+    response = {"chicks": chicks}
+    if slim:
+        response["includes"] = includes
+    if limit:
+        response["next_cursor"] = next_cursor
+    return fast_json_response(response)
 
 @app.get("/api/chicks/{chick_id}")
 async def get_chick(chick_id: str):
-    chick = chicks_collection.find_one({"id": chick_id}, {"_id": 0})
+    chick = await chicks_collection.find_one({"id": chick_id}, {"_id": 0})
     if not chick:
         raise HTTPException(status_code=404, detail="Chick not found")
     
     # Enrich with clutch and breeding pair details
-    clutch = clutches_collection.find_one({"id": chick["clutch_id"]}, {"_id": 0})
+    clutch = await clutches_collection.find_one({"id": chick["clutch_id"]}, {"_id": 0})
     if clutch:
-        pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
+        pair = await find_by_id(breeding_pairs_collection, clutch["breeding_pair_id"])
         if pair:
-            male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-            female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
+            male_bird = await birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
+            female_bird = await birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
             pair["male_bird"] = male_bird
             pair["female_bird"] = female_bird
         clutch["breeding_pair"] = pair
@@ -740,14 +1912,30 @@ async def update_chick(chick_id: str, chick: Chick):
     chick_dict = chick.dict()
     chick_dict["id"] = chick_id
     
-    result = chicks_collection.update_one(
-        {"id": chick_id}, 
-        {"$set": chick_dict}
-    )
+    result = await update_document(chicks_collection, chick_id, chick_dict)
     if result.modified_count:
         return {"message": "Chick updated successfully"}
     raise HTTPException(status_code=404, detail="Chick not found")
 
+@app.delete("/api/chicks/{chick_id}")
+async def delete_chick(chick_id: str):
+    """Delete a chick (only if it is not registered as a bird and has no transactions)"""
+    chick = await chicks_collection.find_one({"id": chick_id}, {"_id": 1})
+    if not chick:
+        raise HTTPException(status_code=404, detail="Chick not found")
+    
+    # A bird registered from the chick shares its id and reaches its parents through it
+    if await birds_collection.find_one({"id": chick_id}, {"_id": 1}):
+        raise HTTPException(status_code=400, detail="Cannot delete chick. It is registered as a bird.")
+    transaction_count = await transactions_collection.count_documents({"chick_id": chick_id})
+    if transaction_count > 0:
+        raise HTTPException(status_code=400, detail=f"Cannot delete chick. {transaction_count} transactions still refer to it.")
+    
+    result = await delete_document(chicks_collection, chick_id)
+    if result.deleted_count:
+        return {"message": "Chick deleted successfully"}
+    raise HTTPException(status_code=404, detail="Chick not found")
+
 # Transaction endpoints
 @app.post("/api/transactions")
 async def create_transaction(transaction: Transaction):
@@ -755,19 +1943,26 @@ async def create_transaction(transaction: Transaction):
     transaction_dict["id"] = str(uuid.uuid4())
     transaction_dict["created_at"] = datetime.now().isoformat()
     
-    result = transactions_collection.insert_one(transaction_dict)
+    result = await insert_document(transactions_collection, transaction_dict)
     if result.inserted_id:
         return {"message": "Transaction created successfully", "transaction_id": transaction_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create transaction")
 
 @app.get("/api/transactions")
-async def get_transactions():
-    transactions = list(transactions_collection.find({}, {"_id": 0}))
-    return {"transactions": transactions}
+@conditional_get([transactions_collection])
+async def get_transactions(limit: int = None, after: str = None, fields: str = None):
+    transactions, next_cursor = await find_page(
+        transactions_collection, {}, [("_id", 1)], limit=limit, after=after, fields=fields
+    )
+    
+    response = {"transactions": transactions}
+    if limit:
+        response["next_cursor"] = next_cursor
+    return response
 
 @app.get("/api/transactions/{transaction_id}")
 async def get_transaction(transaction_id: str):
-    transaction = transactions_collection.find_one({"id": transaction_id}, {"_id": 0})
+    transaction = await transactions_collection.find_one({"id": transaction_id}, {"_id": 0})
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     return transaction
@@ -777,17 +1972,14 @@ async def update_transaction(transaction_id: str, transaction: Transaction):
     transaction_dict = transaction.dict()
     transaction_dict["id"] = transaction_id
     
-    result = transactions_collection.update_one(
-        {"id": transaction_id}, 
-        {"$set": transaction_dict}
-    )
+    result = await update_document(transactions_collection, transaction_id, transaction_dict)
     if result.modified_count:
         return {"message": "Transaction updated successfully"}
     raise HTTPException(status_code=404, detail="Transaction not found")
 
 @app.delete("/api/transactions/{transaction_id}")
 async def delete_transaction(transaction_id: str):
-    result = transactions_collection.delete_one({"id": transaction_id})
+    result = await delete_document(transactions_collection, transaction_id)
     if result.deleted_count:
         return {"message": "Transaction deleted successfully"}
     raise HTTPException(status_code=404, detail="Transaction not found")
@@ -796,7 +1988,7 @@ async def delete_transaction(transaction_id: str):
 @app.post("/api/breeding-records")
 async def create_breeding_record(record: BreedingRecord):
     # Check if breeding pair exists
-    pair = breeding_pairs_collection.find_one({"id": record.breeding_pair_id})
+    pair = await find_by_id(breeding_pairs_collection, record.breeding_pair_id)
     if not pair:
         raise HTTPException(status_code=404, detail="Breeding pair not found")
     
@@ -804,38 +1996,32 @@ async def create_breeding_record(record: BreedingRecord):
     record_dict["id"] = str(uuid.uuid4())
     record_dict["created_at"] = datetime.now().isoformat()
     
-    result = breeding_records_collection.insert_one(record_dict)
+    result = await insert_document(breeding_records_collection, record_dict)
     if result.inserted_id:
         return {"message": "Breeding record created successfully", "record_id": record_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create breeding record")
 
 @app.get("/api/breeding-records")
+@conditional_get([breeding_records_collection, *PAIR_SOURCES])
 async def get_breeding_records():
-    records = list(breeding_records_collection.find({}, {"_id": 0}))
+    records = await breeding_records_collection.find({}, {"_id": 0}).to_list(None)
     
     # Enrich with breeding pair details
-    for record in records:
-        pair = breeding_pairs_collection.find_one({"id": record["breeding_pair_id"]}, {"_id": 0})
-        if pair:
-            male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-            female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
-            pair["male_bird"] = male_bird
-            pair["female_bird"] = female_bird
-        record["breeding_pair"] = pair
+    await attach_breeding_pairs(records)
     
     return {"breeding_records": records}
 
 @app.get("/api/breeding-records/{record_id}")
 async def get_breeding_record(record_id: str):
-    record = breeding_records_collection.find_one({"id": record_id}, {"_id": 0})
+    record = await breeding_records_collection.find_one({"id": record_id}, {"_id": 0})
     if not record:
         raise HTTPException(status_code=404, detail="Breeding record not found")
     
     # Enrich with breeding pair details
-    pair = breeding_pairs_collection.find_one({"id": record["breeding_pair_id"]}, {"_id": 0})
+    pair = await find_by_id(breeding_pairs_collection, record["breeding_pair_id"])
     if pair:
-        male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-        female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
+        male_bird = await birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
+        female_bird = await birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
         pair["male_bird"] = male_bird
         pair["female_bird"] = female_bird
     record["breeding_pair"] = pair
@@ -851,65 +2037,72 @@ async def update_breeding_record(record_id: str, record: BreedingRecord):
     if record_dict.get("eggs_laid") and record_dict.get("hatched_count") is not None:
         record_dict["hatch_success_rate"] = (record_dict["hatched_count"] / record_dict["eggs_laid"]) * 100
     
-    result = breeding_records_collection.update_one(
-        {"id": record_id}, 
-        {"$set": record_dict}
-    )
+    result = await update_document(breeding_records_collection, record_id, record_dict)
     if result.modified_count:
         return {"message": "Breeding record updated successfully"}
     raise HTTPException(status_code=404, detail="Breeding record not found")
 
 # Reports endpoints
 @app.get("/api/reports/breeding")
+@conditional_get(CLUTCH_SOURCES)
+@cached_response("breeding_report", [clutches_collection, breeding_pairs_collection, birds_collection])
 async def get_breeding_report():
-    # Get all clutches and calculate statistics
-    clutches = list(clutches_collection.find({}, {"_id": 0}))
-    
-    total_clutches = len(clutches)
-    total_eggs = sum(clutch.get("eggs_laid", 0) for clutch in clutches)
-    total_hatched = sum(clutch.get("hatched_count", 0) for clutch in clutches)
+    # Clutch totals per breeding pair, summed server-side in a single pass
+    clutch_totals = await clutches_collection.aggregate([
+        {"$group": {
+            "_id": "$breeding_pair_id",
+            "clutches": {"$sum": 1},
+            "eggs_laid": {"$sum": {"$ifNull": ["$eggs_laid", 0]}},
+            "hatched": {"$sum": {"$ifNull": ["$hatched_count", 0]}}
+        }}
+    ]).to_list(None)
+    totals_by_pair = {group["_id"]: group for group in clutch_totals}
+    
+    total_clutches = sum(group["clutches"] for group in clutch_totals)
+    total_eggs = sum(group["eggs_laid"] for group in clutch_totals)
+    total_hatched = sum(group["hatched"] for group in clutch_totals)
     
     overall_success_rate = (total_hatched / total_eggs * 100) if total_eggs > 0 else 0
     
     # Get breeding pairs performance
     pair_stats = []
-    pairs = list(breeding_pairs_collection.find({}, {"_id": 0}))
+    species_stats = {}
+    pairs = await breeding_pairs_collection.find({}, {"_id": 0}).to_list(None)
+    birds = await load_by_ids(
+        birds_collection,
+        [pair["male_bird_id"] for pair in pairs] + [pair["female_bird_id"] for pair in pairs]
+    )
+    no_clutches = {"clutches": 0, "eggs_laid": 0, "hatched": 0}
     
     for pair in pairs:
-        pair_clutches = [c for c in clutches if c["breeding_pair_id"] == pair["id"]]
-        pair_eggs = sum(c.get("eggs_laid", 0) for c in pair_clutches)
-        pair_hatched = sum(c.get("hatched_count", 0) for c in pair_clutches)
+        pair_totals = totals_by_pair.get(pair["id"], no_clutches)
+        pair_eggs = pair_totals["eggs_laid"]
+        pair_hatched = pair_totals["hatched"]
         pair_success_rate = (pair_hatched / pair_eggs * 100) if pair_eggs > 0 else 0
         
-        male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-        female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
+        male_bird = birds.get(pair["male_bird_id"])
+        female_bird = birds.get(pair["female_bird_id"])
         
         pair_stats.append({
             "pair_name": pair["pair_name"],
             "male_bird": f"{male_bird['species']} - {male_bird.get('ring_number', 'No Ring')}" if male_bird else "Unknown",
             "female_bird": f"{female_bird['species']} - {female_bird.get('ring_number', 'No Ring')}" if female_bird else "Unknown",
-            "clutches": len(pair_clutches),
+            "clutches": pair_totals["clutches"],
             "eggs_laid": pair_eggs,
             "hatched": pair_hatched,
             "success_rate": round(pair_success_rate, 2)
         })
-    
-    # Species performance analysis
-    species_stats = {}
-    for pair in pairs:
-        male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-        female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
         
+        # Species performance analysis
         if male_bird and female_bird:
             species_key = f"{male_bird['species']} × {female_bird['species']}"
             if species_key not in species_stats:
                 species_stats[species_key] = {"clutches": 0, "eggs": 0, "hatched": 0, "pairs": 0}
             
             species_stats[species_key]["pairs"] += 1
-            pair_clutches = [c for c in clutches if c["breeding_pair_id"] == pair["id"]]
-            species_stats[species_key]["clutches"] += len(pair_clutches)
-            species_stats[species_key]["eggs"] += sum(c.get("eggs_laid", 0) for c in pair_clutches)
-            species_stats[species_key]["hatched"] += sum(c.get("hatched_count", 0) for c in pair_clutches)
+            species_stats[species_key]["clutches"] += pair_totals["clutches"]
+            species_stats[species_key]["eggs"] += pair_eggs
+            species_stats[species_key]["hatched"] += pair_hatched
     
     # Calculate success rates for species
     for species in species_stats:
@@ -934,22 +2127,22 @@ async def get_breeding_report():
 @app.get("/api/genealogy/{bird_id}")
 async def get_bird_genealogy(bird_id: str):
     """Get genealogy information for a bird"""
-    def get_parents(bird_id):
+    async def get_parents(bird_id):
         # Find clutch this bird came from
-        chick = chicks_collection.find_one({"id": bird_id}, {"_id": 0})
+        chick = await chicks_collection.find_one({"id": bird_id}, {"_id": 0})
         if not chick:
             return None
             
-        clutch = clutches_collection.find_one({"id": chick["clutch_id"]}, {"_id": 0})
+        clutch = await clutches_collection.find_one({"id": chick["clutch_id"]}, {"_id": 0})
         if not clutch:
             return None
             
-        pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
+        pair = await find_by_id(breeding_pairs_collection, clutch["breeding_pair_id"])
         if not pair:
             return None
             
-        male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-        female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
+        male_bird = await birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
+        female_bird = await birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
         
         return {
             "father": male_bird,
@@ -958,27 +2151,33 @@ async def get_bird_genealogy(bird_id: str):
             "clutch": clutch
         }
     
-    def get_offspring(bird_id):
+    async def get_offspring(bird_id):
         # Find all pairs this bird is part of
-        pairs = list(breeding_pairs_collection.find({
+        pairs = await breeding_pairs_collection.find({
             "$or": [{"male_bird_id": bird_id}, {"female_bird_id": bird_id}]
-        }, {"_id": 0}))
+        }, {"_id": 0}).to_list(None)
+        pair_position = {pair["id"]: i for i, pair in enumerate(pairs)}
         
-        offspring = []
-        for pair in pairs:
-            clutches = list(clutches_collection.find({"breeding_pair_id": pair["id"]}, {"_id": 0}))
-            for clutch in clutches:
-                chicks = list(chicks_collection.find({"clutch_id": clutch["id"]}, {"_id": 0}))
-                offspring.extend(chicks)
+        # One query for all clutches and one for all chicks, kept in pair then clutch order
+        clutches = await clutches_collection.find(
+            {"breeding_pair_id": {"$in": list(pair_position)}}, {"_id": 0, "id": 1, "breeding_pair_id": 1}
+        ).to_list(None)
+        clutches.sort(key=lambda clutch: pair_position[clutch["breeding_pair_id"]])
+        clutch_position = {clutch["id"]: i for i, clutch in enumerate(clutches)}
+        
+        offspring = await chicks_collection.find(
+            {"clutch_id": {"$in": list(clutch_position)}}, {"_id": 0}
+        ).to_list(None)
+        offspring.sort(key=lambda chick: clutch_position[chick["clutch_id"]])
         
         return offspring
     
-    bird = birds_collection.find_one({"id": bird_id}, {"_id": 0})
+    bird = await birds_collection.find_one({"id": bird_id}, {"_id": 0})
     if not bird:
         raise HTTPException(status_code=404, detail="Bird not found")
     
-    parents = get_parents(bird_id)
-    offspring = get_offspring(bird_id)
+    parents = await get_parents(bird_id)
+    offspring = await get_offspring(bird_id)
     
     return {
         "bird": bird,
@@ -986,7 +2185,415 @@ async def get_bird_genealogy(bird_id: str):
         "offspring": offspring
     }
 
+# Genealogy tree: batched breadth-first traversal, one aggregation per generation
+MAX_GENEALOGY_DEPTH = 10
+GENEALOGY_NODE_FIELDS = ["species", "gender", "ring_number", "color_mutation", "status", "birth_date", "hatch_date"]
+
+async def parent_links(child_ids=None):
+    """chick id -> clutch -> breeding pair for a whole generation of children (every chick when None)"""
+    return await chicks_collection.aggregate([
+        {"$match": {} if child_ids is None else {"id": {"$in": child_ids}}},
+        {"$lookup": {"from": clutches_collection.name, "localField": "clutch_id", "foreignField": "id", "as": "clutch"}},
+        {"$unwind": "$clutch"},
+        {"$lookup": {"from": breeding_pairs_collection.name, "localField": "clutch.breeding_pair_id", "foreignField": "id", "as": "pair"}},
+        {"$unwind": "$pair"},
+        {"$project": {
+            "_id": 0, "child": "$id", "clutch_id": "$clutch.id", "pair_id": "$pair.id",
+            "male": "$pair.male_bird_id", "female": "$pair.female_bird_id"
+        }}
+    ]).to_list(None)
+
+async def child_links(parent_ids):
+    """breeding pairs of the parents -> clutches -> chicks for a whole generation of parents"""
+    return await breeding_pairs_collection.aggregate([
+        {"$match": {"$or": [{"male_bird_id": {"$in": parent_ids}}, {"female_bird_id": {"$in": parent_ids}}]}},
+        {"$lookup": {"from": clutches_collection.name, "localField": "id", "foreignField": "breeding_pair_id", "as": "clutch"}},
+        {"$unwind": "$clutch"},
+        {"$lookup": {"from": chicks_collection.name, "localField": "clutch.id", "foreignField": "clutch_id", "as": "chick"}},
+        {"$unwind": "$chick"},
+        {"$project": {
+            "_id": 0, "child": "$chick.id", "clutch_id": "$clutch.id", "pair_id": "$id",
+            "male": "$male_bird_id", "female": "$female_bird_id"
+        }}
+    ]).to_list(None)
+
+@app.get("/api/genealogy/{bird_id}/tree")
+async def get_genealogy_tree(bird_id: str, depth: int = 3, direction: str = "both"):
+    """Multi-generation pedigree as de-duplicated nodes and parent->child edges"""
+    if direction not in ("both", "ancestors", "descendants"):
+        raise HTTPException(status_code=400, detail="direction must be 'both', 'ancestors' or 'descendants'")
+    depth = max(1, min(depth, MAX_GENEALOGY_DEPTH))
+    
+    generations = {bird_id: 0}
+    edges = {}
+    
+    def add_links(links, level, parents_are_frontier):
+        next_frontier = []
+        for link in links:
+            for role, parent in (("father", link["male"]), ("mother", link["female"])):
+                if not parent:
+                    continue
+                edges.setdefault((parent, link["child"]), {
+                    "parent": parent, "child": link["child"], "role": role,
+                    "pair_id": link["pair_id"], "clutch_id": link["clutch_id"]
+                })
+                # Ancestors move one generation up; co-parents of descendants sit beside the frontier
+                if parent not in generations:
+                    generations[parent] = -level if parents_are_frontier else level - 1
+                    if parents_are_frontier:
+                        next_frontier.append(parent)
+            if not parents_are_frontier and link["child"] not in generations:
+                generations[link["child"]] = level
+                next_frontier.append(link["child"])
+        return next_frontier
+    
+    if direction in ("both", "ancestors"):
+        frontier = [bird_id]
+        for level in range(1, depth + 1):
+            if not frontier:
+                break
+            frontier = add_links(await parent_links(frontier), level, parents_are_frontier=True)
+    
+    if direction in ("both", "descendants"):
+        frontier = [bird_id]
+        for level in range(1, depth + 1):
+            if not frontier:
+                break
+            frontier = add_links(await child_links(frontier), level, parents_are_frontier=False)
+    
+    # Node details: birds first, chicks for ids that are not (yet) registered birds
+    docs = await load_by_ids(birds_collection, list(generations))
+    kinds = {doc_id: "bird" for doc_id in docs}
+    chicks = await load_by_ids(chicks_collection, [i for i in generations if i not in docs])
+    docs.update(chicks)
+    kinds.update({doc_id: "chick" for doc_id in chicks})
+    
+    if bird_id not in docs:
+        raise HTTPException(status_code=404, detail="Bird not found")
+    
+    nodes = []
+    for node_id, generation in sorted(generations.items(), key=lambda item: item[1]):
+        doc = docs.get(node_id, {})
+        node = {"id": node_id, "kind": kinds.get(node_id, "unknown"), "generation": generation}
+        node.update({field: doc[field] for field in GENEALOGY_NODE_FIELDS if doc.get(field) is not None})
+        nodes.append(node)
+    
+    return {
+        "root": bird_id,
+        "depth": depth,
+        "nodes": nodes,
+        "edges": list(edges.values()),
+        "stats": {
+            "nodes": len(nodes),
+            "edges": len(edges),
+            "ancestors": len([g for g in generations.values() if g < 0]),
+            "descendants": len([g for g in generations.values() if g > 0])
+        }
+    }
+
+# Pedigree engine: in-memory parent index with memoized kinship
+class PedigreeIndex:
+    """Compact id -> (sire, dam) index over chicks, clutches and breeding pairs.
+    
+    Kinship uses the recursive definition, always expanding the individual with
+    the deeper pedigree (which cannot be an ancestor of the other), memoized per
+    unordered pair. New chicks are added incrementally by the write helpers; edits
+    that re-parent existing individuals mark the index stale, and refresh_interval
+    bounds how long writes made by other workers can go unseen.
+    """
+    
+    def __init__(self, refresh_interval):
+        self.refresh_interval = refresh_interval
+        self.parents = {}
+        self.referenced = set()
+        self.depths = {}
+        self.kinships = {}
+        self.loaded_at = None
+        self.stale = True
+        self.lock = asyncio.Lock()
+    
+    async def ensure_loaded(self):
+        if not self.stale and time.monotonic() - self.loaded_at < self.refresh_interval:
+            return
+        async with self.lock:
+            if not self.stale and time.monotonic() - self.loaded_at < self.refresh_interval:
+                return
+            links = await parent_links()
+            self.parents, self.referenced = {}, set()
+            self.add_links(links)
+            self.clear_memo()
+            self.loaded_at = time.monotonic()
+            self.stale = False
+    
+    def add_links(self, links):
+        for link in links:
+            self.parents[link["child"]] = (link["male"], link["female"])
+            self.referenced.update(parent for parent in (link["male"], link["female"]) if parent)
+    
+    def clear_memo(self):
+        self.depths.clear()
+        self.kinships.clear()
+    
+    async def record_writes(self, collection, before, after):
+        """Keep a loaded index in step with a batch of writes"""
+        if self.stale:
+            return
+        if collection.name == chicks_collection.name:
+            previous = {doc.get("id"): doc.get("clutch_id") for doc in before}
+            changed = [doc["id"] for doc in after if previous.get(doc.get("id"), object()) != doc.get("clutch_id")]
+            removed = [doc_id for doc_id in previous if doc_id not in {doc.get("id") for doc in after}]
+            # A brand-new leaf changes no existing kinship; re-parenting a known individual does
+            if any(doc_id in self.parents or doc_id in self.referenced for doc_id in changed + removed):
+                self.clear_memo()
+            for doc_id in changed + removed:
+                self.parents.pop(doc_id, None)
+            if changed:
+                self.add_links(await parent_links(changed))
+        elif collection.name == clutches_collection.name:
+            after_by_id = {doc.get("id"): doc for doc in after}
+            if any(after_by_id.get(doc.get("id"), {}).get("breeding_pair_id") != doc.get("breeding_pair_id") for doc in before):
+                self.stale = True
+        elif collection.name == breeding_pairs_collection.name:
+            after_by_id = {doc.get("id"): doc for doc in after}
+            for doc in before:
+                new = after_by_id.get(doc.get("id"), {})
+                if (new.get("male_bird_id"), new.get("female_bird_id")) != (doc.get("male_bird_id"), doc.get("female_bird_id")):
+                    self.stale = True
+    
+    def depth(self, individual):
+        """Generations of known ancestry above the individual"""
+        if individual not in self.depths:
+            self.depths[individual] = 0  # guards against cyclic records
+            sire, dam = self.parents.get(individual, (None, None))
+            self.depths[individual] = 1 + max(self.depth(sire), self.depth(dam)) if individual in self.parents else 0
+        return self.depths[individual]
+    
+    def kinship(self, a, b):
+        """Probability that alleles drawn at random from a and b are identical by descent"""
+        if a is None or b is None:
+            return 0.0
+        if a == b:
+            return 0.5 * (1 + self.inbreeding(a))
+        key = (a, b) if a < b else (b, a)
+        if key not in self.kinships:
+            if self.depth(a) < self.depth(b):
+                a, b = b, a
+            sire, dam = self.parents.get(a, (None, None))
+            self.kinships[key] = 0.5 * (self.kinship(sire, b) + self.kinship(dam, b))
+        return self.kinships[key]
+    
+    def inbreeding(self, individual):
+        """Wright's inbreeding coefficient: the kinship of the individual's parents"""
+        sire, dam = self.parents.get(individual, (None, None))
+        return self.kinship(sire, dam)
+    
+    def ancestors(self, individual):
+        found, frontier = set(), [individual]
+        while frontier:
+            parents = [p for child in frontier for p in self.parents.get(child, ()) if p and p not in found]
+            found.update(parents)
+            frontier = parents
+        return found
+    
+    def metrics(self):
+        return {
+            "individuals": len(self.parents),
+            "memoized_kinships": len(self.kinships),
+            "stale": self.stale,
+            "refresh_interval_seconds": self.refresh_interval
+        }
+
+pedigree_index = PedigreeIndex(refresh_interval=float(os.environ.get('PEDIGREE_REFRESH_INTERVAL', '60')))
+
+@app.get("/api/genetics/kinship")
+async def get_kinship(male: str, female: str):
+    """Kinship of two candidates, i.e. the inbreeding coefficient of their offspring"""
+    if male == female:
+        raise HTTPException(status_code=400, detail="Male and female must be different birds")
+    birds = await load_by_ids(birds_collection, [male, female])
+    for bird_id in (male, female):
+        if bird_id not in birds:
+            raise HTTPException(status_code=404, detail=f"Bird {bird_id} not found")
+    
+    await pedigree_index.ensure_loaded()
+    kinship = pedigree_index.kinship(male, female)
+    common = pedigree_index.ancestors(male) & pedigree_index.ancestors(female)
+    return {
+        "male": male,
+        "female": female,
+        "kinship": round(kinship, 6),
+        "offspring_inbreeding": round(kinship, 6),
+        "male_inbreeding": round(pedigree_index.inbreeding(male), 6),
+        "female_inbreeding": round(pedigree_index.inbreeding(female), 6),
+        "common_ancestors": sorted(common)
+    }
+
+# Pair recommendations: every eligible male x female combination scored at once
+RECOMMENDATION_WEIGHTS = {"kinship": 0.4, "clutch_success": 0.3, "age": 0.2, "color_mutation": 0.1}
+DEFAULT_MAX_KINSHIP = 0.0625  # first cousins
+CLUTCH_SUCCESS_PRIOR_EGGS = 5  # pseudo-eggs pulling birds with little history towards the overall hatch rate
+
+def age_in_months(birth_date, today):
+    try:
+        born = datetime.strptime(birth_date, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+    return (today.year - born.year) * 12 + today.month - born.month - (today.day < born.day)
+
+async def bird_hatch_rates(bird_ids):
+    """Smoothed hatched/eggs ratio per bird over all clutches of all its pairs"""
+    pairs = await breeding_pairs_collection.find(
+        {"$or": [{"male_bird_id": {"$in": bird_ids}}, {"female_bird_id": {"$in": bird_ids}}]},
+        {"_id": 0, "id": 1, "male_bird_id": 1, "female_bird_id": 1}
+    ).to_list(None)
+    totals = await clutches_collection.aggregate([
+        {"$match": {"breeding_pair_id": {"$in": [pair["id"] for pair in pairs]}}},
+        {"$group": {"_id": "$breeding_pair_id", "eggs": {"$sum": "$eggs_laid"}, "hatched": {"$sum": "$hatched_count"}}}
+    ]).to_list(None)
+    totals = {row["_id"]: row for row in totals}
+    
+    eggs, hatched = {}, {}
+    for pair in pairs:
+        row = totals.get(pair["id"], {})
+        for bird_id in (pair["male_bird_id"], pair["female_bird_id"]):
+            eggs[bird_id] = eggs.get(bird_id, 0) + (row.get("eggs") or 0)
+            hatched[bird_id] = hatched.get(bird_id, 0) + (row.get("hatched") or 0)
+    
+    all_eggs = sum(row.get("eggs") or 0 for row in totals.values())
+    overall = sum(row.get("hatched") or 0 for row in totals.values()) / all_eggs if all_eggs else 0.5
+    return np.array([
+        (hatched.get(bird_id, 0) + overall * CLUTCH_SUCCESS_PRIOR_EGGS) / (eggs.get(bird_id, 0) + CLUTCH_SUCCESS_PRIOR_EGGS)
+        for bird_id in bird_ids
+    ])
+
+def kinship_matrix(male_ids, female_ids):
+    """Kinship for every male x female, only recursing for pairs that share an ancestor"""
+    lineages = {bird_id: pedigree_index.ancestors(bird_id) | {bird_id} for bird_id in {*male_ids, *female_ids}}
+    shared = set().union(*(lineages[b] for b in male_ids)) & set().union(*(lineages[b] for b in female_ids))
+    kinship = np.zeros((len(male_ids), len(female_ids)))
+    if not shared:
+        return kinship
+    
+    column = {ancestor: i for i, ancestor in enumerate(shared)}
+    def incidence(bird_ids):
+        matrix = np.zeros((len(bird_ids), len(column)), dtype=np.float32)
+        for row, bird_id in enumerate(bird_ids):
+            matrix[row, [column[a] for a in lineages[bird_id] if a in column]] = 1
+        return matrix
+    related = incidence(male_ids) @ incidence(female_ids).T > 0
+    for i, j in zip(*np.nonzero(related)):
+        kinship[i, j] = pedigree_index.kinship(male_ids[i], female_ids[j])
+    return kinship
+
+@app.get("/api/genetics/recommend-pairs")
+async def recommend_pairs(species: str, limit: int = 20, max_kinship: float = DEFAULT_MAX_KINSHIP, color_mutation: str = None):
+    """Rank active, unpaired male x female combinations of a species.
+    
+    Each criterion scores 0..1: kinship (0 at full-sibling level), age (share of
+    species maturity reached, neutral when unknown), smoothed past hatch rate of
+    both birds, and colour mutation (partners with the same mutation, or the
+    share of partners carrying the requested color_mutation).
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    paired = set()
+    async for pair in breeding_pairs_collection.find({"status": "active"}, {"_id": 0, "male_bird_id": 1, "female_bird_id": 1}):
+        paired.update((pair.get("male_bird_id"), pair.get("female_bird_id")))
+    
+    birds = await birds_collection.find(
+        {"species": species, "status": "active", "gender": {"$in": ["male", "female"]}},
+        {"_id": 0, "id": 1, "gender": 1, "birth_date": 1, "color_mutation": 1, "ring_number": 1}
+    ).to_list(None)
+    birds = [bird for bird in birds if bird["id"] not in paired]
+    males = [bird for bird in birds if bird["gender"] == "male"]
+    females = [bird for bird in birds if bird["gender"] == "female"]
+    
+    response = {
+        "species": species,
+        "candidates": {"males": len(males), "females": len(females), "combinations": len(males) * len(females), "eligible": 0},
+        "recommendations": []
+    }
+    if not males or not females:
+        return response
+    
+    species_doc = await species_collection.find_one({"name": species}, {"_id": 0, "maturity_age": 1})
+    maturity = (species_doc or {}).get("maturity_age")
+    today = date.today()
+    def age_scores(group):
+        scores = []
+        for bird in group:
+            months = age_in_months(bird.get("birth_date"), today)
+            scores.append(0.5 if months is None or not maturity else min(max(months, 0) / maturity, 1.0))
+        return np.array(scores)
+    
+    await pedigree_index.ensure_loaded()
+    male_ids = [bird["id"] for bird in males]
+    female_ids = [bird["id"] for bird in females]
+    kinship = kinship_matrix(male_ids, female_ids)
+    hatch_rates = await bird_hatch_rates(male_ids + female_ids)
+    
+    scores = {
+        "kinship": 1 - np.minimum(kinship / 0.25, 1.0),
+        "age": np.outer(age_scores(males), age_scores(females)),
+        "clutch_success": (hatch_rates[:len(males), None] + hatch_rates[None, len(males):]) / 2,
+    }
+    if color_mutation:
+        def carries(group):
+            return np.array([bird.get("color_mutation") == color_mutation for bird in group], dtype=float)
+        scores["color_mutation"] = (carries(males)[:, None] + carries(females)[None, :]) / 2
+    else:
+        codes = np.unique([bird.get("color_mutation") or "" for bird in males + females], return_inverse=True)[1]
+        scores["color_mutation"] = np.where(codes[:len(males), None] == codes[None, len(males):], 1.0, 0.5)
+    
+    total = sum(RECOMMENDATION_WEIGHTS[name] * score for name, score in scores.items())
+    total = np.where(kinship <= max_kinship, total, -np.inf).ravel()
+    best = np.argpartition(-total, min(limit, total.size) - 1)[:limit]
+    best = best[np.argsort(-total[best], kind="stable")]
+    
+    response["candidates"]["eligible"] = int(np.isfinite(total).sum())
+    for flat in best:
+        if not np.isfinite(total[flat]):
+            break
+        i, j = divmod(int(flat), len(females))
+        response["recommendations"].append({
+            "male_bird_id": males[i]["id"],
+            "female_bird_id": females[j]["id"],
+            "male_ring_number": males[i].get("ring_number"),
+            "female_ring_number": females[j].get("ring_number"),
+            "score": round(float(total[flat]), 4),
+            "kinship": round(float(kinship[i, j]), 6),
+            "scores": {name: round(float(score[i, j]), 4) for name, score in scores.items()}
+        })
+    return response
+
 # Search endpoints
+def escaped_regex(text, prefix=False):
+    return {"$regex": ("^" if prefix else "") + re.escape(text), "$options": "" if prefix else "i"}
+
+async def text_search(collection, weights, query, filters):
+    """Documents matching query, best text relevance first.
+    
+    Falls back to an escaped, case-insensitive regex scan over the same fields
+    while the text index is missing (e.g. still building after a deploy).
+    """
+    try:
+        docs = await collection.find(
+            {**filters, "$text": {"$search": query}}, {"_id": 0, "_text_score": {"$meta": "textScore"}}
+        ).sort([("_text_score", {"$meta": "textScore"})]).to_list(None)
+    except OperationFailure:
+        return await collection.find(
+            {**filters, "$or": [{field: escaped_regex(query)} for field in weights]}, {"_id": 0}
+        ).to_list(None)
+    for doc in docs:
+        doc.pop("_text_score", None)
+    return docs
+
+async def ring_number_prefix_search(query, filters):
+    """Birds whose ring number starts with query; anchored case-sensitive regexes use the ring_number index"""
+    variants = {query, query.upper()}
+    return await birds_collection.find(
+        {**filters, "$or": [{"ring_number": escaped_regex(variant, prefix=True)} for variant in variants]}, {"_id": 0}
+    ).sort("ring_number", 1).to_list(None)
+
 @app.get("/api/search")
 async def search_birds_and_pairs(
     query: str = "",
@@ -996,84 +2603,147 @@ async def search_birds_and_pairs(
 ):
     """Advanced search for birds and breeding pairs"""
     results = {"birds": [], "pairs": [], "clutches": []}
+    query = query.strip()
     
     if search_type in ["birds", "all"]:
         # Build bird search filter
         bird_filter = {}
-        if query:
-            bird_filter["$or"] = [
-                {"species": {"$regex": query, "$options": "i"}},
-                {"ring_number": {"$regex": query, "$options": "i"}},
-                {"color_mutation": {"$regex": query, "$options": "i"}},
-                {"notes": {"$regex": query, "$options": "i"}}
-            ]
         if species:
             bird_filter["species"] = species
         if status:
             bird_filter["status"] = status
-            
-        results["birds"] = list(birds_collection.find(bird_filter, {"_id": 0}))
+        
+        if query:
+            # Ring number prefix matches rank above text matches
+            birds = await ring_number_prefix_search(query, bird_filter)
+            seen = {bird["id"] for bird in birds}
+            for bird in await text_search(birds_collection, SEARCH_WEIGHTS["birds"], query, bird_filter):
+                if bird["id"] not in seen:
+                    birds.append(bird)
+            results["birds"] = birds
+        else:
+            results["birds"] = await birds_collection.find(bird_filter, {"_id": 0}).to_list(None)
     
     if search_type in ["pairs", "all"]:
         # Search breeding pairs
         pair_filter = {}
-        if query:
-            pair_filter["$or"] = [
-                {"pair_name": {"$regex": query, "$options": "i"}},
-                {"notes": {"$regex": query, "$options": "i"}}
-            ]
         if status:
             pair_filter["status"] = status
-            
-        pairs = list(breeding_pairs_collection.find(pair_filter, {"_id": 0}))
+        
+        if query:
+            pairs = await text_search(breeding_pairs_collection, SEARCH_WEIGHTS["pairs"], query, pair_filter)
+        else:
+            pairs = await breeding_pairs_collection.find(pair_filter, {"_id": 0}).to_list(None)
         
         # Enrich with bird details
-        for pair in pairs:
-            male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-            female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
-            pair["male_bird"] = male_bird
-            pair["female_bird"] = female_bird
+        await attach_pair_birds(pairs)
             
         results["pairs"] = pairs
     
     # Search clutches if query provided
     if query and search_type in ["clutches", "all"]:
-        clutches = list(clutches_collection.find({
-            "$or": [
-                {"notes": {"$regex": query, "$options": "i"}},
-                {"status": {"$regex": query, "$options": "i"}}
-            ]
-        }, {"_id": 0}))
+        clutches = await text_search(clutches_collection, SEARCH_WEIGHTS["clutches"], query, {})
         
         # Enrich with pair details
-        for clutch in clutches:
-            pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
-            if pair:
-                male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-                female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
-                pair["male_bird"] = male_bird
-                pair["female_bird"] = female_bird
-            clutch["breeding_pair"] = pair
+        await attach_breeding_pairs(clutches)
             
         results["clutches"] = clutches
     
     return results
 
+# Type-ahead suggestions: anchored prefix scans over single-field indexes
+# field -> (collection, document field)
+SUGGEST_FIELDS = {
+    "ring_number": (birds_collection, "ring_number"),
+    "pair_name": (breeding_pairs_collection, "pair_name"),
+    "customer_name": (permits_collection, "customer_name"),
+    "species": (species_collection, "name"),
+}
+MAX_SUGGESTIONS = 50
+
+@app.get("/api/suggest")
+async def suggest(field: str, prefix: str = "", limit: int = 10):
+    """Distinct values of field starting with prefix, in index order.
+    
+    Anchored regexes are case-sensitive to stay index-bounded, so the common
+    spellings of the prefix (as typed, lower, upper, title case) are merged.
+    """
+    if field not in SUGGEST_FIELDS:
+        raise HTTPException(status_code=400, detail=f"field must be one of: {', '.join(SUGGEST_FIELDS)}")
+    collection, doc_field = SUGGEST_FIELDS[field]
+    limit = max(1, min(limit, MAX_SUGGESTIONS))
+    prefix = prefix.strip()
+    
+    if prefix:
+        variants = {prefix, prefix.lower(), prefix.upper(), prefix.title()}
+        query = {"$or": [{doc_field: escaped_regex(variant, prefix=True)} for variant in variants]}
+    else:
+        query = {doc_field: {"$type": "string"}}
+    
+    suggestions = []
+    cursor = collection.find(query, {"_id": 0, doc_field: 1}).sort(doc_field, 1).batch_size(limit * 2)
+    async for doc in cursor:
+        value = doc.get(doc_field)
+        if value and value not in suggestions:
+            suggestions.append(value)
+            if len(suggestions) == limit:
+                break
+    await cursor.close()
+    return {"field": field, "prefix": prefix, "suggestions": suggestions}
+
+# Collections whose writes can change the notification list
+NOTIFICATION_SOURCES = [
+    clutches_collection,
+    artificial_incubation_collection,
+    breeding_pairs_collection,
+    incubators_collection,
+    license_collection,
+]
+
 @app.get("/api/notifications")
-async def get_notifications():
-    """Get upcoming hatching notifications and license alerts"""
-    notifications = []
+@conditional_get(NOTIFICATION_SOURCES, daily=True)
+async def get_notifications(since: str = None):
+    """Get upcoming hatching notifications and license alerts.
+    
+    Pass the generated_at of a previous response as since= to get {"changed": false}
+    without recomputing when nothing relevant has been written and the day has not rolled over.
+    """
     today = datetime.now().date()
     
+    if since:
+        try:
+            since_time = datetime.fromisoformat(since)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="since must be an ISO timestamp")
+        if since_time.date() == today and not await collections_modified_since(NOTIFICATION_SOURCES, since_time):
+            return {"changed": False, "generated_at": since}
+    
+    return await build_notifications()
+
+@cached_response("notifications", NOTIFICATION_SOURCES, daily=True)
+async def build_notifications():
+    generated_at = datetime.now()
+    today = generated_at.date()
+    notifications = []
+    
+    # Hatching window (1 day overdue to 7 days ahead) as an indexed expected_hatch_date range
+    hatch_window = {
+        "$gte": (today - timedelta(days=1)).strftime("%Y-%m-%d"),
+        "$lte": (today + timedelta(days=7)).strftime("%Y-%m-%d")
+    }
+    
     # Hatching notifications (eggs due to hatch in next 7 days)
-    clutches = list(clutches_collection.find({"status": "incubating"}, {"_id": 0}))
+    clutches = await clutches_collection.find(
+        {"status": "incubating", "expected_hatch_date": hatch_window}, {"_id": 0}
+    ).to_list(None)
+    pairs = await load_by_ids(breeding_pairs_collection, [c["breeding_pair_id"] for c in clutches])
     
     for clutch in clutches:
         expected_hatch = datetime.strptime(clutch["expected_hatch_date"], "%Y-%m-%d").date()
         days_until_hatch = (expected_hatch - today).days
         
         if -1 <= days_until_hatch <= 7:  # Include 1 day overdue
-            pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
+            pair = pairs.get(clutch["breeding_pair_id"])
             
             notification_type = "overdue" if days_until_hatch < 0 else "due_soon" if days_until_hatch <= 2 else "upcoming"
             
@@ -1092,15 +2762,17 @@ async def get_notifications():
             })
     
     # Artificial incubation notifications
-    artificial_incubations = list(artificial_incubation_collection.find({"status": "incubating"}, {"_id": 0}))
+    artificial_incubations = await artificial_incubation_collection.find(
+        {"status": "incubating", "expected_hatch_date": hatch_window}, {"_id": 0}
+    ).to_list(None)
+    incubators = await load_by_ids(incubators_collection, [i["incubator_id"] for i in artificial_incubations])
     
     for incubation in artificial_incubations:
         expected_hatch = datetime.strptime(incubation["expected_hatch_date"], "%Y-%m-%d").date()
         days_until_hatch = (expected_hatch - today).days
         
         if -1 <= days_until_hatch <= 7:  # Include 1 day overdue
-            clutch = clutches_collection.find_one({"id": incubation["clutch_id"]}, {"_id": 0})
-            incubator = incubators_collection.find_one({"id": incubation["incubator_id"]}, {"_id": 0})
+            incubator = incubators.get(incubation["incubator_id"])
             
             notification_type = "overdue" if days_until_hatch < 0 else "due_soon" if days_until_hatch <= 2 else "upcoming"
             
@@ -1122,7 +2794,7 @@ async def get_notifications():
     license_alerts = []
     
     # Check main license
-    main_license = license_collection.find_one({}, {"_id": 0})
+    main_license = await license_collection.find_one({}, {"_id": 0})
     if main_license and main_license.get("expiry_date"):
         expiry_date = datetime.strptime(main_license["expiry_date"], "%Y-%m-%d").date()
         days_until_expiry = (expiry_date - today).days
@@ -1157,61 +2829,595 @@ async def get_notifications():
             "hatching": len([n for n in notifications if n["type"] == "hatching"]),
             "artificial_hatching": len([n for n in notifications if n["type"] == "artificial_hatching"]),
             "license": len([n for n in notifications if n["type"] == "license"])
-        }
+        },
+        "changed": True,
+        "generated_at": generated_at.isoformat()
     }
 
+# Notification stream (Server-Sent Events)
+NOTIFICATION_POLL_INTERVAL = float(os.environ.get('NOTIFICATION_POLL_INTERVAL', '5'))
+NOTIFICATION_KEEPALIVE_INTERVAL = 15
+NOTIFICATION_MAX_RETRY_DELAY = 60
+
+def notification_key(notification):
+    data = notification["data"]
+    return f"{notification['type']}:{data.get('clutch_id') or data.get('incubation_id') or data.get('license_number')}"
+
+class NotificationBroadcaster:
+    """One watcher per worker: recomputes notifications when a source collection's
+    version changes (change streams, or polling the versions on a standalone mongod)
+    and hands the latest result to every connected stream."""
+    
+    def __init__(self):
+        self.subscribers = set()
+        self.latest = None
+        self.task = None
+        self.refreshes = 0
+    
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=1)
+        self.subscribers.add(queue)
+        if self.latest:
+            queue.put_nowait(self.latest)
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return queue
+    
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+    
+    def broadcast(self, result):
+        self.latest = result
+        for queue in self.subscribers:
+            # Subscribers only need the newest result; drop one they have not read yet
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(result)
+    
+    async def refresh(self, force=False):
+        since = None if force or not self.latest else self.latest["generated_at"]
+        result = await get_notifications(since=since)
+        self.refreshes += 1
+        if result["changed"]:
+            self.broadcast(result)
+    
+    async def run(self):
+        """Watch (or poll) while anyone is subscribed; errors are logged and retried with backoff"""
+        use_change_stream = True
+        delay = NOTIFICATION_POLL_INTERVAL
+        while self.subscribers:
+            refreshes = self.refreshes
+            try:
+                if use_change_stream:
+                    await self.watch_change_stream()
+                else:
+                    await self.poll()
+                return
+            except Exception as e:
+                if isinstance(e, OperationFailure) and use_change_stream and self.refreshes == refreshes:
+                    # The server refused to open the stream: change streams need a replica set,
+                    # fall back to polling collection versions
+                    use_change_stream = False
+                    continue
+                if self.refreshes != refreshes:
+                    # The failure ended a working stream rather than repeating the last one
+                    delay = NOTIFICATION_POLL_INTERVAL
+                logger.exception("Notification refresh failed; retrying in %ss", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, NOTIFICATION_MAX_RETRY_DELAY)
+    
+    async def watch_change_stream(self):
+        # Watch the version bumps rather than the data writes themselves: they land after
+        # the write, so the recomputed (and cached) notifications already include it
+        pipeline = [{"$match": {
+            "ns.coll": collection_versions_collection.name,
+            "documentKey._id": {"$in": [c.name for c in NOTIFICATION_SOURCES]}
+        }}]
+        async with db.watch(pipeline, max_await_time_ms=int(NOTIFICATION_POLL_INTERVAL * 1000)) as stream:
+            await self.refresh(force=True)
+            while self.subscribers:
+                change = await stream.try_next()
+                # No change within the wait still refreshes when the day has rolled over
+                await self.refresh(force=change is not None)
+    
+    async def poll(self):
+        await self.refresh(force=True)
+        while self.subscribers:
+            await asyncio.sleep(NOTIFICATION_POLL_INTERVAL)
+            await self.refresh()
+
+notification_broadcaster = NotificationBroadcaster()
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+@app.get("/api/notifications/stream")
+async def stream_notifications():
+    """Push new, changed and resolved hatch/license alerts as Server-Sent Events"""
+    queue = notification_broadcaster.subscribe()
+    
+    async def events():
+        sent = {}
+        sent_counts = None
+        try:
+            yield f"retry: {NOTIFICATION_KEEPALIVE_INTERVAL * 1000}\n\n"
+            while True:
+                try:
+                    result = await asyncio.wait_for(queue.get(), timeout=NOTIFICATION_KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                
+                current = {notification_key(n): n for n in result["notifications"]}
+                for key, notification in current.items():
+                    if sent.get(key) != notification:
+                        yield sse_event("notification", {"key": key, **notification})
+                for key in sent.keys() - current.keys():
+                    yield sse_event("resolved", {"key": key})
+                if result["counts"] != sent_counts:
+                    yield sse_event("counts", result["counts"])
+                sent = current
+                sent_counts = result["counts"]
+        finally:
+            notification_broadcaster.unsubscribe(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Financial rollups: transaction amounts summed per month, currency, type and category
+BASE_CURRENCY = os.environ.get('BASE_CURRENCY', 'RM')
+FINANCIAL_ROLLUPS_MARKER = "_rebuilt"
+FINANCIAL_PERIODS = {
+    "month": lambda month: month,
+    "quarter": lambda month: f"{month[:4]}-Q{(int(month[5:7]) - 1) // 3 + 1}",
+    "year": lambda month: month[:4],
+}
+# transaction_type -> summary field
+FINANCIAL_TOTALS = {"purchase": "total_purchases", "sale": "total_sales", "expense": "total_expenses"}
+
+def financial_bucket(transaction):
+    return (
+        str(transaction.get("date") or "")[:7],
+        transaction.get("currency") or BASE_CURRENCY,
+        transaction.get("transaction_type"),
+        transaction.get("category") or "Other",
+    )
+
+def financial_group_stage():
+    return {"$group": {
+        "_id": {
+            "month": {"$substrBytes": [{"$ifNull": ["$date", ""]}, 0, 7]},
+            "currency": {"$ifNull": ["$currency", BASE_CURRENCY]},
+            "transaction_type": "$transaction_type",
+            "category": {"$ifNull": ["$category", "Other"]}
+        },
+        "amount": {"$sum": "$amount"},
+        "count": {"$sum": 1}
+    }}
+
+async def update_financial_rollups(collection, before, after):
+    """Apply a batch of transaction writes to the monthly rollups"""
+    if collection.name != transactions_collection.name:
+        return
+    changes = {}
+    for sign, docs in ((-1, before), (1, after)):
+        for doc in docs:
+            change = changes.setdefault(financial_bucket(doc), {"amount": 0.0, "count": 0})
+            change["amount"] += sign * (doc.get("amount") or 0)
+            change["count"] += sign
+    changes = {bucket: change for bucket, change in changes.items() if change["count"] or change["amount"]}
+    if not changes:
+        return
+    await financial_rollups_collection.bulk_write([
+        UpdateOne(
+            {"_id": "|".join(map(str, bucket))},
+            {"$inc": change, "$set": dict(zip(("month", "currency", "transaction_type", "category"), bucket))},
+            upsert=True
+        )
+        for bucket, change in changes.items()
+    ], ordered=False)
+
+async def rebuild_financial_rollups():
+    """Recompute every monthly rollup from the transactions; transaction writes wait until it is done"""
+    async with rebuild_gate.rebuild():
+        groups = await transactions_collection.aggregate([financial_group_stage()]).to_list(None)
+        await financial_rollups_collection.delete_many({})
+        rollups = [
+            {"_id": "|".join(map(str, group["_id"].values())), **group["_id"], "amount": group["amount"], "count": group["count"]}
+            for group in groups
+        ]
+        if rollups:
+            await financial_rollups_collection.insert_many(rollups, ordered=False)
+        await financial_rollups_collection.insert_one({"_id": FINANCIAL_ROLLUPS_MARKER, "rebuilt_at": datetime.now().isoformat()})
+        # Retire financial reports cached or ETagged before the rebuild
+        await bump_version(financial_rollups_collection)
+    return len(rollups)
+
+async def ensure_financial_rollups():
+    try:
+        if not await financial_rollups_collection.find_one({"_id": FINANCIAL_ROLLUPS_MARKER}):
+            await rebuild_financial_rollups()
+    except PyMongoError:
+        # Rebuilt on the first financial report once Mongo is reachable
+        pass
+
+@app.on_event("startup")
+async def ensure_financial_rollups_on_startup():
+    # Build in the background so startup does not grow with the transactions
+    run_in_background(ensure_financial_rollups())
+
+def split_date_range(date_from, date_to):
+    """Whole months inside [date_from, date_to] (read from the rollups) and the leftover
+    day ranges at either end (aggregated from the transactions)"""
+    start = datetime.strptime(date_from, "%Y-%m-%d").date() if date_from else None
+    end = datetime.strptime(date_to, "%Y-%m-%d").date() if date_to else None
+    
+    first_month = None
+    if start:
+        first_month = start.replace(day=1) if start.day == 1 else (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    last_month = None
+    if end:
+        month_start = end.replace(day=1)
+        month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        last_month = month_start if end == month_end else (month_start - timedelta(days=1)).replace(day=1)
+    
+    if first_month and last_month and first_month > last_month:
+        return None, [(date_from, date_to)]
+    
+    months = {}
+    edges = []
+    if first_month:
+        months["$gte"] = first_month.strftime("%Y-%m")
+        if start != first_month:
+            edges.append((date_from, (first_month - timedelta(days=1)).isoformat()))
+    if last_month:
+        months["$lte"] = last_month.strftime("%Y-%m")
+        if last_month.strftime("%Y-%m") != end.strftime("%Y-%m"):
+            edges.append((end.replace(day=1).isoformat(), date_to))
+    return months, edges
+
+async def financial_rows(date_from=None, date_to=None):
+    """(month, currency, transaction_type, category) -> {amount, count} over the date range"""
+    months, edges = split_date_range(date_from, date_to)
+    rows = {}
+    if months is not None:
+        query = {"_id": {"$ne": FINANCIAL_ROLLUPS_MARKER}, "count": {"$gt": 0}}
+        if months:
+            query["month"] = months
+        async for rollup in financial_rollups_collection.find(query):
+            rows[(rollup["month"], rollup["currency"], rollup["transaction_type"], rollup["category"])] = rollup
+    if edges:
+        groups = await transactions_collection.aggregate([
+            {"$match": {"$or": [{"date": {"$gte": low, "$lte": high}} for low, high in edges]}},
+            financial_group_stage()
+        ]).to_list(None)
+        for group in groups:
+            bucket = tuple(group["_id"].values())
+            row = rows.setdefault(bucket, {"amount": 0, "count": 0})
+            row["amount"] += group["amount"]
+            row["count"] += group["count"]
+    return rows
+
+async def base_currency_rates():
+    """currency -> units of the base currency per unit, from the exchange rate table"""
+    rates = {rate["id"]: rate["rate"] async for rate in exchange_rates_collection.find({}, {"_id": 0, "id": 1, "rate": 1})}
+    rates[BASE_CURRENCY] = 1.0
+    return rates
+
+def empty_financial_totals():
+    return {"total_purchases": 0, "total_sales": 0, "total_expenses": 0, "net_profit": 0}
+
+def finish_financial_totals(totals):
+    totals["net_profit"] = totals["total_sales"] - totals["total_purchases"] - totals["total_expenses"]
+    return {field: round(value, 2) or 0 for field, value in totals.items()}
+
+FINANCIAL_REPORT_SOURCES = [transactions_collection, exchange_rates_collection, financial_rollups_collection]
+
 @app.get("/api/reports/financial")
-async def get_financial_report():
-    transactions = list(transactions_collection.find({}, {"_id": 0}))
-    
-    total_purchases = sum(t["amount"] for t in transactions if t["transaction_type"] == "purchase")
-    total_sales = sum(t["amount"] for t in transactions if t["transaction_type"] == "sale")
-    total_expenses = sum(t["amount"] for t in transactions if t["transaction_type"] == "expense")
-    
-    net_profit = total_sales - total_purchases - total_expenses
-    
-    # Expense breakdown
+@conditional_get(FINANCIAL_REPORT_SOURCES)
+@cached_response("financial_report", FINANCIAL_REPORT_SOURCES)
+async def get_financial_report(period: str = None, date_from: str = None, date_to: str = None):
+    """Purchases, sales, expenses and profit in the base currency, plus native totals per currency.
+    
+    Whole months come from the precomputed rollups; only the partial months at the
+    edges of a date range are aggregated from the transactions themselves.
+    """
+    if period and period not in FINANCIAL_PERIODS:
+        raise HTTPException(status_code=400, detail=f"period must be one of: {', '.join(FINANCIAL_PERIODS)}")
+    try:
+        if not await financial_rollups_collection.find_one({"_id": FINANCIAL_ROLLUPS_MARKER}):
+            await rebuild_financial_rollups()
+        rows = await financial_rows(date_from, date_to)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="date_from and date_to must be YYYY-MM-DD")
+    
+    rates = await base_currency_rates()
+    
+    summary = empty_financial_totals()
+    by_currency = {}
+    periods = {}
     expense_categories = {}
+    unconverted = set()
+    for (month, currency, transaction_type, category), row in sorted(rows.items()):
+        field = FINANCIAL_TOTALS.get(transaction_type)
+        if not field:
+            continue
+        native = by_currency.setdefault(currency, empty_financial_totals())
+        native[field] += row["amount"]
+        if currency not in rates:
+            unconverted.add(currency)
+            continue
+        
+        amount = row["amount"] * rates[currency]
+        summary[field] += amount
+        if period and len(month) == 7:
+            period_totals = periods.setdefault(FINANCIAL_PERIODS[period](month), empty_financial_totals())
+            period_totals[field] += amount
+        if transaction_type == "expense":
+            expense_categories[category] = expense_categories.get(category, 0) + amount
+    
+    report = {
+        "summary": finish_financial_totals(summary),
+        "expense_breakdown": {category: round(amount, 2) for category, amount in expense_categories.items()},
+        "base_currency": BASE_CURRENCY,
+        "by_currency": {currency: finish_financial_totals(totals) for currency, totals in sorted(by_currency.items())},
+        "unconverted_currencies": sorted(unconverted),
+        "filters": {"period": period, "date_from": date_from, "date_to": date_to}
+    }
+    if period:
+        report["periods"] = [
+            {"period": key, **finish_financial_totals(totals)} for key, totals in sorted(periods.items())
+        ]
+    return report
+
+# Exchange rate endpoints
+@app.get("/api/exchange-rates")
+@conditional_get([exchange_rates_collection])
+async def get_exchange_rates():
+    rates = await exchange_rates_collection.find({}, {"_id": 0}).sort("id", 1).to_list(None)
+    return {"base_currency": BASE_CURRENCY, "rates": rates}
+
+@app.put("/api/exchange-rates/{currency}")
+async def set_exchange_rate(currency: str, exchange_rate: ExchangeRate):
+    """Create or replace the conversion rate of currency into the base currency"""
+    if currency == BASE_CURRENCY:
+        raise HTTPException(status_code=400, detail=f"{BASE_CURRENCY} is the base currency")
+    if exchange_rate.rate <= 0:
+        raise HTTPException(status_code=400, detail="rate must be positive")
+    
+    rate_dict = exchange_rate.dict()
+    rate_dict.update({"id": currency, "currency": currency, "updated_at": datetime.now().isoformat()})
+    result = await update_document(exchange_rates_collection, currency, rate_dict)
+    if not result.matched_count:
+        await insert_document(exchange_rates_collection, rate_dict)
+        rate_dict.pop("_id", None)
+    return {"message": "Exchange rate saved successfully", "exchange_rate": rate_dict}
+
+@app.delete("/api/exchange-rates/{currency}")
+async def delete_exchange_rate(currency: str):
+    result = await delete_document(exchange_rates_collection, currency)
+    if result.deleted_count:
+        return {"message": "Exchange rate deleted successfully"}
+    raise HTTPException(status_code=404, detail="Exchange rate not found")
+
+# Profitability ledger: one document per bird and per breeding pair, in the base currency,
+# plus one "applied:<transaction id>" document per attributed transaction
+# transaction_type -> ledger field the converted amount is added to
+LEDGER_FIELDS = {"sale": "sales", "expense": "expenses", "purchase": "purchase_transactions"}
+LEDGER_SORT_FIELDS = ["net", "sales", "expenses", "purchase_cost"]
+PROFITABILITY_MARKER = "_rebuilt"
+
+def ledger_id(entity_type, entity_id):
+    return f"{entity_type}:{entity_id}"
+
+def applied_id(transaction_id):
+    """Id of the document recording what a transaction added to the ledger, so exactly that is reversed"""
+    return f"applied:{transaction_id}"
+
+def ledger_update(entity_type, entity_id, deltas, purchase_price=None):
+    """Pipeline update adding deltas and recomputing purchase_cost and net in the same atomic write.
+    
+    A bird's purchase cost is the sum of its purchase transactions, or its
+    recorded purchase_price when no purchase transaction refers to it.
+    """
+    values = {"entity_type": entity_type, "entity_id": entity_id}
+    for field, delta in deltas.items():
+        values[field] = {"$add": [{"$ifNull": [f"${field}", 0]}, delta]}
+    if purchase_price is not None:
+        values["purchase_price"] = purchase_price
+    return UpdateOne({"_id": ledger_id(entity_type, entity_id)}, [
+        {"$set": values},
+        {"$set": {"purchase_cost": {"$cond": [
+            {"$gt": [{"$ifNull": ["$purchase_transaction_count", 0]}, 0]},
+            "$purchase_transactions",
+            {"$ifNull": ["$purchase_price", 0]}
+        ]}}},
+        {"$set": {"net": {"$subtract": [
+            {"$ifNull": ["$sales", 0]},
+            {"$add": [{"$ifNull": ["$expenses", 0]}, "$purchase_cost"]}
+        ]}}}
+    ], upsert=True)
+
+async def transaction_contributions(transactions, rates):
+    """What each transaction adds to the ledger at the current rates and links, as
+    (transaction id, [{entity_type, entity_id, field, amount}]) with amount None when
+    the currency has no rate. Attribution is to the bird and, through
+    chick -> clutch -> pair, to the parent pair."""
+    chick_ids = [t["chick_id"] for t in transactions if t.get("chick_id")]
+    pairs_by_chick = {link["child"]: link["pair_id"] for link in await parent_links(chick_ids)} if chick_ids else {}
+    
+    contributions = []
     for transaction in transactions:
-        if transaction["transaction_type"] == "expense":
-            category = transaction.get("category", "Other")
-            expense_categories[category] = expense_categories.get(category, 0) + transaction["amount"]
+        field = LEDGER_FIELDS.get(transaction.get("transaction_type"))
+        entities = []
+        if field and transaction.get("bird_id"):
+            entities.append(("bird", transaction["bird_id"]))
+        if field and pairs_by_chick.get(transaction.get("chick_id")):
+            entities.append(("pair", pairs_by_chick[transaction["chick_id"]]))
+        
+        rate = rates.get(transaction.get("currency") or BASE_CURRENCY)
+        amount = (transaction.get("amount") or 0) * rate if rate is not None else None
+        contributions.append((transaction.get("id"), [
+            {"entity_type": entity_type, "entity_id": entity_id, "field": field, "amount": amount}
+            for entity_type, entity_id in entities
+        ]))
+    return contributions
+
+def add_contributions(deltas, contributions, sign):
+    for contribution in contributions:
+        entity_deltas = deltas.setdefault((contribution["entity_type"], contribution["entity_id"]), {})
+        entity_deltas["transaction_count"] = entity_deltas.get("transaction_count", 0) + sign
+        if contribution["amount"] is None:
+            entity_deltas["unconverted_transactions"] = entity_deltas.get("unconverted_transactions", 0) + sign
+            continue
+        field = contribution["field"]
+        entity_deltas[field] = entity_deltas.get(field, 0) + sign * contribution["amount"]
+        if field == "purchase_transactions":
+            entity_deltas["purchase_transaction_count"] = entity_deltas.get("purchase_transaction_count", 0) + sign
+
+async def update_profitability_ledger(collection, before, after):
+    """Apply a batch of transaction or bird writes to the ledger"""
+    if collection.name not in (transactions_collection.name, birds_collection.name):
+        return
+    rates = await base_currency_rates()
+    updates = []
+    if collection.name == transactions_collection.name:
+        # Reverse what the earlier versions actually added (their rate and attribution at the time)
+        applied = {
+            doc["transaction_id"]: doc["contributions"]
+            async for doc in profitability_collection.find(
+                {"_id": {"$in": [applied_id(t.get("id")) for t in before]}}
+            )
+        }
+        unrecorded = [t for t in before if t.get("id") not in applied]
+        applied.update(await transaction_contributions(unrecorded, rates))
+        current = await transaction_contributions(after, rates)
+        
+        deltas = {}
+        for transaction in before:
+            add_contributions(deltas, applied.get(transaction.get("id"), []), -1)
+        for _, contributions in current:
+            add_contributions(deltas, contributions, 1)
+        updates = [
+            ledger_update(entity_type, entity_id, entity_deltas)
+            for (entity_type, entity_id), entity_deltas in deltas.items() if any(entity_deltas.values())
+        ]
+        
+        recorded = {transaction_id for transaction_id, contributions in current if transaction_id and contributions}
+        updates += [
+            ReplaceOne(
+                {"_id": applied_id(transaction_id)},
+                {"transaction_id": transaction_id, "contributions": contributions},
+                upsert=True
+            )
+            for transaction_id, contributions in current if transaction_id in recorded
+        ]
+        updates += [
+            DeleteOne({"_id": applied_id(transaction.get("id"))})
+            for transaction in before if transaction.get("id") not in recorded
+        ]
+    else:
+        after_ids = {bird.get("id") for bird in after}
+        for bird in [*after, *(bird for bird in before if bird.get("id") not in after_ids)]:
+            rate = rates.get(bird.get("purchase_currency") or BASE_CURRENCY)
+            price = (bird.get("purchase_price") or 0) * rate if bird.get("id") in after_ids and rate else 0
+            updates.append(ledger_update("bird", bird["id"], {}, purchase_price=price))
+    if updates:
+        await profitability_collection.bulk_write(updates, ordered=False)
+
+async def rebuild_profitability_ledger():
+    """Recompute the whole ledger from the birds and transactions at the current exchange rates;
+    bird and transaction writes wait until it is done"""
+    async with rebuild_gate.rebuild():
+        await profitability_collection.delete_many({})
+        for collection in (birds_collection, transactions_collection):
+            batch = []
+            async for doc in collection.find({}, {"_id": 0}):
+                batch.append(doc)
+                if len(batch) == 1000:
+                    await update_profitability_ledger(collection, [], batch)
+                    batch = []
+            if batch:
+                await update_profitability_ledger(collection, [], batch)
+        await profitability_collection.insert_one({"_id": PROFITABILITY_MARKER, "rebuilt_at": datetime.now().isoformat()})
+        # Retire rankings cached or ETagged before the rebuild
+        await bump_version(profitability_collection)
+    return await profitability_collection.count_documents({"entity_type": {"$exists": True}})
+
+async def ensure_profitability_ledger():
+    try:
+        if not await profitability_collection.find_one({"_id": PROFITABILITY_MARKER}):
+            await rebuild_profitability_ledger()
+    except PyMongoError:
+        # Rebuilt on the first profitability report once Mongo is reachable
+        pass
+
+@app.on_event("startup")
+async def ensure_profitability_ledger_on_startup():
+    # Build in the background so startup does not grow with the ledger
+    run_in_background(ensure_profitability_ledger())
+
+PROFITABILITY_SOURCES = [profitability_collection, birds_collection, transactions_collection, breeding_pairs_collection]
+
+@app.get("/api/reports/profitability")
+@conditional_get(PROFITABILITY_SOURCES)
+@cached_response("profitability", PROFITABILITY_SOURCES)
+async def get_profitability(entity_type: str = "pair", sort: str = "net", order: str = "desc", limit: int = 50):
+    """Birds or breeding pairs ranked by profit (sales minus expenses and purchase cost) in the base currency"""
+    if entity_type not in ("bird", "pair"):
+        raise HTTPException(status_code=400, detail="entity_type must be 'bird' or 'pair'")
+    if sort not in LEDGER_SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(LEDGER_SORT_FIELDS)}")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if not await profitability_collection.find_one({"_id": PROFITABILITY_MARKER}):
+        await rebuild_profitability_ledger()
+    
+    entries = await profitability_collection.find({"entity_type": entity_type}, {"_id": 0}).sort(
+        [(sort, -1 if order == "desc" else 1), ("entity_id", 1)]
+    ).limit(limit).to_list(None)
+    
+    if entity_type == "pair":
+        details = await load_by_ids(breeding_pairs_collection, [entry["entity_id"] for entry in entries])
+        labels = {pair_id: {"pair_name": pair.get("pair_name")} for pair_id, pair in details.items()}
+    else:
+        details = await load_by_ids(birds_collection, [entry["entity_id"] for entry in entries])
+        labels = {
+            bird_id: {"ring_number": bird.get("ring_number"), "species": bird.get("species")}
+            for bird_id, bird in details.items()
+        }
     
-    return {
-        "summary": {
-            "total_purchases": total_purchases,
-            "total_sales": total_sales,
-            "total_expenses": total_expenses,
-            "net_profit": net_profit
-        },
-        "expense_breakdown": expense_categories
-    }
+    amount_fields = ["sales", "expenses", "purchase_transactions", "purchase_price", "purchase_cost", "net"]
+    for entry in entries:
+        entry.update(labels.get(entry["entity_id"], {}))
+        for field in amount_fields:
+            if field in entry:
+                entry[field] = round(entry[field], 2) or 0
+    return {"base_currency": BASE_CURRENCY, "entity_type": entity_type, "entries": entries}
 
 # Dashboard endpoint
+DASHBOARD_SOURCES = [
+    birds_collection, breeding_pairs_collection, clutches_collection, chicks_collection,
+    artificial_incubation_collection, incubators_collection, transactions_collection, license_collection,
+    dashboard_stats_collection, exchange_rates_collection,
+]
+
 @app.get("/api/dashboard")
+@conditional_get(DASHBOARD_SOURCES, daily=True)
+@cached_response("dashboard", DASHBOARD_SOURCES, daily=True)
 async def get_dashboard():
-    # Get counts
-    total_birds = birds_collection.count_documents({"status": "active"})
-    total_pairs = breeding_pairs_collection.count_documents({"status": "active"})
-    active_clutches = clutches_collection.count_documents({"status": {"$in": ["incubating", "hatching"]}})
-    total_chicks = chicks_collection.count_documents({"status": "alive"})
-    active_artificial_incubations = artificial_incubation_collection.count_documents({"status": {"$in": ["incubating", "hatching"]}})
-    total_incubators = incubators_collection.count_documents({"status": "active"})
+    # Counts and financial totals come from the materialized stats document
+    stats = await get_dashboard_stats()
     
     # Get recent clutches
-    recent_clutches = list(clutches_collection.find(
+    recent_clutches = await clutches_collection.find(
         {}, {"_id": 0}
-    ).sort("created_at", -1).limit(5))
+    ).sort("created_at", -1).limit(5).to_list(None)
     
     # Enrich recent clutches with pair details
-    for clutch in recent_clutches:
-        pair = breeding_pairs_collection.find_one({"id": clutch["breeding_pair_id"]}, {"_id": 0})
-        if pair:
-            male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-            female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
-            pair["male_bird"] = male_bird
-            pair["female_bird"] = female_bird
-        clutch["breeding_pair"] = pair
+    await attach_breeding_pairs(recent_clutches)
     
     # Get license alerts
     license_alerts = []
@@ -1228,8 +3434,11 @@ async def get_dashboard():
             "alert_level": main_license.get("alert_level")
         })
     
+    # Only licenses expiring within the alert window (plus a day for the time of day) are checked
+    alert_cutoff = (datetime.now() + timedelta(days=31)).strftime("%Y-%m-%d")
+    
     # Check bird licenses
-    birds = list(birds_collection.find({"license_expiry": {"$exists": True, "$ne": None}}, {"_id": 0}))
+    birds = await birds_collection.find({"license_expiry": {"$ne": None, "$lte": alert_cutoff}}, {"_id": 0}).to_list(None)
     for bird in birds:
         if bird.get("license_expiry"):
             expiry_date = datetime.strptime(bird["license_expiry"], "%Y-%m-%d")
@@ -1248,7 +3457,7 @@ async def get_dashboard():
                 })
     
     # Check pair licenses
-    pairs = list(breeding_pairs_collection.find({"license_expiry": {"$exists": True, "$ne": None}}, {"_id": 0}))
+    pairs = await breeding_pairs_collection.find({"license_expiry": {"$ne": None, "$lte": alert_cutoff}}, {"_id": 0}).to_list(None)
     for pair in pairs:
         if pair.get("license_expiry"):
             expiry_date = datetime.strptime(pair["license_expiry"], "%Y-%m-%d")
@@ -1266,22 +3475,14 @@ async def get_dashboard():
                     "alert_level": alert_level
                 })
     
-    # Get financial summary
-    transactions = list(transactions_collection.find({}, {"_id": 0}))
-    total_revenue = sum(t["amount"] for t in transactions if t["transaction_type"] == "sale")
-    total_expenses = sum(t["amount"] for t in transactions if t["transaction_type"] == "expense")
-    
     return {
         "stats": {
-            "total_birds": total_birds,
-            "total_pairs": total_pairs,
-            "active_clutches": active_clutches,
-            "total_chicks": total_chicks,
-            "active_artificial_incubations": active_artificial_incubations,
-            "total_incubators": total_incubators,
-            "total_revenue": total_revenue,
-            "total_expenses": total_expenses
+            **{counter: stats[counter] for counter in DASHBOARD_COUNTERS},
+            # Incremental float sums can drift by fractions of a cent (or to -0.0)
+            **{counter: round(stats[counter], 2) or 0 for counter in DASHBOARD_TOTALS}
         },
+        "base_currency": BASE_CURRENCY,
+        "unconverted_currencies": stats["unconverted_currencies"],
         "recent_clutches": recent_clutches,
         "license_alerts": license_alerts
     }
@@ -1291,7 +3492,7 @@ async def get_dashboard():
 async def create_species(species: Species):
     """Create a new species"""
     # Check if species already exists
-    existing = species_collection.find_one({"name": {"$regex": f"^{species.name}$", "$options": "i"}})
+    existing = await species_collection.find_one({"name": {"$regex": f"^{species.name}$", "$options": "i"}})
     if existing:
         raise HTTPException(status_code=400, detail="Species already exists")
     
@@ -1299,19 +3500,20 @@ async def create_species(species: Species):
     species_dict["id"] = str(uuid.uuid4())
     species_dict["created_at"] = datetime.now().isoformat()
     
-    result = species_collection.insert_one(species_dict)
+    result = await insert_document(species_collection, species_dict)
     if result.inserted_id:
         return {"message": "Species created successfully", "species_id": species_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create species")
 
 @app.get("/api/species")
+@conditional_get([species_collection, birds_collection])
 async def get_species():
     """Get all species with bird counts"""
-    species_list = list(species_collection.find({}, {"_id": 0}))
+    species_list = await species_collection.find({}, {"_id": 0}).to_list(None)
     
     # Add bird count for each species
     for species in species_list:
-        bird_count = birds_collection.count_documents({"species": species["name"]})
+        bird_count = await birds_collection.count_documents({"species": species["name"]})
         species["bird_count"] = bird_count
     
     # Sort by name
@@ -1322,20 +3524,20 @@ async def get_species():
 @app.get("/api/species/{species_id}")
 async def get_species_detail(species_id: str):
     """Get detailed information about a species"""
-    species = species_collection.find_one({"id": species_id}, {"_id": 0})
+    species = await find_by_id(species_collection, species_id)
     if not species:
         raise HTTPException(status_code=404, detail="Species not found")
     
     # Get birds of this species
-    birds = list(birds_collection.find({"species": species["name"]}, {"_id": 0}))
+    birds = await birds_collection.find({"species": species["name"]}, {"_id": 0}).to_list(None)
     
     # Get breeding pairs of this species
-    pairs = list(breeding_pairs_collection.find({}, {"_id": 0}))
+    pairs = await breeding_pairs_collection.find({}, {"_id": 0}).to_list(None)
     species_pairs = []
     
     for pair in pairs:
-        male_bird = birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
-        female_bird = birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
+        male_bird = await birds_collection.find_one({"id": pair["male_bird_id"]}, {"_id": 0})
+        female_bird = await birds_collection.find_one({"id": pair["female_bird_id"]}, {"_id": 0})
         
         if (male_bird and male_bird["species"] == species["name"]) or \
            (female_bird and female_bird["species"] == species["name"]):
@@ -1362,10 +3564,7 @@ async def update_species(species_id: str, species: Species):
     species_dict["id"] = species_id
     species_dict["updated_at"] = datetime.now().isoformat()
     
-    result = species_collection.update_one(
-        {"id": species_id}, 
-        {"$set": species_dict}
-    )
+    result = await update_document(species_collection, species_id, species_dict)
     if result.modified_count:
         return {"message": "Species updated successfully"}
     raise HTTPException(status_code=404, detail="Species not found")
@@ -1373,20 +3572,140 @@ async def update_species(species_id: str, species: Species):
 @app.delete("/api/species/{species_id}")
 async def delete_species(species_id: str):
     """Delete a species (only if no birds exist)"""
-    species = species_collection.find_one({"id": species_id})
+    species = await species_collection.find_one({"id": species_id})
     if not species:
         raise HTTPException(status_code=404, detail="Species not found")
     
     # Check if any birds exist with this species
-    bird_count = birds_collection.count_documents({"species": species["name"]})
+    bird_count = await birds_collection.count_documents({"species": species["name"]})
     if bird_count > 0:
         raise HTTPException(status_code=400, detail=f"Cannot delete species. {bird_count} birds still exist with this species.")
     
-    result = species_collection.delete_one({"id": species_id})
+    result = await delete_document(species_collection, species_id)
     if result.deleted_count:
         return {"message": "Species deleted successfully"}
     raise HTTPException(status_code=404, detail="Species not found")
 
+# Monitoring readings: temperature/humidity samples in a time-series collection keyed by incubator
+def combine_date_time(day, clock):
+    try:
+        return datetime.strptime(f"{day} {clock or '00:00'}", "%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return None
+
+def monitoring_entry_readings(entry):
+    """Morning and evening samples of a daily monitoring entry"""
+    readings = []
+    for part in ("morning", "evening"):
+        timestamp = combine_date_time(entry.get("date"), entry.get(f"{part}_time"))
+        if timestamp and entry.get(f"{part}_temperature") is not None:
+            readings.append({
+                "timestamp": timestamp,
+                "meta": {"incubator_id": entry.get("incubator_id"), "source": "daily_monitoring"},
+                "source_id": entry["id"],
+                "temperature": entry.get(f"{part}_temperature"),
+                "humidity": entry.get(f"{part}_humidity")
+            })
+    return readings
+
+async def incubation_log_readings(logs):
+    incubations = await load_by_ids(artificial_incubation_collection, [log.get("artificial_incubation_id") for log in logs])
+    readings = []
+    for log in logs:
+        incubation = incubations.get(log.get("artificial_incubation_id"))
+        timestamp = combine_date_time(log.get("log_date"), None)
+        if incubation and timestamp:
+            readings.append({
+                "timestamp": timestamp,
+                "meta": {"incubator_id": incubation.get("incubator_id"), "source": "incubation_log"},
+                "source_id": log["id"],
+                "temperature": log.get("temperature_recorded"),
+                "humidity": log.get("humidity_recorded")
+            })
+    return readings
+
+async def readings_for(collection, docs):
+    if collection.name == daily_monitoring_collection.name:
+        return [reading for doc in docs for reading in monitoring_entry_readings(doc)]
+    return await incubation_log_readings(docs)
+
+async def sync_monitoring_readings(collection, before, after):
+    """Replace the readings derived from written monitoring entries and incubation logs"""
+    if collection.name not in (daily_monitoring_collection.name, incubation_logs_collection.name):
+        return
+    source_ids = [doc.get("id") for doc in before]
+    if source_ids:
+        await monitoring_readings_collection.delete_many({"source_id": {"$in": source_ids}})
+    readings = await readings_for(collection, list(after))
+    if readings:
+        await monitoring_readings_collection.insert_many(readings, ordered=False)
+
+async def insert_readings(collection, docs):
+    readings = await readings_for(collection, docs)
+    if readings:
+        await monitoring_readings_collection.insert_many(readings, ordered=False)
+    return len(readings)
+
+# meta.source of the readings derived from monitoring entries and incubation logs (not probe telemetry)
+DERIVED_READING_SOURCES = ["daily_monitoring", "incubation_log"]
+
+async def rebuild_monitoring_readings():
+    """Regenerate every reading derived from the daily monitoring entries and incubation logs"""
+    await monitoring_readings_collection.delete_many({"meta.source": {"$in": DERIVED_READING_SOURCES}})
+    inserted = 0
+    for collection in (daily_monitoring_collection, incubation_logs_collection):
+        batch = []
+        async for doc in collection.find({}, {"_id": 0}):
+            batch.append(doc)
+            if len(batch) == 1000:
+                inserted += await insert_readings(collection, batch)
+                batch = []
+        if batch:
+            inserted += await insert_readings(collection, batch)
+    return inserted
+
+@app.on_event("startup")
+async def backfill_monitoring_readings():
+    # One-off migration of existing entries (and of readings that kept source_id in meta);
+    # later writes keep readings in step
+    try:
+        derived = await monitoring_readings_collection.find_one({"meta.source": {"$in": DERIVED_READING_SOURCES}})
+        if derived:
+            needs_rebuild = "source_id" in derived["meta"]
+        else:
+            needs_rebuild = bool(
+                await daily_monitoring_collection.find_one({}) or await incubation_logs_collection.find_one({})
+            )
+        if needs_rebuild:
+            run_in_background(rebuild_monitoring_readings())
+    except PyMongoError:
+        pass
+
+def telemetry_rollup_id(incubator_id, day):
+    return f"{incubator_id}:{day}"
+
+def rollup_averages(rollup):
+    """(temperature, humidity) daily averages of a telemetry rollup, None where no sensor sent that measure"""
+    return tuple(
+        round(rollup[f"{measure}_sum"] / rollup[f"{measure}_count"], 1) if rollup.get(f"{measure}_count") else None
+        for measure in ("temperature", "humidity")
+    )
+
+async def apply_sensor_averages(monitoring_dict):
+    """Prefer probe telemetry over the morning/evening readings for the daily averages when available"""
+    rollup = await telemetry_rollups_collection.find_one(
+        {"_id": telemetry_rollup_id(monitoring_dict["incubator_id"], monitoring_dict["date"])}
+    )
+    if rollup:
+        temperature, humidity = rollup_averages(rollup)
+        if temperature is not None:
+            monitoring_dict["daily_avg_temperature"] = temperature
+        if humidity is not None:
+            monitoring_dict["daily_avg_humidity"] = humidity
+
+# interval -> $dateToString format of the bucket label
+SERIES_INTERVALS = {"day": "%Y-%m-%d", "week": "%G-W%V", "month": "%Y-%m"}
+
 # Daily Monitoring endpoints
 @app.post("/api/daily-monitoring")
 async def create_daily_monitoring(monitoring: DailyMonitoring):
@@ -1403,14 +3722,23 @@ async def create_daily_monitoring(monitoring: DailyMonitoring):
     
     monitoring_dict["daily_avg_temperature"] = round((morning_temp + evening_temp) / 2, 1)
     monitoring_dict["daily_avg_humidity"] = round((morning_humid + evening_humid) / 2, 1)
+    await apply_sensor_averages(monitoring_dict)
     
-    result = daily_monitoring_collection.insert_one(monitoring_dict)
+    result = await insert_document(daily_monitoring_collection, monitoring_dict)
     if result.inserted_id:
         return {"message": "Daily monitoring entry created successfully", "monitoring_id": monitoring_dict["id"]}
     raise HTTPException(status_code=500, detail="Failed to create daily monitoring entry")
 
 @app.get("/api/daily-monitoring")
-async def get_daily_monitoring(incubator_id: str = None, date_from: str = None, date_to: str = None):
+@conditional_get([daily_monitoring_collection, incubators_collection])
+async def get_daily_monitoring(
+    incubator_id: str = None,
+    date_from: str = None,
+    date_to: str = None,
+    limit: int = None,
+    after: str = None,
+    fields: str = None
+):
     """Get daily monitoring entries with optional filters"""
     query = {}
     
@@ -1425,28 +3753,93 @@ async def get_daily_monitoring(incubator_id: str = None, date_from: str = None,
             date_query["$lte"] = date_to
         query["date"] = date_query
     
-    monitoring_entries = list(daily_monitoring_collection.find(query, {"_id": 0}))
+    # Sorted by date (newest first)
+    monitoring_entries, next_cursor = await find_page(
+        daily_monitoring_collection, query, [("date", -1), ("_id", 1)],
+        limit=limit, after=after, fields=fields
+    )
     
     # Enrich with incubator details
+    incubators = await load_by_ids(incubators_collection, [e.get("incubator_id") for e in monitoring_entries])
     for entry in monitoring_entries:
-        incubator = incubators_collection.find_one({"id": entry["incubator_id"]}, {"_id": 0})
+        incubator = incubators.get(entry.get("incubator_id"))
         if incubator:
             entry["incubator"] = incubator
     
-    # Sort by date (newest first)
-    monitoring_entries.sort(key=lambda x: x["date"], reverse=True)
+    response = {"monitoring_entries": monitoring_entries}
+    if limit:
+        response["next_cursor"] = next_cursor
+    return response
+
+@app.get("/api/daily-monitoring/series")
+async def get_monitoring_series(
+    incubator_id: str = None,
+    interval: str = "day",
+    date_from: str = None,
+    date_to: str = None
+):
+    """Downsampled temperature/humidity min/avg/max per incubator and day, ISO week or month"""
+    if interval not in SERIES_INTERVALS:
+        raise HTTPException(status_code=400, detail=f"interval must be one of: {', '.join(SERIES_INTERVALS)}")
     
-    return {"monitoring_entries": monitoring_entries}
+    match = {}
+    if incubator_id:
+        match["meta.incubator_id"] = incubator_id
+    try:
+        if date_from:
+            match.setdefault("timestamp", {})["$gte"] = datetime.strptime(date_from, "%Y-%m-%d")
+        if date_to:
+            match.setdefault("timestamp", {})["$lt"] = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="date_from and date_to must be YYYY-MM-DD")
+    
+    buckets = await monitoring_readings_collection.aggregate([
+        {"$match": match},
+        {"$group": {
+            "_id": {
+                "incubator_id": "$meta.incubator_id",
+                "period": {"$dateToString": {"format": SERIES_INTERVALS[interval], "date": "$timestamp"}}
+            },
+            "readings": {"$sum": 1},
+            "temperature_min": {"$min": "$temperature"},
+            "temperature_avg": {"$avg": "$temperature"},
+            "temperature_max": {"$max": "$temperature"},
+            "humidity_min": {"$min": "$humidity"},
+            "humidity_avg": {"$avg": "$humidity"},
+            "humidity_max": {"$max": "$humidity"}
+        }},
+        {"$sort": {"_id.incubator_id": 1, "_id.period": 1}}
+    ]).to_list(None)
+    
+    series = {}
+    for bucket in buckets:
+        points = series.setdefault(bucket["_id"]["incubator_id"], [])
+        point = {"period": bucket["_id"]["period"], "readings": bucket["readings"]}
+        for measure in ("temperature", "humidity"):
+            point[measure] = {
+                stat: round(bucket[f"{measure}_{stat}"], 2) if bucket[f"{measure}_{stat}"] is not None else None
+                for stat in ("min", "avg", "max")
+            }
+        points.append(point)
+    
+    incubators = await load_by_ids(incubators_collection, list(series))
+    return {
+        "interval": interval,
+        "series": [
+            {"incubator_id": key, "incubator_name": incubators.get(key, {}).get("name"), "points": points}
+            for key, points in series.items()
+        ]
+    }
 
 @app.get("/api/daily-monitoring/{monitoring_id}")
 async def get_daily_monitoring_detail(monitoring_id: str):
     """Get detailed daily monitoring entry"""
-    monitoring = daily_monitoring_collection.find_one({"id": monitoring_id}, {"_id": 0})
+    monitoring = await daily_monitoring_collection.find_one({"id": monitoring_id}, {"_id": 0})
     if not monitoring:
         raise HTTPException(status_code=404, detail="Daily monitoring entry not found")
     
     # Add incubator details
-    incubator = incubators_collection.find_one({"id": monitoring["incubator_id"]}, {"_id": 0})
+    incubator = await find_by_id(incubators_collection, monitoring["incubator_id"])
     if incubator:
         monitoring["incubator"] = incubator
     
@@ -1467,11 +3860,9 @@ async def update_daily_monitoring(monitoring_id: str, monitoring: DailyMonitorin
     
     monitoring_dict["daily_avg_temperature"] = round((morning_temp + evening_temp) / 2, 1)
     monitoring_dict["daily_avg_humidity"] = round((morning_humid + evening_humid) / 2, 1)
+    await apply_sensor_averages(monitoring_dict)
     
-    result = daily_monitoring_collection.update_one(
-        {"id": monitoring_id}, 
-        {"$set": monitoring_dict}
-    )
+    result = await update_document(daily_monitoring_collection, monitoring_id, monitoring_dict)
     if result.modified_count:
         return {"message": "Daily monitoring entry updated successfully"}
     raise HTTPException(status_code=404, detail="Daily monitoring entry not found")
@@ -1479,43 +3870,276 @@ async def update_daily_monitoring(monitoring_id: str, monitoring: DailyMonitorin
 @app.delete("/api/daily-monitoring/{monitoring_id}")
 async def delete_daily_monitoring(monitoring_id: str):
     """Delete daily monitoring entry"""
-    result = daily_monitoring_collection.delete_one({"id": monitoring_id})
+    result = await delete_document(daily_monitoring_collection, monitoring_id)
     if result.deleted_count:
         return {"message": "Daily monitoring entry deleted successfully"}
     raise HTTPException(status_code=404, detail="Daily monitoring entry not found")
 
+# Incubator telemetry ingestion: probe readings are buffered per worker and written in bulk
+class TelemetryBuffer:
+    """Collects readings in memory and flushes them with one insert_many once
+    max_readings are waiting or every flush_interval seconds.
+    
+    Readings that were not inserted go back to the buffer for the next attempt;
+    the buffer is capped at max_buffered readings, dropping the oldest beyond that.
+    The rollup of inserted readings is retried on its own (pending_sums, then
+    pending_days) so a failed rollup never re-inserts or double-counts readings.
+    """
+    
+    def __init__(self, max_readings, flush_interval, max_buffered):
+        self.max_readings = max_readings
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.readings = []
+        # (incubator_id, day) -> sums of inserted readings not yet added to the rollups
+        self.pending_sums = {}
+        # (incubator_id, day) whose rollups changed but whose monitoring averages were not refreshed
+        self.pending_days = set()
+        self.lock = asyncio.Lock()
+        self.task = None
+        self.stats = {"received": 0, "flushed": 0, "flushes": 0, "failed_flushes": 0, "dropped": 0}
+    
+    def add(self, readings):
+        self.readings.extend(readings)
+        self.stats["received"] += len(readings)
+        self.trim()
+        if len(self.readings) >= self.max_readings and not self.lock.locked():
+            run_in_background(self.flush())
+    
+    def trim(self):
+        overflow = len(self.readings) - self.max_buffered
+        if overflow > 0:
+            del self.readings[:overflow]
+            self.stats["dropped"] += overflow
+    
+    def requeue(self, readings):
+        # insert_many assigned _ids; drop them so the retry inserts fresh documents
+        for reading in readings:
+            reading.pop("_id", None)
+        self.readings[:0] = readings
+        self.trim()
+    
+    async def flush(self):
+        async with self.lock:
+            flushed = 0
+            while True:
+                try:
+                    rolled_up = await self.roll_up_pending()
+                except PyMongoError:
+                    rolled_up = False
+                if not rolled_up:
+                    self.stats["failed_flushes"] += 1
+                    break
+                if not self.readings:
+                    break
+                
+                batch, self.readings = self.readings[:self.max_readings], self.readings[self.max_readings:]
+                try:
+                    await monitoring_readings_collection.insert_many(batch, ordered=False)
+                    failed = set()
+                except BulkWriteError as e:
+                    failed = {error["index"] for error in e.details.get("writeErrors", [])}
+                except PyMongoError:
+                    self.requeue(batch)
+                    self.stats["failed_flushes"] += 1
+                    break
+                
+                inserted = [reading for i, reading in enumerate(batch) if i not in failed]
+                for key, totals in telemetry_sums(inserted).items():
+                    pending = self.pending_sums.setdefault(key, dict.fromkeys(totals, 0))
+                    for field, value in totals.items():
+                        pending[field] += value
+                flushed += len(inserted)
+                self.stats["flushed"] += len(inserted)
+                self.stats["flushes"] += 1
+                if failed:
+                    self.requeue([batch[i] for i in sorted(failed)])
+                    self.stats["failed_flushes"] += 1
+                    break
+            return flushed
+    
+    async def roll_up_pending(self):
+        """Add pending sums to the rollups, then refresh the affected monitoring averages;
+        False if some sums are still pending"""
+        if self.pending_sums:
+            keys = list(self.pending_sums)
+            try:
+                await telemetry_rollups_collection.bulk_write([
+                    UpdateOne(
+                        {"_id": telemetry_rollup_id(incubator_id, day)},
+                        {"$inc": self.pending_sums[(incubator_id, day)], "$set": {"incubator_id": incubator_id, "date": day}},
+                        upsert=True
+                    )
+                    for incubator_id, day in keys
+                ], ordered=False)
+                failed = set()
+            except BulkWriteError as e:
+                failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            for i, key in enumerate(keys):
+                if i not in failed:
+                    del self.pending_sums[key]
+                    self.pending_days.add(key)
+            if failed:
+                return False
+        
+        if self.pending_days:
+            days = sorted(self.pending_days)
+            await refresh_telemetry_averages(days)
+            self.pending_days.difference_update(days)
+        return True
+    
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+    
+    def metrics(self):
+        return {
+            **self.stats,
+            "buffered": len(self.readings),
+            "pending_rollups": len(self.pending_sums) + len(self.pending_days),
+            "max_readings": self.max_readings,
+            "flush_interval_seconds": self.flush_interval,
+            "max_buffered": self.max_buffered
+        }
+
+telemetry_buffer = TelemetryBuffer(
+    max_readings=int(os.environ.get('TELEMETRY_FLUSH_SIZE', '5000')),
+    flush_interval=float(os.environ.get('TELEMETRY_FLUSH_INTERVAL', '5')),
+    max_buffered=int(os.environ.get('TELEMETRY_MAX_BUFFERED', '100000'))
+)
+
+def telemetry_sums(readings):
+    """Per (incubator_id, day) temperature/humidity sums and counts of readings"""
+    sums = {}
+    for reading in readings:
+        key = (reading["meta"]["incubator_id"], reading["timestamp"].strftime("%Y-%m-%d"))
+        totals = sums.setdefault(key, {"temperature_sum": 0.0, "temperature_count": 0, "humidity_sum": 0.0, "humidity_count": 0})
+        for measure in ("temperature", "humidity"):
+            if reading.get(measure) is not None:
+                totals[f"{measure}_sum"] += reading[measure]
+                totals[f"{measure}_count"] += 1
+    return sums
+
+async def refresh_telemetry_averages(days):
+    """Recompute the sensor averages of the daily monitoring entries of the (incubator_id, day) rollups"""
+    entries = await daily_monitoring_collection.find(
+        {"$or": [{"incubator_id": incubator_id, "date": day} for incubator_id, day in days]},
+        {"_id": 0, "id": 1, "incubator_id": 1, "date": 1}
+    ).to_list(None)
+    if not entries:
+        return
+    rollups = await telemetry_rollups_collection.find(
+        {"_id": {"$in": [telemetry_rollup_id(entry["incubator_id"], entry["date"]) for entry in entries]}}
+    ).to_list(None)
+    rollups = {rollup["_id"]: rollup for rollup in rollups}
+    for entry in entries:
+        temperature, humidity = rollup_averages(rollups[telemetry_rollup_id(entry["incubator_id"], entry["date"])])
+        changes = {"daily_avg_temperature": temperature, "daily_avg_humidity": humidity}
+        await update_document(
+            daily_monitoring_collection, entry["id"], {field: value for field, value in changes.items() if value is not None}
+        )
+
+def parse_reading_timestamp(value, received_at):
+    if not value:
+        return received_at
+    timestamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    # Stored as local wall-clock time, like the rest of the monitoring data
+    return timestamp.astimezone().replace(tzinfo=None) if timestamp.tzinfo else timestamp
+
+@app.on_event("startup")
+async def start_telemetry_flusher():
+    telemetry_buffer.task = asyncio.create_task(telemetry_buffer.run())
+
+@app.on_event("shutdown")
+async def flush_telemetry_on_shutdown():
+    if telemetry_buffer.task:
+        telemetry_buffer.task.cancel()
+    try:
+        await telemetry_buffer.flush()
+    except PyMongoError:
+        pass
+
+@app.post("/api/telemetry")
+async def ingest_telemetry(batches: List[TelemetryBatch]):
+    """Accept probe readings for one or more incubators; they are persisted by the next flush"""
+    incubators = await load_by_ids(incubators_collection, [batch.incubator_id for batch in batches])
+    missing = sorted({batch.incubator_id for batch in batches} - set(incubators))
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Incubator not found: {', '.join(missing)}")
+    
+    received_at = datetime.now().replace(microsecond=0)
+    readings = []
+    for batch in batches:
+        meta = {"incubator_id": batch.incubator_id, "source": "sensor"}
+        for reading in batch.readings:
+            if reading.temperature is None and reading.humidity is None:
+                continue
+            try:
+                timestamp = parse_reading_timestamp(reading.timestamp, received_at)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid timestamp: {reading.timestamp}")
+            readings.append({
+                "timestamp": timestamp, "meta": meta,
+                "temperature": reading.temperature, "humidity": reading.humidity
+            })
+    
+    telemetry_buffer.add(readings)
+    return {"accepted": len(readings), "buffered": len(telemetry_buffer.readings)}
+
 # Wildlife Permit endpoints
-def generate_permit_number():
-    """Generate auto-incrementing permit number"""
-    # Get the latest permit number
-    latest_permit = permits_collection.find_one(
-        {}, 
-        sort=[("permit_number", -1)]
-    )
+def permit_counter_id(year):
+    return f"wildlife_permit-{year}"
+
+async def current_permit_sequence(year):
+    """Last serial issued for the year, without allocating a new one"""
+    counter = await counters_collection.find_one({"_id": permit_counter_id(year)})
+    if counter:
+        return counter["seq"]
+    
+    # No counter yet: continue after serials issued before the counter existed.
+    # Compared as numbers: as strings WP-YYYY-10000 sorts below WP-YYYY-9999.
+    highest = 0
+    async for permit in permits_collection.find(
+        {"permit_number": {"$regex": f"^WP-{year}-\\d+$"}}, {"_id": 0, "permit_number": 1}
+    ):
+        highest = max(highest, int(permit["permit_number"].rsplit("-", 1)[1]))
+    return highest
+
+async def generate_permit_number():
+    """Allocate the next permit number from an atomic per-year counter"""
+    current_year = datetime.now().year
+    counter_id = permit_counter_id(current_year)
     
-    if latest_permit and latest_permit.get("permit_number"):
-        # Extract number from format "WP-2025-0001"
+    counter = await counters_collection.find_one_and_update(
+        {"_id": counter_id}, {"$inc": {"seq": 1}}, return_document=ReturnDocument.AFTER
+    )
+    if counter is None:
+        # First permit of the year: seed the counter, then allocate from it
         try:
-            last_number = int(latest_permit["permit_number"].split("-")[-1])
-            new_number = last_number + 1
-        except:
-            new_number = 1
-    else:
-        new_number = 1
+            await counters_collection.update_one(
+                {"_id": counter_id},
+                {"$max": {"seq": await current_permit_sequence(current_year)}},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            pass  # A concurrent request seeded it first
+        counter = await counters_collection.find_one_and_update(
+            {"_id": counter_id}, {"$inc": {"seq": 1}}, return_document=ReturnDocument.AFTER
+        )
     
     # Format: WP-YYYY-NNNN
-    current_year = datetime.now().year
-    return f"WP-{current_year}-{new_number:04d}"
+    return f"WP-{current_year}-{counter['seq']:04d}"
 
 @app.post("/api/wildlife-permits")
 async def create_wildlife_permit(permit: WildlifePermit):
     """Create a new wildlife permit"""
     permit_dict = permit.dict()
     permit_dict["id"] = str(uuid.uuid4())
-    permit_dict["permit_number"] = generate_permit_number()
+    permit_dict["permit_number"] = await generate_permit_number()
     permit_dict["created_at"] = datetime.now().isoformat()
     
-    result = permits_collection.insert_one(permit_dict)
+    result = await insert_document(permits_collection, permit_dict)
     if result.inserted_id:
         return {
             "message": "Wildlife permit created successfully", 
@@ -1525,11 +4149,15 @@ async def create_wildlife_permit(permit: WildlifePermit):
     raise HTTPException(status_code=500, detail="Failed to create wildlife permit")
 
 @app.get("/api/wildlife-permits")
+@conditional_get([permits_collection])
 async def get_wildlife_permits(
     status: str = None,
     customer_name: str = None,
     date_from: str = None,
-    date_to: str = None
+    date_to: str = None,
+    limit: int = None,
+    after: str = None,
+    fields: str = None
 ):
     """Get all wildlife permits with optional filters"""
     query = {}
@@ -1548,17 +4176,28 @@ async def get_wildlife_permits(
             date_query["$lte"] = date_to
         query["purchase_date"] = date_query
     
-    permits = list(permits_collection.find(query, {"_id": 0}))
-    
-    # Sort by permit number (newest first)
-    permits.sort(key=lambda x: x.get("permit_number", ""), reverse=True)
+    # Sorted by permit number (newest first)
+    permits, next_cursor = await find_page(
+        permits_collection, query, [("permit_number", -1), ("_id", 1)],
+        limit=limit, after=after, fields=fields
+    )
     
-    return {"permits": permits}
+    response = {"permits": permits}
+    if limit:
+        response["next_cursor"] = next_cursor
+    return response
+
+@app.get("/api/wildlife-permits/next-number")
+async def get_next_permit_number():
+    """Get the next permit number that will be assigned (does not reserve it)"""
+    current_year = datetime.now().year
+    next_number = await current_permit_sequence(current_year) + 1
+    return {"next_permit_number": f"WP-{current_year}-{next_number:04d}"}
 
 @app.get("/api/wildlife-permits/{permit_id}")
 async def get_wildlife_permit(permit_id: str):
     """Get specific wildlife permit"""
-    permit = permits_collection.find_one({"id": permit_id}, {"_id": 0})
+    permit = await permits_collection.find_one({"id": permit_id}, {"_id": 0})
     if not permit:
         raise HTTPException(status_code=404, detail="Wildlife permit not found")
     return permit
@@ -1571,14 +4210,11 @@ async def update_wildlife_permit(permit_id: str, permit: WildlifePermit):
     permit_dict["updated_at"] = datetime.now().isoformat()
     
     # Don't update permit_number if it already exists
-    existing_permit = permits_collection.find_one({"id": permit_id})
+    existing_permit = await permits_collection.find_one({"id": permit_id})
     if existing_permit and existing_permit.get("permit_number"):
         permit_dict["permit_number"] = existing_permit["permit_number"]
     
-    result = permits_collection.update_one(
-        {"id": permit_id}, 
-        {"$set": permit_dict}
-    )
+    result = await update_document(permits_collection, permit_id, permit_dict)
     if result.modified_count:
         return {"message": "Wildlife permit updated successfully"}
     raise HTTPException(status_code=404, detail="Wildlife permit not found")
@@ -1586,19 +4222,395 @@ async def update_wildlife_permit(permit_id: str, permit: WildlifePermit):
 @app.delete("/api/wildlife-permits/{permit_id}")
 async def delete_wildlife_permit(permit_id: str):
     """Delete wildlife permit"""
-    permit = permits_collection.find_one({"id": permit_id})
+    permit = await permits_collection.find_one({"id": permit_id})
     if not permit:
         raise HTTPException(status_code=404, detail="Wildlife permit not found")
     
-    result = permits_collection.delete_one({"id": permit_id})
+    result = await delete_document(permits_collection, permit_id)
     if result.deleted_count:
         return {"message": f"Wildlife permit {permit.get('permit_number', permit_id)} deleted successfully"}
     raise HTTPException(status_code=404, detail="Wildlife permit not found")
 
-@app.get("/api/wildlife-permits/next-number")
-async def get_next_permit_number():
-    """Get the next permit number that will be assigned"""
-    return {"next_permit_number": generate_permit_number()}
+# Export endpoints
+# slug -> (collection, model whose fields become CSV columns, field used by date_from/date_to)
+EXPORT_COLLECTIONS = {
+    "birds": (birds_collection, Bird, "birth_date"),
+    "breeding-pairs": (breeding_pairs_collection, BreedingPair, "pair_date"),
+    "breeding-records": (breeding_records_collection, BreedingRecord, "egg_laying_date"),
+    "clutches": (clutches_collection, Clutch, "egg_laying_date"),
+    "chicks": (chicks_collection, Chick, "hatch_date"),
+    "transactions": (transactions_collection, Transaction, "date"),
+    "license": (license_collection, License, "issue_date"),
+    "incubators": (incubators_collection, Incubator, None),
+    "artificial-incubation": (artificial_incubation_collection, ArtificialIncubation, "transfer_date"),
+    "incubation-logs": (incubation_logs_collection, IncubationLog, "log_date"),
+    "species": (species_collection, Species, None),
+    "daily-monitoring": (daily_monitoring_collection, DailyMonitoring, "date"),
+    "wildlife-permits": (permits_collection, WildlifePermit, "purchase_date"),
+}
+EXPORT_BATCH_SIZE = 500
+
+def csv_value(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return "" if value is None else value
+
+async def export_rows(cursor, export_format, columns):
+    """Yield the export body in text chunks of EXPORT_BATCH_SIZE documents"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == "csv":
+        writer.writerow(columns)
+    
+    count = 0
+    async for doc in cursor:
+        if export_format == "csv":
+            writer.writerow([csv_value(doc.get(column)) for column in columns])
+        else:
+            buffer.write(json.dumps(doc, default=str))
+            buffer.write("\n")
+        count += 1
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+async def gzip_chunks(chunks):
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk.encode())
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+@app.get("/api/export/{collection_name}")
+async def export_collection(
+    collection_name: str,
+    export_format: str = Query("ndjson", alias="format"),
+    compress: bool = Query(False, alias="gzip"),
+    status: str = None,
+    incubator_id: str = None,
+    date_from: str = None,
+    date_to: str = None
+):
+    """Stream a full collection dump as NDJSON or CSV, optionally gzip-compressed"""
+    if collection_name not in EXPORT_COLLECTIONS:
+        raise HTTPException(status_code=404, detail=f"Unknown export collection '{collection_name}'")
+    if export_format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=400, detail="Export format must be 'ndjson' or 'csv'")
+    
+    collection, model, date_field = EXPORT_COLLECTIONS[collection_name]
+    query = {}
+    if status:
+        query["status"] = status
+    if incubator_id:
+        query["incubator_id"] = incubator_id
+    
+    if date_from or date_to:
+        if not date_field:
+            raise HTTPException(status_code=400, detail=f"'{collection_name}' has no date to filter on")
+        date_query = {}
+        if date_from:
+            date_query["$gte"] = date_from
+        if date_to:
+            date_query["$lte"] = date_to
+        query[date_field] = date_query
+    
+    cursor = collection.find(query, {"_id": 0}).sort("_id", 1).batch_size(EXPORT_BATCH_SIZE)
+    body = export_rows(cursor, export_format, list(model.model_fields))
+    
+    filename = f"{collection_name}-{datetime.now().strftime('%Y%m%d')}.{export_format}"
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    if compress:
+        body = gzip_chunks(body)
+        filename += ".gz"
+        media_type = "application/gzip"
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+# Bulk import endpoints
+# entity -> (collection, model each row is validated against)
+BULK_ENTITIES = {
+    "birds": (birds_collection, Bird),
+    "chicks": (chicks_collection, Chick),
+    "transactions": (transactions_collection, Transaction),
+}
+BULK_CHUNK_SIZE = 1000
+MAX_BULK_ERRORS = 1000
+
+def read_bulk_rows(upload, upload_format):
+    """Yield (row number, row dict or parse error) from an NDJSON or CSV upload without loading it whole"""
+    text = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    if upload_format == "csv":
+        for row_number, row in enumerate(csv.DictReader(text), start=1):
+            # Empty cells fall back to the model defaults
+            yield row_number, {field: value for field, value in row.items() if field and value != ""}
+        return
+    
+    for row_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield row_number, f"Invalid JSON: {e}"
+            continue
+        yield row_number, row if isinstance(row, dict) else "Row must be a JSON object"
+
+def parse_bulk_rows(rows, model, created_at, limit):
+    """Read and validate up to limit rows of a read_bulk_rows iterator.
+    
+    Blocking (file reads and parsing), so bulk_import runs it in a worker thread.
+    Returns (rows read, [(row number, document)], row errors).
+    """
+    parsed = []
+    errors = []
+    count = 0
+    for row_number, row in itertools.islice(rows, limit):
+        count += 1
+        if isinstance(row, str):
+            errors.append({"row": row_number, "errors": [row]})
+            continue
+        try:
+            doc = model(**row).dict()
+        except ValidationError as e:
+            errors.append({
+                "row": row_number,
+                "errors": [f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()]
+            })
+            continue
+        
+        doc["id"] = str(uuid.uuid4())
+        doc["created_at"] = created_at
+        parsed.append((row_number, doc))
+    return count, parsed, errors
+
+async def import_chunk(entity, collection, chunk):
+    """Insert one chunk of validated (row number, document) pairs; returns row errors"""
+    errors = []
+    if entity == "chicks":
+        # Same check as create_chick, batched for the whole chunk
+        clutches = await load_by_ids(clutches_collection, [doc["clutch_id"] for _, doc in chunk])
+        errors = [
+            {"row": row_number, "errors": ["Clutch not found"]}
+            for row_number, doc in chunk if doc["clutch_id"] not in clutches
+        ]
+        chunk = [(row_number, doc) for row_number, doc in chunk if doc["clutch_id"] in clutches]
+    elif entity == "birds":
+        # Same checks as create_bird for rows registering a hatched chick
+        chick_ids = [doc["chick_id"] for _, doc in chunk if doc.get("chick_id")]
+        chicks = await load_by_ids(chicks_collection, chick_ids)
+        registered = await load_by_ids(birds_collection, chick_ids)
+        accepted = []
+        for row_number, doc in chunk:
+            if doc.get("chick_id") and doc["chick_id"] not in chicks:
+                errors.append({"row": row_number, "errors": ["Chick not found"]})
+            elif doc.get("chick_id") and doc["chick_id"] in registered:
+                errors.append({"row": row_number, "errors": ["Chick is already registered as a bird"]})
+            else:
+                if doc.get("chick_id"):
+                    doc["id"] = doc["chick_id"]
+                accepted.append((row_number, doc))
+        chunk = accepted
+    
+    if chunk:
+        failed = await insert_documents(collection, [doc for _, doc in chunk])
+        errors.extend({"row": chunk[i][0], "errors": [message]} for i, message in failed.items())
+    return errors
+
+@app.post("/api/bulk/{entity}")
+async def bulk_import(entity: str, file: UploadFile = File(...), upload_format: str = Query(None, alias="format")):
+    """Import birds, chicks or transactions from an NDJSON or CSV upload.
+    
+    Bird rows may carry chick_id to register a hatched chick, as with POST /api/birds.
+    """
+    if entity not in BULK_ENTITIES:
+        raise HTTPException(status_code=404, detail=f"Bulk import is not supported for '{entity}'")
+    
+    upload_format = upload_format or ("csv" if (file.filename or "").lower().endswith(".csv") else "ndjson")
+    if upload_format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=400, detail="Import format must be 'ndjson' or 'csv'")
+    
+    collection, model = BULK_ENTITIES[entity]
+    total_rows = 0
+    inserted = 0
+    errors = []
+    created_at = datetime.now().isoformat()
+    rows = read_bulk_rows(file, upload_format)
+    
+    try:
+        while True:
+            count, chunk, row_errors = await run_in_threadpool(parse_bulk_rows, rows, model, created_at, BULK_CHUNK_SIZE)
+            if not count:
+                break
+            total_rows += count
+            errors.extend(row_errors)
+            if chunk:
+                chunk_errors = await import_chunk(entity, collection, chunk)
+                inserted += len(chunk) - len(chunk_errors)
+                errors.extend(chunk_errors)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Could not read upload: {e}")
+    
+    errors.sort(key=lambda error: error["row"])
+    return {
+        "message": f"Imported {inserted} of {total_rows} {entity}",
+        "total_rows": total_rows,
+        "inserted": inserted,
+        "failed": len(errors),
+        "errors": errors[:MAX_BULK_ERRORS],
+        "errors_truncated": len(errors) > MAX_BULK_ERRORS
+    }
+
+# Bootstrap: everything the app loads on startup in one round trip
+BOOTSTRAP_SOURCES = [
+    birds_collection, breeding_pairs_collection, clutches_collection, chicks_collection,
+    transactions_collection, incubators_collection, artificial_incubation_collection,
+    species_collection, daily_monitoring_collection, permits_collection, license_collection,
+    dashboard_stats_collection, exchange_rates_collection,
+]
+
+async def id_map(collection, transform=None):
+    docs = {}
+    async for doc in collection.find({}, {"_id": 0}):
+        docs[doc["id"]] = transform(doc) if transform else doc
+    return docs
+
+@app.get("/api/bootstrap")
+@conditional_get(BOOTSTRAP_SOURCES, daily=True)
+async def get_bootstrap():
+    """Initial data of the app, loaded concurrently.
+    
+    Birds, breeding pairs, clutches and incubators are sent once each under
+    entities, keyed by id; lists reference them by id instead of embedding them
+    (pair.male_bird_id, clutch.breeding_pair_id, chick.clutch_id,
+    incubation.clutch_id/incubator_id). The remaining sections are the
+    responses of the matching list endpoints.
+    """
+    (
+        birds, pairs, clutches, incubators, chicks, incubations,
+        transactions, species, monitoring, permits, license_doc, dashboard, notifications
+    ) = await asyncio.gather(
+        id_map(birds_collection, set_license_alert),
+        id_map(breeding_pairs_collection, set_license_alert),
+        id_map(clutches_collection),
+        id_map(incubators_collection),
+        chicks_collection.find({}, {"_id": 0}).sort("_id", 1).to_list(None),
+        artificial_incubation_collection.find({}, {"_id": 0}).to_list(None),
+        get_transactions(limit=None, after=None, fields=None),
+        get_species(),
+        get_daily_monitoring(incubator_id=None, date_from=None, date_to=None, limit=None, after=None, fields=None),
+        get_wildlife_permits(
+            status=None, customer_name=None, date_from=None, date_to=None, limit=None, after=None, fields=None
+        ),
+        get_license(),
+        get_dashboard(),
+        get_notifications(since=None),
+    )
+    for chick in chicks:
+        set_chick_age(chick)
+    
+    return fast_json_response({
+        "entities": {"birds": birds, "breeding_pairs": pairs, "clutches": clutches, "incubators": incubators},
+        "chicks": chicks,
+        "artificial_incubations": incubations,
+        "transactions": transactions["transactions"],
+        "species": species["species"],
+        "monitoring_entries": monitoring["monitoring_entries"],
+        "permits": permits["permits"],
+        "license": license_doc,
+        "dashboard": dashboard,
+        "notifications": notifications,
+    })
+
+# Admin endpoints
+@app.get("/api/admin/cache")
+async def get_cache_metrics():
+    """Hit/miss metrics of this worker's reference data cache and the response cache"""
+    return {
+        **reference_cache.metrics(),
+        "response_cache": {
+            "backend": type(response_cache_backend).__name__,
+            "ttl_seconds": RESPONSE_CACHE_TTL,
+            "endpoints": response_cache_stats
+        },
+        "pedigree": pedigree_index.metrics()
+    }
+
+@app.post("/api/admin/cache/clear")
+async def clear_cache():
+    reference_cache.clear()
+    return {"message": "Cache cleared successfully"}
+
+@app.post("/api/admin/dashboard-stats/rebuild")
+async def rebuild_dashboard_stats_endpoint():
+    """Recount the materialized dashboard stats (recovery after manual database edits)"""
+    await rebuild_dashboard_stats()
+    stats = await get_dashboard_stats()
+    stats.pop("_id", None)
+    return {"message": "Dashboard stats rebuilt successfully", "stats": stats}
+
+@app.post("/api/admin/monitoring-readings/rebuild")
+async def rebuild_monitoring_readings_endpoint():
+    """Regenerate the time-series readings (recovery after manual database edits)"""
+    inserted = await rebuild_monitoring_readings()
+    return {"message": "Monitoring readings rebuilt successfully", "readings": inserted}
+
+@app.get("/api/admin/telemetry")
+async def get_telemetry_metrics():
+    """Ingestion counters of this worker's telemetry buffer"""
+    return telemetry_buffer.metrics()
+
+@app.post("/api/admin/telemetry/flush")
+async def flush_telemetry():
+    flushed = await telemetry_buffer.flush()
+    return {"message": "Telemetry flushed successfully", "flushed": flushed, **telemetry_buffer.metrics()}
+
+@app.post("/api/admin/financial-rollups/rebuild")
+async def rebuild_financial_rollups_endpoint():
+    """Recompute the monthly financial rollups (recovery after manual database edits)"""
+    rollups = await rebuild_financial_rollups()
+    return {"message": "Financial rollups rebuilt successfully", "rollups": rollups}
+
+@app.post("/api/admin/profitability/rebuild")
+async def rebuild_profitability_endpoint():
+    """Recompute the profitability ledger, e.g. after exchange rates changed"""
+    entries = await rebuild_profitability_ledger()
+    return {"message": "Profitability ledger rebuilt successfully", "entries": entries}
+
+@app.get("/api/admin/indexes")
+async def get_index_status():
+    """Report build status of the declared indexes and what exists on each collection"""
+    existing = {}
+    for collection in INDEX_SPECS:
+        try:
+            existing[collection.name] = list((await collection.index_information()).keys())
+        except PyMongoError as e:
+            existing[collection.name] = {"error": str(e)}
+    
+    states = [status["state"] for status in index_status.values()]
+    return {
+        "summary": {
+            "declared": sum(len(specs) for specs in INDEX_SPECS.values()),
+            "ready": states.count("ready"),
+            "building": states.count("building"),
+            "failed": states.count("failed")
+        },
+        "indexes": index_status,
+        "existing": existing
+    }
+
+@app.post("/api/admin/indexes/rebuild")
+async def rebuild_indexes():
+    """Re-run the index bootstrapper (e.g. after fixing duplicate ids)"""
+    await ensure_indexes()
+    return await get_index_status()
 
 if __name__ == "__main__":
     import uvicorn
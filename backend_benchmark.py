@@ -0,0 +1,165 @@
+"""Server-side benchmarks for the breeding API.
+
+Seeds a throwaway database (BENCHMARK_DB_NAME, default "parrot_breeding_benchmark")
+on the MongoDB at MONGO_URL with synthetic data at increasing sizes and times the
+endpoint handlers directly, so the numbers exclude HTTP overhead. The database is
+dropped before seeding and afterwards, so the benchmark refuses to run unless its
+name contains "benchmark" or "test"; MONGO_DB_NAME is ignored.
+
+    python backend_benchmark.py breeding-report --max-clutches 50000
+    python backend_benchmark.py serialization --max-clutches 10000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+
+THROWAWAY_DB_MARKERS = ("benchmark", "test")
+
+# Always point the server at the benchmark database, never at the app's own
+os.environ["MONGO_DB_NAME"] = os.environ.get("BENCHMARK_DB_NAME", "parrot_breeding_benchmark")
+if not any(marker in os.environ["MONGO_DB_NAME"].lower() for marker in THROWAWAY_DB_MARKERS):
+    sys.exit(
+        f"Refusing to benchmark against {os.environ['MONGO_DB_NAME']!r}: the database is dropped, "
+        f"so BENCHMARK_DB_NAME must contain one of {', '.join(THROWAWAY_DB_MARKERS)}"
+    )
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+import server  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+
+SPECIES = ["African Grey", "Blue and Gold Macaw", "Sun Conure", "Eclectus", "Cockatiel"]
+
+async def seed_breeding_data(clutch_count, clutches_per_pair=10):
+    """Insert birds, pairs and clutches; one pair per clutches_per_pair clutches"""
+    await server.client.drop_database(server.db.name)
+    rng = random.Random(clutch_count)
+    pair_count = max(1, clutch_count // clutches_per_pair)
+
+    birds, pairs = [], []
+    for i in range(pair_count):
+        species = rng.choice(SPECIES)
+        male = {"id": str(uuid.uuid4()), "species": species, "gender": "male", "ring_number": f"M{i:06d}", "status": "active"}
+        female = {"id": str(uuid.uuid4()), "species": species, "gender": "female", "ring_number": f"F{i:06d}", "status": "active"}
+        birds.extend([male, female])
+        pairs.append({
+            "id": str(uuid.uuid4()),
+            "male_bird_id": male["id"],
+            "female_bird_id": female["id"],
+            "pair_name": f"Pair {i}",
+            "pair_date": "2020-01-01",
+            "status": "active",
+        })
+
+    clutches = []
+    for i in range(clutch_count):
+        eggs = rng.randint(1, 6)
+        clutches.append({
+            "id": str(uuid.uuid4()),
+            "breeding_pair_id": pairs[i % pair_count]["id"],
+            "clutch_number": i // pair_count + 1,
+            "egg_laying_date": "2024-01-01",
+            "eggs_laid": eggs,
+            "expected_hatch_date": "2024-01-29",
+            "hatched_count": rng.randint(0, eggs),
+            "status": "completed",
+        })
+
+    await server.birds_collection.insert_many(birds, ordered=False)
+    await server.breeding_pairs_collection.insert_many(pairs, ordered=False)
+    for start in range(0, len(clutches), 10000):
+        await server.clutches_collection.insert_many(clutches[start:start + 10000], ordered=False)
+    await server.ensure_indexes()
+
+async def seed_chicks(clutch_count, chicks_per_clutch=2):
+    """Insert chicks for the first clutches seeded by seed_breeding_data"""
+    clutch_ids = [clutch["id"] async for clutch in server.clutches_collection.find({}, {"id": 1}).limit(clutch_count)]
+    chicks = [
+        {"id": str(uuid.uuid4()), "clutch_id": clutch_id, "hatch_date": "2024-01-29", "status": "alive"}
+        for clutch_id in clutch_ids for _ in range(chicks_per_clutch)
+    ]
+    for start in range(0, len(chicks), 10000):
+        await server.chicks_collection.insert_many(chicks[start:start + 10000], ordered=False)
+    return len(chicks)
+
+def time_sync(func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+async def time_call(func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+async def bench_breeding_report(args):
+    sizes = []
+    size = args.max_clutches
+    while size >= args.min_clutches:
+        sizes.insert(0, size)
+        size //= 2
+
+    # The endpoint is response-cached on collection versions, which raw seeding does
+    # not bump; time the computation itself
+    compute_report = server.get_breeding_report.__wrapped__
+    
+    print(f"{'clutches':>10}{'pairs':>8}{'best ms':>10}{'us/clutch':>11}")
+    for clutch_count in sizes:
+        await seed_breeding_data(clutch_count)
+        report = await compute_report()
+        assert report["summary"]["total_clutches"] == clutch_count, report["summary"]
+        best = await time_call(compute_report, args.repeat)
+        print(
+            f"{clutch_count:>10}{max(1, clutch_count // 10):>8}{best * 1000:>10.1f}"
+            f"{best * 1e6 / clutch_count:>11.2f}"
+        )
+    print("Linear scaling shows up as a roughly constant us/clutch column.")
+
+async def bench_serialization(args):
+    """Bytes and encode time of /api/chicks, embedded vs slim, via the stdlib path FastAPI
+    uses for returned dicts (jsonable_encoder + json) and via orjson"""
+    await seed_breeding_data(args.max_clutches)
+    chick_count = await seed_chicks(args.max_clutches)
+    print(f"{chick_count} chicks")
+    print(f"{'mode':<10}{'bytes':>12}{'stdlib ms':>12}{'orjson ms':>12}")
+    for slim in (False, True):
+        response = await server.get_chicks(slim=slim)
+        content = json.loads(response.body)
+        stdlib = time_sync(lambda: JSONResponse(jsonable_encoder(content)), args.repeat)
+        fast = time_sync(lambda: ORJSONResponse(content), args.repeat) if server.orjson else float("nan")
+        print(f"{'slim' if slim else 'embedded':<10}{len(response.body):>12}{stdlib * 1000:>12.1f}{fast * 1000:>12.1f}")
+
+BENCHMARKS = {
+    "breeding-report": bench_breeding_report,
+    "serialization": bench_serialization,
+}
+
+async def main():
+    parser = argparse.ArgumentParser(description="Server-side benchmarks for the breeding API")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--min-clutches", type=int, default=6250)
+    parser.add_argument("--max-clutches", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Database: {server.db.name} on {server.MONGO_URL}")
+    try:
+        await BENCHMARKS[args.benchmark](args)
+    finally:
+        await server.client.drop_database(server.db.name)
+
+if __name__ == "__main__":
+    asyncio.run(main())
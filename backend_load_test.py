@@ -0,0 +1,114 @@
+"""Concurrent throughput check for the breeding API.
+
+Fires GET requests at a handful of read endpoints from many threads at once and
+reports requests/second and latency percentiles per endpoint. Save a run against
+the server before a change and compare the run after it with it, e.g.:
+
+    python backend_load_test.py --base-url http://localhost:8001 --save before.json
+    python backend_load_test.py --base-url http://localhost:8001 --compare before.json
+
+The default endpoints exist in every build; pass --endpoint for newer ones such
+as /api/bootstrap. Endpoints that answered 404 in the compared run are skipped,
+since a build without them has nothing to compare against.
+"""
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# Read endpoints present in every build of the API, so runs before and after a change stay comparable
+DEFAULT_ENDPOINTS = [
+    "/api/dashboard",
+    "/api/reports/breeding",
+    "/api/birds",
+    "/api/breeding-pairs",
+    "/api/chicks",
+    "/api/notifications",
+]
+
+def run_endpoint(base_url, endpoint, concurrency, requests_per_worker):
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def worker(_):
+        latencies = []
+        errors = 0
+        not_found = 0
+        for _ in range(requests_per_worker):
+            started = time.perf_counter()
+            try:
+                response = session.get(f"{base_url}{endpoint}", timeout=60)
+                if response.status_code != 200:
+                    errors += 1
+                    not_found += response.status_code == 404
+            except requests.RequestException:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+        return latencies, errors, not_found
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(l for worker_latencies, _, _ in results for l in worker_latencies)
+    return {
+        "endpoint": endpoint,
+        "requests": len(latencies),
+        "errors": sum(worker_errors for _, worker_errors, _ in results),
+        "not_found": sum(worker_not_found for _, _, worker_not_found in results),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+        "max_ms": round(latencies[-1] * 1000, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent throughput check for the breeding API")
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests-per-worker", type=int, default=20)
+    parser.add_argument("--endpoint", action="append", dest="endpoints")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of an earlier --save run to show req/s changes against")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {stats["endpoint"]: stats for stats in json.load(f)["results"]}
+
+    print(f"Target: {args.base_url}  concurrency={args.concurrency}  requests/worker={args.requests_per_worker}")
+    print(f"{'endpoint':<28}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'errors':>8}" + (f"{'vs base':>10}" if baseline else ""))
+    results = []
+    for endpoint in args.endpoints or DEFAULT_ENDPOINTS:
+        before = baseline.get(endpoint)
+        if before and before.get("not_found"):
+            print(f"{endpoint:<28}skipped: 404 in {args.compare}")
+            continue
+        stats = run_endpoint(args.base_url, endpoint, args.concurrency, args.requests_per_worker)
+        results.append(stats)
+        line = (
+            f"{stats['endpoint']:<28}{stats['requests_per_second']:>10}{stats['p50_ms']:>10}"
+            f"{stats['p95_ms']:>10}{stats['max_ms']:>10}{stats['errors']:>8}"
+        )
+        if before and before["requests_per_second"]:
+            line += f"{stats['requests_per_second'] / before['requests_per_second']:>9.2f}x"
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "base_url": args.base_url,
+                "concurrency": args.concurrency,
+                "requests_per_worker": args.requests_per_worker,
+                "results": results
+            }, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -1010,6 +1010,23 @@ class ParrotBreedingAPITest(unittest.TestCase):
         # Reset species_id to None since it's deleted
         self.species_id = None
     
+    def delete_test_data(self, paths):
+        """Delete what a test created, dependents first"""
+        for path in paths:
+            response = requests.delete(f"{BASE_URL}{path}")
+            if response.status_code != 200:
+                print(f"⚠️ Could not delete {path}")
+    
+    def create_test_pair(self, tag):
+        """Create a male and a female bird and pair them; returns (male_id, female_id, pair_id)"""
+        male_id = requests.post(f"{BASE_URL}/api/birds", json=dict(self.test_male_bird, ring_number=f"M{tag}")).json()["bird_id"]
+        female_id = requests.post(f"{BASE_URL}/api/birds", json=dict(self.test_female_bird, ring_number=f"F{tag}")).json()["bird_id"]
+        pair_id = requests.post(f"{BASE_URL}/api/breeding-pairs", json={
+            "male_bird_id": male_id, "female_bird_id": female_id,
+            "pair_name": f"Pair {tag}", "pair_date": datetime.now().strftime("%Y-%m-%d")
+        }).json()["pair_id"]
+        return male_id, female_id, pair_id
+
     def test_21_cleanup(self):
         """Clean up test data"""
         print("\n--- Cleaning Up Test Data ---")
@@ -1204,6 +1221,856 @@ class ParrotBreedingAPITest(unittest.TestCase):
         else:
             print(f"⚠️ Unexpected status for non-existent incubator: {response.status_code}")
 
+
+    def test_23_admin_index_status(self):
+        """Test index bootstrapper status endpoint"""
+        print("\n--- Testing Index Status ---")
+        
+        response = requests.get(f"{BASE_URL}/api/admin/indexes")
+        self.assertEqual(response.status_code, 200)
+        status = response.json()
+        
+        self.assertIn("summary", status)
+        self.assertIn("indexes", status)
+        self.assertEqual(status["summary"]["failed"], 0)
+        self.assertIn("id_1", status["existing"]["birds"])
+        
+        print(f"✅ Index status retrieved successfully")
+        print(f"   - Declared: {status['summary']['declared']}")
+        print(f"   - Ready: {status['summary']['ready']}")
+
+
+    def test_24_list_pagination(self):
+        """Test keyset pagination and field projection on list endpoints"""
+        print("\n--- Testing List Pagination ---")
+        
+        # Make sure there is more than one page
+        created = []
+        for bird in [self.test_male_bird, self.test_female_bird]:
+            response = requests.post(f"{BASE_URL}/api/birds", json=bird)
+            self.assertEqual(response.status_code, 200)
+            created.append(f"/api/birds/{response.json()['bird_id']}")
+        
+        seen_ids = []
+        cursor = None
+        while True:
+            params = {"limit": 1, "fields": "ring_number"}
+            if cursor:
+                params["after"] = cursor
+            response = requests.get(f"{BASE_URL}/api/birds", params=params)
+            self.assertEqual(response.status_code, 200)
+            page = response.json()
+            self.assertIn("next_cursor", page)
+            self.assertLessEqual(len(page["birds"]), 1)
+            for bird in page["birds"]:
+                self.assertEqual(set(bird.keys()) - {"days_until_expiry", "license_alert"}, {"id", "ring_number"})
+                seen_ids.append(bird["id"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        
+        self.assertEqual(len(seen_ids), len(set(seen_ids)))
+        self.assertGreaterEqual(len(seen_ids), 2)
+        
+        response = requests.get(f"{BASE_URL}/api/birds", params={"limit": 1, "after": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+        
+        print(f"✅ Paged through {len(seen_ids)} birds one at a time without duplicates")
+        self.delete_test_data(created)
+
+
+    def test_25_streaming_export(self):
+        """Test NDJSON/CSV collection export"""
+        print("\n--- Testing Streaming Export ---")
+        
+        response = requests.get(f"{BASE_URL}/api/export/transactions")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("attachment", response.headers.get("Content-Disposition", ""))
+        rows = [json.loads(line) for line in response.text.splitlines() if line]
+        for row in rows:
+            self.assertIn("amount", row)
+        print(f"✅ Exported {len(rows)} transactions as NDJSON")
+        
+        response = requests.get(f"{BASE_URL}/api/export/wildlife-permits", params={"format": "csv", "date_from": "2000-01-01"})
+        self.assertEqual(response.status_code, 200)
+        header = response.text.splitlines()[0]
+        self.assertTrue(header.startswith("id,permit_number,"))
+        print(f"✅ Exported wildlife permits as CSV")
+        
+        response = requests.get(f"{BASE_URL}/api/export/birds", params={"gzip": "true"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get("Content-Type"), "application/gzip")
+        
+        response = requests.get(f"{BASE_URL}/api/export/unknown")
+        self.assertEqual(response.status_code, 404)
+        print(f"✅ Gzip export and unknown collection handling work")
+
+
+    def test_26_bulk_import(self):
+        """Test NDJSON/CSV bulk import with per-row errors"""
+        print("\n--- Testing Bulk Import ---")
+        
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        rows = [dict(self.test_male_bird, ring_number=f"BULK{i}-{timestamp}") for i in range(3)]
+        ndjson = "\n".join(json.dumps(row) for row in rows) + '\n{"species": "No gender"}\n'
+        response = requests.post(
+            f"{BASE_URL}/api/bulk/birds",
+            files={"file": ("birds.ndjson", ndjson, "application/x-ndjson")}
+        )
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertEqual(result["total_rows"], 4)
+        self.assertEqual(result["inserted"], 3)
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(result["errors"][0]["row"], 4)
+        print(f"✅ Imported {result['inserted']} birds, rejected row {result['errors'][0]['row']}")
+        
+        csv_data = f"transaction_type,amount,date,description\nexpense,12.50,2024-01-01,Seed mix {timestamp}\nexpense,abc,2024-01-02,Bad amount\n"
+        response = requests.post(
+            f"{BASE_URL}/api/bulk/transactions",
+            files={"file": ("transactions.csv", csv_data, "text/csv")}
+        )
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertEqual(result["inserted"], 1)
+        self.assertEqual(result["errors"][0]["row"], 2)
+        print(f"✅ CSV import validated rows individually")
+        
+        response = requests.post(
+            f"{BASE_URL}/api/bulk/species",
+            files={"file": ("species.ndjson", "", "application/x-ndjson")}
+        )
+        self.assertEqual(response.status_code, 404)
+        
+        # Imports don't return ids; find the rows by their tagged ring numbers and description
+        birds = requests.get(f"{BASE_URL}/api/birds", params={"fields": "ring_number"}).json()["birds"]
+        transactions = requests.get(f"{BASE_URL}/api/transactions", params={"fields": "description"}).json()["transactions"]
+        imported = [f"/api/birds/{bird['id']}" for bird in birds if (bird.get("ring_number") or "").endswith(timestamp)]
+        imported += [f"/api/transactions/{t['id']}" for t in transactions if t.get("description") == f"Seed mix {timestamp}"]
+        self.assertEqual(len(imported), 4)
+        self.delete_test_data(imported)
+
+
+    def test_27_permit_number_allocation(self):
+        """Test permit numbers come from the per-year counter"""
+        print("\n--- Testing Permit Number Allocation ---")
+        
+        response = requests.get(f"{BASE_URL}/api/wildlife-permits/next-number")
+        self.assertEqual(response.status_code, 200)
+        peeked = response.json()["next_permit_number"]
+        self.assertTrue(peeked.startswith(f"WP-{datetime.now().year}-"))
+        
+        # Peeking does not consume a number
+        response = requests.get(f"{BASE_URL}/api/wildlife-permits/next-number")
+        self.assertEqual(response.json()["next_permit_number"], peeked)
+        print(f"✅ Next permit number: {peeked}")
+
+
+    def test_28_notifications_since(self):
+        """Test cheap notification polling with since="""
+        print("\n--- Testing Notification Polling ---")
+        
+        response = requests.get(f"{BASE_URL}/api/notifications")
+        self.assertEqual(response.status_code, 200)
+        first = response.json()
+        self.assertTrue(first["changed"])
+        self.assertIn("generated_at", first)
+        
+        response = requests.get(f"{BASE_URL}/api/notifications", params={"since": first["generated_at"]})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("changed", response.json())
+        
+        response = requests.get(f"{BASE_URL}/api/notifications", params={"since": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+        print(f"✅ Notification polling with since= works")
+
+
+    def test_29_notification_stream(self):
+        """Test the Server-Sent Events notification stream"""
+        print("\n--- Testing Notification Stream ---")
+        
+        with requests.get(f"{BASE_URL}/api/notifications/stream", stream=True, timeout=30) as response:
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.headers.get("Content-Type", "").startswith("text/event-stream"))
+            
+            # The current counts are always pushed on connect
+            events = []
+            for line in response.iter_lines(decode_unicode=True):
+                if line and line.startswith("event: "):
+                    events.append(line[len("event: "):])
+                if "counts" in events:
+                    break
+        
+        self.assertIn("counts", events)
+        print(f"✅ Received initial stream events: {', '.join(events)}")
+
+    def test_30_genealogy_tree(self):
+        """Test the multi-generation genealogy tree"""
+        print("\n--- Testing Genealogy Tree ---")
+        
+        if not self.male_bird_id:
+            self.skipTest("Male bird ID not available")
+        
+        response = requests.get(f"{BASE_URL}/api/genealogy/{self.male_bird_id}/tree", params={"depth": 2})
+        self.assertEqual(response.status_code, 200)
+        tree = response.json()
+        self.assertEqual(tree["root"], self.male_bird_id)
+        node_ids = [node["id"] for node in tree["nodes"]]
+        self.assertIn(self.male_bird_id, node_ids)
+        self.assertEqual(len(node_ids), len(set(node_ids)))
+        for edge in tree["edges"]:
+            self.assertIn(edge["parent"], node_ids)
+            self.assertIn(edge["child"], node_ids)
+        print(f"✅ Genealogy tree has {len(tree['nodes'])} nodes and {len(tree['edges'])} edges")
+        
+        response = requests.get(f"{BASE_URL}/api/genealogy/{self.male_bird_id}/tree", params={"direction": "sideways"})
+        self.assertEqual(response.status_code, 400)
+        
+        response = requests.get(f"{BASE_URL}/api/genealogy/nonexistent-bird-id/tree")
+        self.assertEqual(response.status_code, 404)
+        print(f"✅ Genealogy tree rejects bad input")
+
+    def test_31_kinship(self):
+        """Test kinship / inbreeding coefficient of two candidates"""
+        print("\n--- Testing Kinship ---")
+        
+        # Known pedigree: two unrelated founders and a son and daughter of theirs registered as birds
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        sire_id = requests.post(f"{BASE_URL}/api/birds", json={
+            "species": "African Grey", "gender": "male", "ring_number": f"KS{timestamp}"
+        }).json()["bird_id"]
+        dam_id = requests.post(f"{BASE_URL}/api/birds", json={
+            "species": "African Grey", "gender": "female", "ring_number": f"KD{timestamp}"
+        }).json()["bird_id"]
+        pair_id = requests.post(f"{BASE_URL}/api/breeding-pairs", json={
+            "male_bird_id": sire_id, "female_bird_id": dam_id,
+            "pair_name": f"Kinship Pair {timestamp}", "pair_date": "2020-01-01"
+        }).json()["pair_id"]
+        clutch_id = requests.post(f"{BASE_URL}/api/clutches", json={
+            "breeding_pair_id": pair_id, "clutch_number": 1, "egg_laying_date": "2020-02-01",
+            "eggs_laid": 2, "expected_hatch_date": "2020-03-01"
+        }).json()["clutch_id"]
+        offspring = [
+            requests.post(f"{BASE_URL}/api/chicks", json={
+                "clutch_id": clutch_id, "chick_number": chick_number, "hatch_date": "2020-03-01"
+            }).json()["chick_id"]
+            for chick_number in (1, 2)
+        ]
+        son_id, daughter_id = offspring
+        # The son is registered through POST /api/birds, the daughter through the bulk import
+        response = requests.post(f"{BASE_URL}/api/birds", json={
+            "chick_id": son_id, "species": "African Grey", "gender": "male", "ring_number": f"KC1{timestamp}"
+        })
+        self.assertEqual(response.json()["bird_id"], son_id)
+        daughter_row = {"chick_id": daughter_id, "species": "African Grey", "gender": "female", "ring_number": f"KC2{timestamp}"}
+        ndjson = json.dumps(daughter_row) + "\n" + json.dumps(dict(daughter_row, chick_id="nonexistent-chick-id")) + "\n"
+        result = requests.post(
+            f"{BASE_URL}/api/bulk/birds",
+            files={"file": ("birds.ndjson", ndjson, "application/x-ndjson")}
+        ).json()
+        self.assertEqual(result["inserted"], 1)
+        self.assertEqual(result["errors"], [{"row": 2, "errors": ["Chick not found"]}])
+        self.assertEqual(requests.get(f"{BASE_URL}/api/birds/{daughter_id}").status_code, 200)
+        
+        response = requests.post(f"{BASE_URL}/api/birds", json={"chick_id": son_id, "species": "African Grey", "gender": "male"})
+        self.assertEqual(response.status_code, 400)
+        response = requests.post(f"{BASE_URL}/api/birds", json={"chick_id": "nonexistent-chick-id", "species": "African Grey", "gender": "male"})
+        self.assertEqual(response.status_code, 404)
+        print(f"✅ Hatched chicks registered as birds under their chick ids")
+        
+        def kinship(male, female):
+            response = requests.get(f"{BASE_URL}/api/genetics/kinship", params={"male": male, "female": female})
+            self.assertEqual(response.status_code, 200)
+            return response.json()
+        
+        self.assertEqual(kinship(sire_id, dam_id)["kinship"], 0)
+        siblings = kinship(son_id, daughter_id)
+        self.assertEqual(siblings["kinship"], 0.25)
+        self.assertEqual(siblings["common_ancestors"], sorted([sire_id, dam_id]))
+        print(f"✅ Full siblings have kinship 0.25")
+        self.assertEqual(kinship(sire_id, daughter_id)["kinship"], 0.25)
+        self.assertEqual(kinship(son_id, dam_id)["kinship"], 0.25)
+        print(f"✅ Parent x offspring of unrelated founders has kinship 0.25")
+        
+        # The pedigree links cannot be deleted out from under the birds
+        self.assertEqual(requests.delete(f"{BASE_URL}/api/chicks/{son_id}").status_code, 400)
+        self.assertEqual(requests.delete(f"{BASE_URL}/api/clutches/{clutch_id}").status_code, 400)
+        self.assertEqual(requests.delete(f"{BASE_URL}/api/breeding-pairs/{pair_id}").status_code, 400)
+        print(f"✅ Chick, clutch and pair deletion blocked while dependents exist")
+        
+        self.delete_test_data([
+            f"/api/birds/{son_id}", f"/api/birds/{daughter_id}",
+            f"/api/chicks/{offspring[0]}", f"/api/chicks/{offspring[1]}",
+            f"/api/clutches/{clutch_id}", f"/api/breeding-pairs/{pair_id}",
+            f"/api/birds/{sire_id}", f"/api/birds/{dam_id}"
+        ])
+        
+        if not self.male_bird_id or not self.female_bird_id:
+            self.skipTest("Bird IDs not available")
+        
+        response = requests.get(f"{BASE_URL}/api/genetics/kinship", params={"male": self.male_bird_id, "female": self.female_bird_id})
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertEqual(result["kinship"], result["offspring_inbreeding"])
+        self.assertGreaterEqual(result["kinship"], 0)
+        self.assertLessEqual(result["kinship"], 1)
+        self.assertIn("common_ancestors", result)
+        print(f"✅ Kinship of test pair: {result['kinship']}")
+        
+        response = requests.get(f"{BASE_URL}/api/genetics/kinship", params={"male": self.male_bird_id, "female": self.male_bird_id})
+        self.assertEqual(response.status_code, 400)
+        
+        response = requests.get(f"{BASE_URL}/api/genetics/kinship", params={"male": self.male_bird_id, "female": "nonexistent-bird-id"})
+        self.assertEqual(response.status_code, 404)
+        print(f"✅ Kinship rejects bad input")
+
+    def test_32_recommend_pairs(self):
+        """Test pair recommendations for a species"""
+        print("\n--- Testing Pair Recommendations ---")
+        
+        response = requests.get(f"{BASE_URL}/api/genetics/recommend-pairs", params={"species": "African Grey", "limit": 5})
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertIn("candidates", result)
+        self.assertLessEqual(len(result["recommendations"]), 5)
+        scores = [recommendation["score"] for recommendation in result["recommendations"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        for recommendation in result["recommendations"]:
+            self.assertLessEqual(recommendation["kinship"], 0.0625)
+        print(f"✅ {len(scores)} recommendations from {result['candidates']['combinations']} combinations")
+
+    def test_33_search_ranking_and_escaping(self):
+        """Test ring number prefix search and escaping of user input"""
+        print("\n--- Testing Search Ranking and Escaping ---")
+        
+        if not self.male_bird_id:
+            self.skipTest("Male bird ID not available")
+        
+        response = requests.get(f"{BASE_URL}/api/birds/{self.male_bird_id}")
+        self.assertEqual(response.status_code, 200)
+        ring_number = response.json()["ring_number"]
+        
+        response = requests.get(f"{BASE_URL}/api/search", params={"query": ring_number[:4], "search_type": "birds"})
+        self.assertEqual(response.status_code, 200)
+        birds = response.json()["birds"]
+        self.assertTrue(birds)
+        self.assertTrue(birds[0]["ring_number"].upper().startswith(ring_number[:4].upper()))
+        print(f"✅ Ring number prefix '{ring_number[:4]}' ranked first")
+        
+        # Unescaped these would be invalid patterns or match every bird
+        for query in ["(", "[", ".*", "\\"]:
+            response = requests.get(f"{BASE_URL}/api/search", params={"query": query})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["birds"], [])
+        print(f"✅ Regex metacharacters are matched literally")
+
+    def test_34_suggest(self):
+        """Test type-ahead suggestions"""
+        print("\n--- Testing Suggestions ---")
+        
+        response = requests.get(f"{BASE_URL}/api/suggest", params={"field": "species", "prefix": "afr", "limit": 5})
+        self.assertEqual(response.status_code, 200)
+        suggestions = response.json()["suggestions"]
+        self.assertLessEqual(len(suggestions), 5)
+        for suggestion in suggestions:
+            self.assertTrue(suggestion.lower().startswith("afr"))
+        print(f"✅ Species suggestions: {suggestions}")
+        
+        for field in ["ring_number", "pair_name", "customer_name"]:
+            response = requests.get(f"{BASE_URL}/api/suggest", params={"field": field, "prefix": "a"})
+            self.assertEqual(response.status_code, 200)
+        
+        response = requests.get(f"{BASE_URL}/api/suggest", params={"field": "notes", "prefix": "a"})
+        self.assertEqual(response.status_code, 400)
+        print(f"✅ Suggestions cover all supported fields")
+
+    def test_35_monitoring_series(self):
+        """Test downsampled monitoring series"""
+        print("\n--- Testing Monitoring Series ---")
+        
+        for interval in ["day", "week", "month"]:
+            response = requests.get(f"{BASE_URL}/api/daily-monitoring/series", params={"interval": interval})
+            self.assertEqual(response.status_code, 200)
+            result = response.json()
+            self.assertEqual(result["interval"], interval)
+            for series in result["series"]:
+                for point in series["points"]:
+                    self.assertLessEqual(point["temperature"]["min"], point["temperature"]["max"])
+            print(f"✅ {interval} series for {len(result['series'])} incubators")
+        
+        response = requests.get(f"{BASE_URL}/api/daily-monitoring/series", params={"interval": "hour"})
+        self.assertEqual(response.status_code, 400)
+        response = requests.get(f"{BASE_URL}/api/daily-monitoring/series", params={"date_from": "2024/01/01"})
+        self.assertEqual(response.status_code, 400)
+        print(f"✅ Monitoring series rejects bad input")
+
+    def test_36_telemetry_ingestion(self):
+        """Test batched incubator telemetry ingestion"""
+        print("\n--- Testing Telemetry Ingestion ---")
+        
+        response = requests.post(f"{BASE_URL}/api/incubators", json={"name": "Telemetry Test Incubator", "capacity": 10})
+        self.assertEqual(response.status_code, 200)
+        incubator_id = response.json()["incubator_id"]
+        
+        day = datetime.now().strftime("%Y-%m-%d")
+        # Manual morning/evening readings average 37.0°C and 55.0% until telemetry arrives
+        response = requests.post(f"{BASE_URL}/api/daily-monitoring", json={
+            "incubator_id": incubator_id, "date": day, "species_name": "African Grey",
+            "morning_temperature": 36.5, "morning_humidity": 50.0,
+            "evening_temperature": 37.5, "evening_humidity": 60.0
+        })
+        self.assertEqual(response.status_code, 200)
+        monitoring_id = response.json()["monitoring_id"]
+        
+        def daily_averages():
+            entry = requests.get(f"{BASE_URL}/api/daily-monitoring/{monitoring_id}").json()
+            return entry["daily_avg_temperature"], entry["daily_avg_humidity"]
+        
+        self.assertEqual(daily_averages(), (37.0, 55.0))
+        
+        readings = [
+            {"timestamp": f"{day}T10:{minute:02d}:00", "temperature": 37.5, "humidity": 58.0}
+            for minute in range(60)
+        ]
+        response = requests.post(f"{BASE_URL}/api/telemetry", json=[{"incubator_id": incubator_id, "readings": readings}])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["accepted"], 60)
+        
+        response = requests.post(f"{BASE_URL}/api/admin/telemetry/flush")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["buffered"], 0)
+        
+        response = requests.get(f"{BASE_URL}/api/daily-monitoring/series", params={"incubator_id": incubator_id, "date_from": day, "date_to": day})
+        self.assertEqual(response.status_code, 200)
+        points = response.json()["series"][0]["points"]
+        self.assertEqual(points[0]["readings"], 60)
+        self.assertEqual(points[0]["temperature"]["avg"], 37.5)
+        print(f"✅ Ingested and rolled up 60 readings")
+        
+        # The day's rollup replaces the manual averages and accumulates later batches
+        self.assertEqual(daily_averages(), (37.5, 58.0))
+        later = [
+            {"timestamp": f"{day}T11:{minute:02d}:00", "temperature": 38.5, "humidity": 62.0}
+            for minute in range(60)
+        ]
+        response = requests.post(f"{BASE_URL}/api/telemetry", json=[{"incubator_id": incubator_id, "readings": later}])
+        self.assertEqual(response.status_code, 200)
+        requests.post(f"{BASE_URL}/api/admin/telemetry/flush")
+        self.assertEqual(daily_averages(), (38.0, 60.0))
+        print(f"✅ Daily averages follow the telemetry rollup")
+        
+        response = requests.post(f"{BASE_URL}/api/telemetry", json=[{"incubator_id": "nonexistent-incubator-id", "readings": readings}])
+        self.assertEqual(response.status_code, 404)
+        
+        requests.delete(f"{BASE_URL}/api/daily-monitoring/{monitoring_id}")
+        requests.delete(f"{BASE_URL}/api/incubators/{incubator_id}")
+
+    def test_37_financial_periods_and_currencies(self):
+        """Test financial report periods, date filters and currency conversion"""
+        print("\n--- Testing Financial Report Engine ---")
+        
+        response = requests.put(f"{BASE_URL}/api/exchange-rates/USD", json={"rate": 4.5})
+        self.assertEqual(response.status_code, 200)
+        base_revenue = requests.get(f"{BASE_URL}/api/dashboard").json()["stats"]["total_revenue"]
+        
+        response = requests.post(f"{BASE_URL}/api/transactions", json={
+            "transaction_type": "sale",
+            "amount": 100.0,
+            "currency": "USD",
+            "date": "2020-02-15",
+            "description": "Financial engine test sale"
+        })
+        self.assertEqual(response.status_code, 200)
+        transaction_id = response.json()["transaction_id"]
+        
+        response = requests.get(f"{BASE_URL}/api/reports/financial", params={
+            "period": "quarter", "date_from": "2020-02-10", "date_to": "2020-02-20"
+        })
+        self.assertEqual(response.status_code, 200)
+        report = response.json()
+        self.assertEqual(report["by_currency"]["USD"]["total_sales"], 100.0)
+        self.assertEqual(report["summary"]["total_sales"], 450.0)
+        self.assertEqual(report["periods"][0]["period"], "2020-Q1")
+        print(f"✅ USD sale converted to {report['summary']['total_sales']} {report['base_currency']}")
+        
+        # The dashboard converts at the same rates as the report
+        dashboard = requests.get(f"{BASE_URL}/api/dashboard").json()
+        self.assertAlmostEqual(dashboard["stats"]["total_revenue"], base_revenue + 450.0, places=2)
+        self.assertNotIn("USD", dashboard["unconverted_currencies"])
+        print(f"✅ Dashboard revenue counts the USD sale in {dashboard['base_currency']}")
+        
+        # A rollup rebuild retires the cached report and its ETag
+        etag = response.headers["ETag"]
+        response = requests.post(f"{BASE_URL}/api/admin/financial-rollups/rebuild")
+        self.assertEqual(response.status_code, 200)
+        response = requests.get(f"{BASE_URL}/api/reports/financial", params={
+            "period": "quarter", "date_from": "2020-02-10", "date_to": "2020-02-20"
+        }, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["summary"]["total_sales"], 450.0)
+        print(f"✅ Rollup rebuild invalidates the report ETag")
+        
+        response = requests.get(f"{BASE_URL}/api/reports/financial", params={"period": "week"})
+        self.assertEqual(response.status_code, 400)
+        
+        requests.delete(f"{BASE_URL}/api/transactions/{transaction_id}")
+        requests.delete(f"{BASE_URL}/api/exchange-rates/USD")
+        print(f"✅ Financial report engine works")
+
+    def test_38_profitability(self):
+        """Test the per-bird and per-pair profitability ranking"""
+        print("\n--- Testing Profitability Ledger ---")
+        
+        for entity_type in ["pair", "bird"]:
+            response = requests.get(f"{BASE_URL}/api/reports/profitability", params={"entity_type": entity_type, "limit": 10})
+            self.assertEqual(response.status_code, 200)
+            entries = response.json()["entries"]
+            self.assertLessEqual(len(entries), 10)
+            nets = [entry["net"] for entry in entries]
+            self.assertEqual(nets, sorted(nets, reverse=True))
+            print(f"✅ Ranked {len(entries)} {entity_type} ledgers by net profit")
+        
+        # A ledger rebuild retires the cached ranking and its ETag
+        etag = response.headers["ETag"]
+        response = requests.post(f"{BASE_URL}/api/admin/profitability/rebuild")
+        self.assertEqual(response.status_code, 200)
+        response = requests.get(f"{BASE_URL}/api/reports/profitability", params={"entity_type": "bird", "limit": 10},
+                                headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        print(f"✅ Ledger rebuild invalidates the ranking ETag")
+        
+        response = requests.get(f"{BASE_URL}/api/reports/profitability", params={"entity_type": "clutch"})
+        self.assertEqual(response.status_code, 400)
+        response = requests.get(f"{BASE_URL}/api/reports/profitability", params={"sort": "color"})
+        self.assertEqual(response.status_code, 400)
+        print(f"✅ Profitability ranking rejects bad input")
+
+    def ledger_entry(self, entity_type, entity_id):
+        response = requests.get(f"{BASE_URL}/api/reports/profitability", params={"entity_type": entity_type, "limit": 1000})
+        self.assertEqual(response.status_code, 200)
+        return next((entry for entry in response.json()["entries"] if entry["entity_id"] == entity_id), None)
+
+    def test_42_profitability_rate_change_then_delete(self):
+        """Test that deleting a transaction reverses the amount booked at the rate of the time"""
+        print("\n--- Testing Profitability After Rate Change ---")
+        
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        bird_id = requests.post(f"{BASE_URL}/api/birds", json={
+            "species": "African Grey", "gender": "male", "ring_number": f"PL{timestamp}"
+        }).json()["bird_id"]
+        requests.put(f"{BASE_URL}/api/exchange-rates/XTS", json={"rate": 4})
+        
+        response = requests.post(f"{BASE_URL}/api/transactions", json={
+            "transaction_type": "sale", "amount": 100.0, "currency": "XTS",
+            "date": "2020-03-01", "description": "Ledger rate test sale", "bird_id": bird_id
+        })
+        self.assertEqual(response.status_code, 200)
+        transaction_id = response.json()["transaction_id"]
+        self.assertEqual(self.ledger_entry("bird", bird_id)["net"], 400.0)
+        
+        requests.put(f"{BASE_URL}/api/exchange-rates/XTS", json={"rate": 4.5})
+        requests.delete(f"{BASE_URL}/api/transactions/{transaction_id}")
+        entry = self.ledger_entry("bird", bird_id)
+        self.assertEqual(entry["net"], 0)
+        self.assertEqual(entry["transaction_count"], 0)
+        print(f"✅ Sale booked at rate 4 reversed exactly after the rate moved to 4.5")
+        
+        self.delete_test_data(["/api/exchange-rates/XTS", f"/api/birds/{bird_id}"])
+
+    def test_43_profitability_relink(self):
+        """Test moving a transaction from one bird to another and to a chick's parent pair"""
+        print("\n--- Testing Profitability Re-linking ---")
+        
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        male_id = requests.post(f"{BASE_URL}/api/birds", json={
+            "species": "African Grey", "gender": "male", "ring_number": f"RM{timestamp}"
+        }).json()["bird_id"]
+        female_id = requests.post(f"{BASE_URL}/api/birds", json={
+            "species": "African Grey", "gender": "female", "ring_number": f"RF{timestamp}"
+        }).json()["bird_id"]
+        pair_id = requests.post(f"{BASE_URL}/api/breeding-pairs", json={
+            "male_bird_id": male_id, "female_bird_id": female_id,
+            "pair_name": f"Relink Pair {timestamp}", "pair_date": "2020-01-01"
+        }).json()["pair_id"]
+        clutch_id = requests.post(f"{BASE_URL}/api/clutches", json={
+            "breeding_pair_id": pair_id, "clutch_number": 1, "egg_laying_date": "2020-02-01",
+            "eggs_laid": 2, "expected_hatch_date": "2020-03-01"
+        }).json()["clutch_id"]
+        chick_id = requests.post(f"{BASE_URL}/api/chicks", json={
+            "clutch_id": clutch_id, "chick_number": 1, "hatch_date": "2020-03-01"
+        }).json()["chick_id"]
+        
+        transaction = {
+            "transaction_type": "expense", "amount": 80.0, "date": "2020-03-05",
+            "description": "Ledger relink test expense", "bird_id": male_id
+        }
+        transaction_id = requests.post(f"{BASE_URL}/api/transactions", json=transaction).json()["transaction_id"]
+        self.assertEqual(self.ledger_entry("bird", male_id)["expenses"], 80.0)
+        
+        requests.put(f"{BASE_URL}/api/transactions/{transaction_id}", json={**transaction, "bird_id": female_id})
+        self.assertEqual(self.ledger_entry("bird", male_id)["expenses"], 0)
+        self.assertEqual(self.ledger_entry("bird", female_id)["expenses"], 80.0)
+        print(f"✅ Expense moved from one bird's ledger to the other's")
+        
+        requests.put(f"{BASE_URL}/api/transactions/{transaction_id}", json={**transaction, "bird_id": None, "chick_id": chick_id})
+        self.assertEqual(self.ledger_entry("bird", female_id)["expenses"], 0)
+        self.assertEqual(self.ledger_entry("pair", pair_id)["expenses"], 80.0)
+        print(f"✅ Expense moved to the parent pair of the chick")
+        
+        requests.delete(f"{BASE_URL}/api/transactions/{transaction_id}")
+        self.assertEqual(self.ledger_entry("pair", pair_id)["expenses"], 0)
+        self.delete_test_data([
+            f"/api/chicks/{chick_id}", f"/api/clutches/{clutch_id}", f"/api/breeding-pairs/{pair_id}",
+            f"/api/birds/{male_id}", f"/api/birds/{female_id}"
+        ])
+
+    def test_39_conditional_get_and_compression(self):
+        """Test ETag revalidation and gzip compression of list responses"""
+        print("\n--- Testing Conditional GET and Compression ---")
+        
+        response = requests.get(f"{BASE_URL}/api/incubators", headers={"Accept-Encoding": "identity"})
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers.get("ETag")
+        self.assertIsNotNone(etag)
+        self.assertEqual(response.headers.get("Cache-Control"), "no-cache")
+        self.assertIn("Accept-Encoding", response.headers.get("Vary", ""))
+        
+        response = requests.get(f"{BASE_URL}/api/incubators", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertIn("Accept-Encoding", response.headers.get("Vary", ""))
+        print(f"✅ Unchanged incubator list revalidated with 304")
+        
+        created = requests.post(f"{BASE_URL}/api/incubators", json={"name": "ETag Test Incubator", "capacity": 24})
+        self.assertEqual(created.status_code, 200)
+        response = requests.get(f"{BASE_URL}/api/incubators", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers.get("ETag"), etag)
+        print(f"✅ Write to incubators changed the ETag")
+        
+        response = requests.get(f"{BASE_URL}/api/birds", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        if len(response.content) >= 1024:
+            self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+            self.assertIn("Accept-Encoding", response.headers.get("Vary", ""))
+            self.assertTrue(response.headers.get("ETag", "").endswith('-gzip"'))
+            revalidated = requests.get(f"{BASE_URL}/api/birds", headers={"If-None-Match": response.headers["ETag"]})
+            self.assertEqual(revalidated.status_code, 304)
+            print(f"✅ Bird list served gzip-compressed and revalidated by its gzip ETag")
+        
+        requests.delete(f"{BASE_URL}/api/incubators/{created.json()['incubator_id']}")
+
+    def test_40_slim_payloads(self):
+        """Test slim chick and artificial incubation lists against their embedded form"""
+        print("\n--- Testing Slim Payloads ---")
+        
+        full = requests.get(f"{BASE_URL}/api/chicks").json()["chicks"]
+        response = requests.get(f"{BASE_URL}/api/chicks", params={"slim": 1})
+        self.assertEqual(response.status_code, 200)
+        slim = response.json()
+        includes = slim["includes"]
+        self.assertEqual(len(slim["chicks"]), len(full))
+        for chick, embedded in zip(slim["chicks"], full):
+            self.assertNotIn("clutch", chick)
+            clutch = embedded.get("clutch")
+            if clutch:
+                self.assertIn(chick["clutch_id"], includes["clutches"])
+                pair = clutch.get("breeding_pair")
+                if pair and pair.get("male_bird"):
+                    self.assertEqual(includes["birds"][pair["male_bird_id"]], pair["male_bird"])
+        print(f"✅ Slim chick list references {len(includes['birds'])} distinct birds by id")
+        
+        response = requests.get(f"{BASE_URL}/api/artificial-incubation", params={"slim": 1})
+        self.assertEqual(response.status_code, 200)
+        slim = response.json()
+        for incubation in slim["artificial_incubations"]:
+            self.assertNotIn("incubator", incubation)
+            self.assertIn(incubation["incubator_id"], slim["includes"]["incubators"])
+        print(f"✅ Slim artificial incubation list carries an includes map")
+
+    def test_41_bootstrap(self):
+        """Test the single-request startup payload against the list endpoints"""
+        print("\n--- Testing Bootstrap ---")
+        
+        response = requests.get(f"{BASE_URL}/api/bootstrap")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        entities = data["entities"]
+        
+        birds = requests.get(f"{BASE_URL}/api/birds").json()["birds"]
+        self.assertEqual(set(entities["birds"]), {bird["id"] for bird in birds})
+        pairs = requests.get(f"{BASE_URL}/api/breeding-pairs").json()["breeding_pairs"]
+        self.assertEqual(set(entities["breeding_pairs"]), {pair["id"] for pair in pairs})
+        for pair in entities["breeding_pairs"].values():
+            self.assertNotIn("male_bird", pair)
+        chicks = requests.get(f"{BASE_URL}/api/chicks").json()["chicks"]
+        self.assertEqual([chick["id"] for chick in data["chicks"]], [chick["id"] for chick in chicks])
+        for chick in data["chicks"]:
+            self.assertNotIn("clutch", chick)
+        for section in ["transactions", "species", "monitoring_entries", "permits", "license", "dashboard", "notifications"]:
+            self.assertIn(section, data)
+        print(f"✅ Bootstrap returned {len(entities['birds'])} birds and {len(entities['breeding_pairs'])} pairs once each")
+        
+        revalidated = requests.get(f"{BASE_URL}/api/bootstrap", headers={"If-None-Match": response.headers["ETag"]})
+        self.assertEqual(revalidated.status_code, 304)
+        print(f"✅ Unchanged bootstrap payload revalidated with 304")
+
+    def test_44_batched_enrichment(self):
+        """Test list endpoints embed the right related documents"""
+        print("\n--- Testing Batched Relationship Loading ---")
+        
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        pairs = [self.create_test_pair(f"ENRICH{i}-{timestamp}") for i in range(2)]
+        clutch_ids = [
+            requests.post(f"{BASE_URL}/api/clutches", json=dict(
+                self.test_clutch, breeding_pair_id=pair_id,
+                expected_hatch_date=(datetime.now() + timedelta(days=28)).strftime("%Y-%m-%d")
+            )).json()["clutch_id"]
+            for _, _, pair_id in pairs
+        ]
+        
+        listed_pairs = {pair["id"]: pair for pair in requests.get(f"{BASE_URL}/api/breeding-pairs").json()["breeding_pairs"]}
+        listed_clutches = {clutch["id"]: clutch for clutch in requests.get(f"{BASE_URL}/api/clutches").json()["clutches"]}
+        for (male_id, female_id, pair_id), clutch_id in zip(pairs, clutch_ids):
+            self.assertEqual(listed_pairs[pair_id]["male_bird"]["id"], male_id)
+            self.assertEqual(listed_pairs[pair_id]["female_bird"]["id"], female_id)
+            clutch_pair = listed_clutches[clutch_id]["breeding_pair"]
+            self.assertEqual(clutch_pair["id"], pair_id)
+            self.assertEqual(clutch_pair["male_bird"]["id"], male_id)
+            self.assertEqual(clutch_pair["female_bird"]["id"], female_id)
+        print(f"✅ Pairs and clutches embed their own birds and pairs")
+        
+        self.delete_test_data(
+            [f"/api/clutches/{clutch_id}" for clutch_id in clutch_ids]
+            + [f"/api/breeding-pairs/{pair_id}" for _, _, pair_id in pairs]
+            + [f"/api/birds/{bird_id}" for male_id, female_id, _ in pairs for bird_id in (male_id, female_id)]
+        )
+    def test_45_dashboard_counters(self):
+        """Test materialized dashboard counters follow creates, updates and deletes"""
+        print("\n--- Testing Dashboard Counters ---")
+        
+        def stats():
+            response = requests.get(f"{BASE_URL}/api/dashboard")
+            self.assertEqual(response.status_code, 200)
+            return response.json()["stats"]
+        
+        base = stats()
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        bird = dict(self.test_male_bird, ring_number=f"DASH{timestamp}")
+        bird_id = requests.post(f"{BASE_URL}/api/birds", json=bird).json()["bird_id"]
+        transaction_id = requests.post(f"{BASE_URL}/api/transactions", json=dict(
+            self.test_transaction_expense, amount=12.34, description=f"Dashboard counter {timestamp}"
+        )).json()["transaction_id"]
+        after_create = stats()
+        self.assertEqual(after_create["total_birds"], base["total_birds"] + 1)
+        self.assertAlmostEqual(after_create["total_expenses"], base["total_expenses"] + 12.34, places=2)
+        print(f"✅ Counters include created bird and expense")
+        
+        # Leaving the counted status removes the bird, returning to it counts it again
+        requests.put(f"{BASE_URL}/api/birds/{bird_id}", json=dict(bird, status="sold"))
+        self.assertEqual(stats()["total_birds"], base["total_birds"])
+        requests.put(f"{BASE_URL}/api/birds/{bird_id}", json=dict(bird, status="active"))
+        self.assertEqual(stats()["total_birds"], base["total_birds"] + 1)
+        print(f"✅ Counters follow status updates")
+        
+        # The incremental counters agree with a full recount, which retires the cached dashboard
+        etag = requests.get(f"{BASE_URL}/api/dashboard").headers["ETag"]
+        rebuilt = requests.post(f"{BASE_URL}/api/admin/dashboard-stats/rebuild").json()["stats"]
+        response = requests.get(f"{BASE_URL}/api/dashboard", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(rebuilt["total_birds"], after_create["total_birds"])
+        self.assertAlmostEqual(rebuilt["total_expenses"], after_create["total_expenses"], places=2)
+        
+        self.delete_test_data([f"/api/birds/{bird_id}", f"/api/transactions/{transaction_id}"])
+        after_delete = stats()
+        self.assertEqual(after_delete["total_birds"], base["total_birds"])
+        self.assertAlmostEqual(after_delete["total_expenses"], base["total_expenses"], places=2)
+        print(f"✅ Counters drop deleted bird and expense")
+    def test_46_reference_cache_after_edit(self):
+        """Test cached pairs and incubators are served updated right after an edit"""
+        print("\n--- Testing Reference Cache Invalidation ---")
+        
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        incubator = dict(self.test_incubator, name=f"Cache Incubator {timestamp}")
+        incubator_id = requests.post(f"{BASE_URL}/api/incubators", json=incubator).json()["incubator_id"]
+        # Read twice so the second read can come from the cache
+        for _ in range(2):
+            self.assertEqual(requests.get(f"{BASE_URL}/api/incubators/{incubator_id}").json()["name"], incubator["name"])
+        requests.put(f"{BASE_URL}/api/incubators/{incubator_id}", json=dict(incubator, name=f"Renamed Incubator {timestamp}"))
+        self.assertEqual(requests.get(f"{BASE_URL}/api/incubators/{incubator_id}").json()["name"], f"Renamed Incubator {timestamp}")
+        print(f"✅ Incubator edit visible on the next read")
+        
+        male_id, female_id, pair_id = self.create_test_pair(f"CACHE-{timestamp}")
+        clutch_id = requests.post(f"{BASE_URL}/api/clutches", json=dict(
+            self.test_clutch, breeding_pair_id=pair_id,
+            expected_hatch_date=(datetime.now() + timedelta(days=28)).strftime("%Y-%m-%d")
+        )).json()["clutch_id"]
+        for _ in range(2):
+            requests.get(f"{BASE_URL}/api/breeding-pairs/{pair_id}")
+            requests.get(f"{BASE_URL}/api/clutches/{clutch_id}")
+        requests.put(f"{BASE_URL}/api/breeding-pairs/{pair_id}", json={
+            "male_bird_id": male_id, "female_bird_id": female_id,
+            "pair_name": f"Renamed Pair {timestamp}", "pair_date": datetime.now().strftime("%Y-%m-%d")
+        })
+        self.assertEqual(requests.get(f"{BASE_URL}/api/breeding-pairs/{pair_id}").json()["pair_name"], f"Renamed Pair {timestamp}")
+        # The clutch embeds the pair through the same cache
+        self.assertEqual(
+            requests.get(f"{BASE_URL}/api/clutches/{clutch_id}").json()["breeding_pair"]["pair_name"], f"Renamed Pair {timestamp}"
+        )
+        print(f"✅ Pair edit visible on the pair and on its clutch")
+        
+        metrics = requests.get(f"{BASE_URL}/api/admin/cache").json()
+        self.assertIn("incubators", metrics["collections"])
+        self.assertIn("breeding_pairs", metrics["collections"])
+        
+        self.delete_test_data([
+            f"/api/clutches/{clutch_id}", f"/api/breeding-pairs/{pair_id}",
+            f"/api/birds/{male_id}", f"/api/birds/{female_id}", f"/api/incubators/{incubator_id}"
+        ])
+    def test_47_cached_payloads_invalidated(self):
+        """Test cached dashboard, report and notification payloads change right after a write"""
+        print("\n--- Testing Shared Cache Invalidation ---")
+        
+        def get(path):
+            # Twice, so the second response can come from the cache
+            requests.get(f"{BASE_URL}{path}")
+            response = requests.get(f"{BASE_URL}{path}")
+            self.assertEqual(response.status_code, 200)
+            return response.json()
+        
+        dashboard = get("/api/dashboard")["stats"]
+        report = get("/api/reports/breeding")["summary"]
+        financial = get("/api/reports/financial")["summary"]
+        get("/api/notifications")
+        
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        male_id, female_id, pair_id = self.create_test_pair(f"PAYLOAD-{timestamp}")
+        clutch_id = requests.post(f"{BASE_URL}/api/clutches", json=dict(
+            self.test_clutch, breeding_pair_id=pair_id, eggs_laid=5,
+            expected_hatch_date=(datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+        )).json()["clutch_id"]
+        transaction_id = requests.post(f"{BASE_URL}/api/transactions", json=dict(
+            self.test_transaction_expense, amount=7.5, description=f"Payload cache {timestamp}"
+        )).json()["transaction_id"]
+        
+        self.assertEqual(get("/api/dashboard")["stats"]["active_clutches"], dashboard["active_clutches"] + 1)
+        self.assertEqual(get("/api/reports/breeding")["summary"]["total_eggs"], report["total_eggs"] + 5)
+        self.assertAlmostEqual(get("/api/reports/financial")["summary"]["total_expenses"], financial["total_expenses"] + 7.5, places=2)
+        notifications = get("/api/notifications")["notifications"]
+        self.assertIn(clutch_id, [n["data"].get("clutch_id") for n in notifications])
+        print(f"✅ Dashboard, reports and notifications include the new clutch and expense")
+        
+        self.delete_test_data([
+            f"/api/transactions/{transaction_id}", f"/api/clutches/{clutch_id}",
+            f"/api/breeding-pairs/{pair_id}", f"/api/birds/{male_id}", f"/api/birds/{female_id}"
+        ])
+        self.assertEqual(get("/api/dashboard")["stats"]["active_clutches"], dashboard["active_clutches"])
+        self.assertEqual(get("/api/reports/breeding")["summary"]["total_eggs"], report["total_eggs"])
+        self.assertAlmostEqual(get("/api/reports/financial")["summary"]["total_expenses"], financial["total_expenses"], places=2)
+        notifications = get("/api/notifications")["notifications"]
+        self.assertNotIn(clutch_id, [n["data"].get("clutch_id") for n in notifications])
+        print(f"✅ Cached payloads drop them again after the deletes")
+
 if __name__ == "__main__":
     # Run tests in order
     suite = unittest.TestSuite()
@@ -1228,6 +2095,31 @@ if __name__ == "__main__":
     suite.addTest(ParrotBreedingAPITest("test_19_financial_report_enhanced"))
     suite.addTest(ParrotBreedingAPITest("test_20_species_deletion_protection"))
     suite.addTest(ParrotBreedingAPITest("test_22_incubator_delete_endpoint"))
+    suite.addTest(ParrotBreedingAPITest("test_23_admin_index_status"))
+    suite.addTest(ParrotBreedingAPITest("test_24_list_pagination"))
+    suite.addTest(ParrotBreedingAPITest("test_25_streaming_export"))
+    suite.addTest(ParrotBreedingAPITest("test_26_bulk_import"))
+    suite.addTest(ParrotBreedingAPITest("test_27_permit_number_allocation"))
+    suite.addTest(ParrotBreedingAPITest("test_28_notifications_since"))
+    suite.addTest(ParrotBreedingAPITest("test_29_notification_stream"))
+    suite.addTest(ParrotBreedingAPITest("test_30_genealogy_tree"))
+    suite.addTest(ParrotBreedingAPITest("test_31_kinship"))
+    suite.addTest(ParrotBreedingAPITest("test_32_recommend_pairs"))
+    suite.addTest(ParrotBreedingAPITest("test_33_search_ranking_and_escaping"))
+    suite.addTest(ParrotBreedingAPITest("test_34_suggest"))
+    suite.addTest(ParrotBreedingAPITest("test_35_monitoring_series"))
+    suite.addTest(ParrotBreedingAPITest("test_36_telemetry_ingestion"))
+    suite.addTest(ParrotBreedingAPITest("test_37_financial_periods_and_currencies"))
+    suite.addTest(ParrotBreedingAPITest("test_38_profitability"))
+    suite.addTest(ParrotBreedingAPITest("test_39_conditional_get_and_compression"))
+    suite.addTest(ParrotBreedingAPITest("test_40_slim_payloads"))
+    suite.addTest(ParrotBreedingAPITest("test_41_bootstrap"))
+    suite.addTest(ParrotBreedingAPITest("test_42_profitability_rate_change_then_delete"))
+    suite.addTest(ParrotBreedingAPITest("test_43_profitability_relink"))
+    suite.addTest(ParrotBreedingAPITest("test_44_batched_enrichment"))
+    suite.addTest(ParrotBreedingAPITest("test_45_dashboard_counters"))
+    suite.addTest(ParrotBreedingAPITest("test_46_reference_cache_after_edit"))
+    suite.addTest(ParrotBreedingAPITest("test_47_cached_payloads_invalidated"))
     suite.addTest(ParrotBreedingAPITest("test_21_cleanup"))
     
     runner = unittest.TextTestRunner(verbosity=2)
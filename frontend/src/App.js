@@ -429,8 +429,7 @@ function App() {
     }
   };
 
-  // Load data on component mount
-  useEffect(() => {
+  const fetchAll = () => {
     fetchBirds();
     fetchBreedingPairs();
     fetchClutches();
@@ -444,6 +443,56 @@ function App() {
     fetchDashboard();
     fetchMainLicense();
     fetchNotifications();
+  };
+
+  // Initial load in one request; entities come keyed by id and are embedded here
+  // the way the individual list endpoints embed them
+  const fetchBootstrap = async () => {
+    try {
+      const response = await fetch(`${BACKEND_URL}/api/bootstrap`);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      const data = await response.json();
+      const { birds: birdsById, breeding_pairs, clutches: clutchesById, incubators: incubatorsById } = data.entities;
+
+      const pairsById = {};
+      Object.values(breeding_pairs).forEach(pair => {
+        pairsById[pair.id] = {
+          ...pair,
+          male_bird: birdsById[pair.male_bird_id] || null,
+          female_bird: birdsById[pair.female_bird_id] || null
+        };
+      });
+      const enrichedClutches = {};
+      Object.values(clutchesById).forEach(clutch => {
+        enrichedClutches[clutch.id] = { ...clutch, breeding_pair: pairsById[clutch.breeding_pair_id] || null };
+      });
+
+      setBirds(Object.values(birdsById));
+      setBreedingPairs(Object.values(pairsById));
+      setClutches(Object.values(enrichedClutches));
+      setChicks(data.chicks.map(chick => ({ ...chick, clutch: enrichedClutches[chick.clutch_id] || null })));
+      setIncubators(Object.values(incubatorsById));
+      setArtificialIncubations(data.artificial_incubations.map(incubation => ({
+        ...incubation,
+        clutch: enrichedClutches[incubation.clutch_id] || null,
+        incubator: incubatorsById[incubation.incubator_id] || null
+      })));
+      setTransactions(data.transactions);
+      setSpecies(data.species);
+      setMonitoringData(data.monitoring_entries);
+      setPermits(data.permits);
+      setMainLicense(data.license);
+      setDashboardData(data.dashboard);
+      setNotifications(data.notifications);
+    } catch (error) {
+      console.error('Error fetching bootstrap data, loading lists individually:', error);
+      fetchAll();
+    }
+  };
+
+  // Load data on component mount
+  useEffect(() => {
+    fetchBootstrap();
   }, []);
 
   // PWA Installation handling